@@ -1,5 +1,10 @@
-from findrum.engine.platform import Platform
-
 __all__ = [
     "Platform",
 ]
+
+def __getattr__(name):
+    # Platform pulls in the whole engine, so it is only imported when used.
+    if name == "Platform":
+        from findrum.engine.platform import Platform
+        return Platform
+    raise AttributeError(f"module 'findrum' has no attribute '{name}'")
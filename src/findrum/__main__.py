@@ -1,5 +1,5 @@
-from findrum.engine.platform import Platform
 import argparse
+import glob
 import sys
 import os
 import logging
@@ -11,11 +11,33 @@ if user_root not in sys.path:
 
 def main():
     parser = argparse.ArgumentParser(description="Run Findrum pipelines")
-    parser.add_argument("pipeline", help="Path to the pipeline YAML file")
+    parser.add_argument("pipeline", nargs="?",
+                        help="Path to the pipeline YAML file, or a directory or glob pattern of pipeline files")
     parser.add_argument("--config", default="config.yaml", help="Path to extension config YAML")
     parser.add_argument("--verbose", action="store_true", help="Show info-level logs")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Report the import cost of starting the pipeline instead of running it")
+    parser.add_argument("--broker", help="SQLite queue file shared with workers; pipeline runs are "
+                                         "published to it instead of running in this process")
+    parser.add_argument("--worker", action="store_true", help="Execute the pipeline runs queued in --broker")
+    parser.add_argument("--keep-results", action="store_true",
+                        help="Store the step results of the runs published to --broker, for broker.result(job_id)")
+    parser.add_argument("--watch", action="store_true",
+                        help="Reload the pipeline and extension modules when their files change")
+    parser.add_argument("--resume", metavar="RUN_ID",
+                        help="Resume a failed run of a checkpointed pipeline, re-running only the steps it did not complete")
 
     args = parser.parse_args()
+    if args.worker and not args.broker:
+        parser.error("--worker requires --broker")
+    if not args.worker and not args.pipeline:
+        parser.error("the following arguments are required: pipeline")
+
+    if args.profile_startup:
+        from findrum.startup import format_profile, profile_startup
+
+        print(format_profile(profile_startup(args.pipeline, args.config)))
+        return
 
     if args.verbose:
         logger.setLevel(logging.INFO)
@@ -25,8 +47,30 @@ def main():
         logger.propagate = False
         logger.info("Verbose logging enabled.")
 
-    platform = Platform(args.config)
-    platform.register_pipeline(args.pipeline)
+    if args.worker:
+        from findrum.engine.distributed import Worker, create_broker
+
+        Worker(create_broker(args.broker), args.config).run()
+        return
+
+    from findrum.engine.platform import Platform
+
+    if args.broker:
+        broker = {"path": args.broker, "keep_results": True} if args.keep_results else args.broker
+        platform = Platform(args.config, broker=broker)
+    else:
+        platform = Platform(args.config)
+    if args.resume:
+        platform.register_pipeline(args.pipeline, resume=args.resume)
+    elif os.path.isdir(args.pipeline) or glob.has_magic(args.pipeline):
+        platform.register_directory(args.pipeline)
+    else:
+        platform.register_pipeline(args.pipeline)
+
+    if args.watch:
+        platform.watch()
 
-    if platform.scheduler.get_jobs():
-        platform.start()
\ No newline at end of file
+    if args.watch or platform.has_jobs():
+        platform.start()
+    else:
+        platform.shutdown()
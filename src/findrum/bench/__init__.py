@@ -0,0 +1,6 @@
+from findrum.bench.suite import BENCHMARKS, run_benchmarks
+
+__all__ = [
+    "BENCHMARKS",
+    "run_benchmarks",
+]
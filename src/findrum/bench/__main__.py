@@ -0,0 +1,38 @@
+import argparse
+import json
+import sys
+
+from findrum.bench.suite import BENCHMARKS, compare, run_benchmarks
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Findrum engine hot paths")
+    parser.add_argument("--output", default="findrum-bench.json", help="Path of the JSON results file")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="Benchmarks to run")
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per case")
+    parser.add_argument("--quick", action="store_true", help="Use smaller inputs")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON results file to compare against")
+
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    report = run_benchmarks(args.only, repeat=args.repeat, quick=args.quick)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    for result in report["results"]:
+        print(f"{result['benchmark']:<20} {result['case']:<32} median {result['stats']['median'] * 1000:10.3f} ms")
+
+    if baseline is not None:
+        print(f"\nCompared to {args.compare}:")
+        for benchmark, case, before, after, ratio in compare(report, baseline):
+            change = f"{(ratio - 1) * 100:+.1f}%" if ratio is not None else "n/a"
+            print(f"{benchmark:<20} {case:<32} {before * 1000:10.3f} ms → {after * 1000:10.3f} ms  {change}")
+
+    print(f"\nResults written to {args.output}")
+
+if __name__ == "__main__":
+    sys.exit(main())
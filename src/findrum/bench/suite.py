@@ -0,0 +1,230 @@
+import os
+import sys
+import time
+import yaml
+import platform
+import tempfile
+import statistics
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from findrum.bench.synthetic import SYNTHETIC_EXTENSIONS, chain_pipeline, register_synthetic
+from findrum.engine.pipeline_runner import PipelineRunner
+from findrum.engine.plan import clear_plan_cache
+from findrum.loader.load_extensions import load_extensions
+from findrum.loader.yaml_loader import CACHE_ENV
+from findrum.registry import registry
+
+def measure(func, repeat: int = 5, number: int = 1, warmup: int = 1) -> dict:
+    """Time a callable.
+
+    Args:
+        func (Callable): The code to time.
+        repeat (int): Number of samples.
+        number (int): Calls per sample. Each sample is the mean time per call.
+        warmup (int): Untimed calls made first.
+
+    Returns:
+        dict: min, max, mean, median and stdev of the samples in seconds.
+    """
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - started) / number)
+
+    return {
+        "min": min(samples),
+        "max": max(samples),
+        "mean": statistics.fmean(samples),
+        "median": statistics.median(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "repeat": repeat,
+        "number": number,
+    }
+
+@contextmanager
+def _config_cache(directory: str = "off"):
+    """Point the config parsing cache to a directory, or disable it, while timing.
+
+    Args:
+        directory (str): Cache directory, or "off" so configs are parsed every time.
+    """
+    previous = os.environ.get(CACHE_ENV)
+    os.environ[CACHE_ENV] = directory
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(CACHE_ENV, None)
+        else:
+            os.environ[CACHE_ENV] = previous
+
+def _result(benchmark: str, case: str, params: dict, stats: dict, **derived) -> dict:
+    return {"benchmark": benchmark, "case": case, "params": params, "unit": "seconds", "stats": stats, "derived": derived}
+
+def bench_step_overhead(repeat: int, quick: bool) -> list:
+    """Run chains of passthrough steps to measure the engine overhead per step."""
+    results = []
+    for steps in (10, 100) if quick else (10, 100, 1000):
+        for mode in ("sequential", "dag"):
+            runner = PipelineRunner(chain_pipeline(steps), mode=mode)
+            stats = measure(runner.run, repeat)
+            results.append(_result(
+                "step_overhead", f"{mode}-{steps}", {"steps": steps, "mode": mode}, stats,
+                per_step=stats["median"] / steps,
+            ))
+    return results
+
+def bench_event_throughput(repeat: int, quick: bool) -> list:
+    """Push events through `run_with_data` of a short event pipeline."""
+    events = 100 if quick else 1000
+    runner = PipelineRunner(chain_pipeline(5, event=True))
+    stats = measure(lambda: runner.run_with_data(1), repeat, number=events)
+    return [_result(
+        "event_throughput", "run_with_data-5", {"steps": 5, "events": events}, stats,
+        events_per_second=1 / stats["median"],
+    )]
+
+def bench_from_yaml(repeat: int, quick: bool) -> list:
+    """Load a pipeline file with `from_yaml`, with and without the plan cache.
+
+    The cold case parses the YAML every time; the config-cached case
+    clears the plan cache but hits the config parsing cache.
+    """
+    steps = 100
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "pipeline.yaml")
+        with open(path, "w") as f:
+            yaml.safe_dump(chain_pipeline(steps), f)
+
+        def cold():
+            clear_plan_cache()
+            PipelineRunner.from_yaml(path)
+
+        with _config_cache():
+            results = [_result("from_yaml", f"cold-{steps}", {"steps": steps}, measure(cold, repeat))]
+        with _config_cache(os.path.join(directory, "config-cache")):
+            results.append(_result("from_yaml", f"config-cached-{steps}", {"steps": steps}, measure(cold, repeat)))
+        results.append(
+            _result("from_yaml", f"cached-{steps}", {"steps": steps}, measure(lambda: PipelineRunner.from_yaml(path), repeat))
+        )
+        clear_plan_cache()
+    return results
+
+def bench_load_extensions(repeat: int, quick: bool) -> list:
+    """Load an extensions config listing the synthetic classes, parsing it every time."""
+    config = {
+        category: [f"{cls.__module__}.{cls.__name__}" for cls in classes]
+        for category, classes in SYNTHETIC_EXTENSIONS.items()
+    }
+    count = sum(len(classes) for classes in config.values())
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.yaml")
+        with open(path, "w") as f:
+            yaml.safe_dump(config, f)
+        with _config_cache():
+            stats = measure(lambda: load_extensions(path), repeat)
+    return [_result("load_extensions", f"classes-{count}", {"classes": count}, stats)]
+
+def bench_dataframe_handoff(repeat: int, quick: bool) -> list:
+    """Pass a DataFrame along a chain of steps on each executor."""
+    rows, columns, steps = (10_000 if quick else 1_000_000), 10, 4
+    datasource = {"datasource": "BenchFrameSource", "params": {"rows": rows, "columns": columns}}
+    definition = chain_pipeline(steps, datasource=datasource)
+    size = rows * columns * 8
+
+    results = []
+    for mode, executor in (("sequential", "thread"), ("dag", "thread"), ("dag", "process")):
+        runner = PipelineRunner(definition, mode=mode, executor=executor)
+        stats = measure(runner.run, repeat)
+        results.append(_result(
+            "dataframe_handoff", f"{mode}-{executor}-{rows}",
+            {"rows": rows, "columns": columns, "steps": steps, "mode": mode, "executor": executor}, stats,
+            bytes=size, bytes_per_second=size * steps / stats["median"],
+        ))
+    return results
+
+BENCHMARKS = {
+    "step_overhead": bench_step_overhead,
+    "event_throughput": bench_event_throughput,
+    "from_yaml": bench_from_yaml,
+    "load_extensions": bench_load_extensions,
+    "dataframe_handoff": bench_dataframe_handoff,
+}
+
+def _environment() -> dict:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        findrum_version = version("findrum-platform")
+    except PackageNotFoundError:
+        findrum_version = None
+    return {
+        "findrum": findrum_version,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+def run_benchmarks(names: list = None, repeat: int = 5, quick: bool = False) -> dict:
+    """Run benchmarks with the synthetic extensions registered.
+
+    The registries are restored afterwards.
+
+    Args:
+        names (list, optional): Benchmarks to run. Defaults to all of them.
+        repeat (int): Samples per case.
+        quick (bool): Use smaller inputs, e.g. for CI.
+
+    Returns:
+        dict: The environment and the list of results.
+
+    Raises:
+        ValueError: If a benchmark name is unknown.
+    """
+    names = list(names or BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            raise ValueError(f"Unknown benchmark '{name}'. Expected one of {tuple(BENCHMARKS)}.")
+
+    registries = (
+        registry.OPERATOR_REGISTRY, registry.DATASOURCE_REGISTRY,
+        registry.EVENT_TRIGGER_REGISTRY, registry.SCHEDULER_REGISTRY,
+    )
+    snapshot = [dict(r) for r in registries]
+    register_synthetic()
+    try:
+        results = [result for name in names for result in BENCHMARKS[name](repeat, quick)]
+    finally:
+        for r, saved in zip(registries, snapshot):
+            r.clear()
+            r.update(saved)
+
+    return {"environment": _environment(), "repeat": repeat, "quick": quick, "results": results}
+
+def compare(current: dict, baseline: dict) -> list:
+    """Compare the median times of two benchmark reports.
+
+    Args:
+        current (dict): The new report.
+        baseline (dict): The report to compare against.
+
+    Returns:
+        list: Tuples of benchmark, case, baseline median, current median and
+        their ratio, for the cases present in both reports.
+    """
+    previous = {(r["benchmark"], r["case"]): r["stats"]["median"] for r in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        key = (result["benchmark"], result["case"])
+        if key in previous:
+            median = result["stats"]["median"]
+            rows.append((*key, previous[key], median, median / previous[key] if previous[key] else None))
+    return rows
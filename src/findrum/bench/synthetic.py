@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+from findrum.registry import registry
+
+class BenchSource:
+    """Datasource returning a fixed integer."""
+
+    def __init__(self, value: int = 1):
+        self.value = value
+
+    def fetch(self):
+        return self.value
+
+class BenchFrameSource:
+    """Datasource returning a numeric DataFrame of `rows` x `columns`."""
+
+    def __init__(self, rows: int = 100_000, columns: int = 10):
+        self.rows = rows
+        self.columns = columns
+
+    def fetch(self):
+        data = np.arange(self.rows * self.columns, dtype="float64").reshape(self.rows, self.columns)
+        return pd.DataFrame(data, columns=[f"c{i}" for i in range(self.columns)])
+
+class BenchPassthrough:
+    """Operator returning its input unchanged, so only engine overhead is measured."""
+
+    def __init__(self):
+        pass
+
+    def run(self, input_data):
+        return input_data
+
+class BenchTrigger:
+    """Event trigger that never emits; benchmarks call `run_with_data` directly."""
+
+    def __init__(self, **config):
+        self.config = config
+
+    def start(self):
+        pass
+
+SYNTHETIC_EXTENSIONS = {
+    "datasources": [BenchSource, BenchFrameSource],
+    "operators": [BenchPassthrough],
+    "triggers": [BenchTrigger],
+}
+
+def register_synthetic():
+    """Register the synthetic operators, datasources and trigger by class name."""
+    registry.DATASOURCE_REGISTRY.update({cls.__name__: cls for cls in SYNTHETIC_EXTENSIONS["datasources"]})
+    registry.OPERATOR_REGISTRY.update({cls.__name__: cls for cls in SYNTHETIC_EXTENSIONS["operators"]})
+    registry.EVENT_TRIGGER_REGISTRY.update({cls.__name__: cls for cls in SYNTHETIC_EXTENSIONS["triggers"]})
+
+def chain_pipeline(steps: int, datasource: dict = None, event: bool = False) -> dict:
+    """Build a pipeline definition of a datasource followed by a chain of passthrough operators.
+
+    Args:
+        steps (int): Total number of steps.
+        datasource (dict, optional): Datasource step fields. Defaults to `BenchSource`.
+        event (bool): Whether the first step is fed by `BenchTrigger` events
+            instead of a datasource.
+
+    Returns:
+        dict: The pipeline definition.
+    """
+    if event:
+        pipeline = [{"id": "step0", "operator": "BenchPassthrough", "depends_on": "BenchTrigger"}]
+    else:
+        pipeline = [{"id": "step0", **(datasource or {"datasource": "BenchSource"})}]
+    for i in range(1, steps):
+        pipeline.append({"id": f"step{i}", "operator": "BenchPassthrough", "depends_on": f"step{i - 1}"})
+
+    definition = {"pipeline": pipeline}
+    if event:
+        definition["event"] = {"type": "BenchTrigger"}
+    return definition
@@ -0,0 +1,133 @@
+import time
+import logging
+import threading
+
+logger = logging.getLogger("findrum")
+
+BATCH_FORMATS = ("list", "dataframe")
+
+class MicroBatcher:
+    """Coalesces individual events into batches.
+
+    Events passed to `add` are buffered until `max_size` events have been
+    collected or the oldest buffered event has waited `max_wait` seconds,
+    whichever comes first. The batch is then handed to the `flush` callback
+    as a list, or as a single DataFrame with `format="dataframe"`.
+
+    Configured from the `batch` block of a pipeline's `event` section:
+
+        event:
+          type: MyTrigger
+          batch:
+            max_size: 500
+            max_wait: 0.2
+            format: dataframe
+    """
+
+    def __init__(self, flush, max_size: int = 100, max_wait: float = 1.0, format: str = "list", name: str = "batch"):
+        """Create the batcher and start its timer thread.
+
+        Args:
+            flush (Callable): Called with each batch.
+            max_size (int): Maximum number of events per batch.
+            max_wait (float): Maximum seconds an event waits before its batch is flushed.
+            format (str): "list" or "dataframe".
+            name (str): Name used for the timer thread and log messages.
+
+        Raises:
+            ValueError: If the settings are invalid.
+        """
+        if format not in BATCH_FORMATS:
+            raise ValueError(f"Unknown batch format '{format}'. Expected one of {BATCH_FORMATS}.")
+        if max_size < 1:
+            raise ValueError("Batch max_size must be at least 1.")
+        if max_wait <= 0:
+            raise ValueError("Batch max_wait must be positive.")
+
+        self.flush = flush
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self.format = format
+        self.name = name
+        self.batches = 0
+
+        self._items = []
+        self._deadline = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._watch_deadline, name=f"findrum-batch-{name}", daemon=True)
+        self._thread.start()
+
+    def add(self, item):
+        """Buffer an event, flushing the batch if it is full.
+
+        Args:
+            item (Any): The event data.
+
+        Raises:
+            RuntimeError: If the batcher has been closed.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError(f"Batcher '{self.name}' is closed.")
+            self._items.append(item)
+            if len(self._items) == 1:
+                self._deadline = time.monotonic() + self.max_wait
+                self._condition.notify()
+            batch = self._take() if len(self._items) >= self.max_size else None
+
+        if batch:
+            self._flush(batch)
+
+    def close(self):
+        """Flush buffered events and stop the timer thread."""
+        with self._condition:
+            self._closed = True
+            batch = self._take()
+            self._condition.notify()
+        self._thread.join()
+        if batch:
+            self._flush(batch)
+
+    def _take(self) -> list:
+        """Remove and return the buffered events. Must hold the condition."""
+        batch, self._items = self._items, []
+        self._deadline = None
+        return batch
+
+    def _watch_deadline(self):
+        """Timer loop: flush batches whose oldest event has waited too long."""
+        with self._condition:
+            while not self._closed:
+                if self._deadline is None:
+                    self._condition.wait()
+                    continue
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                batch = self._take()
+                self._condition.release()
+                try:
+                    self._flush(batch)
+                finally:
+                    self._condition.acquire()
+
+    def _flush(self, batch: list):
+        """Format a batch and hand it to the flush callback."""
+        self.batches += 1
+        try:
+            self.flush(self._format(batch))
+        except Exception:
+            logger.exception(f"Failed to flush batch of {len(batch)} events from '{self.name}'.")
+
+    def _format(self, batch: list):
+        """Convert a batch to the configured format."""
+        if self.format == "list":
+            return batch
+
+        import pandas as pd
+
+        if all(isinstance(item, pd.DataFrame) for item in batch):
+            return pd.concat(batch, ignore_index=True)
+        return pd.DataFrame(batch)
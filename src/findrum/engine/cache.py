@@ -0,0 +1,313 @@
+import os
+import sys
+import json
+import time
+import pickle
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger("findrum")
+
+CACHE_BACKENDS = ("memory", "disk")
+DEFAULT_CACHE_DIR = os.path.join(".findrum", "cache")
+
+def fingerprint(value):
+    """Compute a content fingerprint of a step input.
+
+    DataFrames and Series are hashed row by row with pandas' vectorized
+    hashing, so large frames are fingerprinted without being pickled.
+    Containers are fingerprinted recursively. Other objects are pickled.
+
+    Args:
+        value (Any): The step input.
+
+    Returns:
+        str | None: A hex digest, or None if the value cannot be fingerprinted.
+    """
+    digest = hashlib.sha256()
+    if not _update_fingerprint(digest, value):
+        return None
+    return digest.hexdigest()
+
+def _update_fingerprint(digest, value) -> bool:
+    """Feed a value into a running digest. Returns False if it cannot be hashed."""
+    import pandas as pd
+
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        digest.update(type(value).__name__.encode())
+        if isinstance(value, pd.DataFrame):
+            digest.update(repr(list(value.columns)).encode())
+            digest.update(repr(list(value.dtypes.astype(str))).encode())
+        else:
+            digest.update(repr((value.name, str(value.dtype))).encode())
+        try:
+            digest.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+        except TypeError:
+            return _update_pickled(digest, value)
+        return True
+
+    if isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}:{len(value)}".encode())
+        return all(_update_fingerprint(digest, item) for item in value)
+
+    if isinstance(value, dict):
+        digest.update(f"dict:{len(value)}".encode())
+        for key in sorted(value, key=repr):
+            digest.update(repr(key).encode())
+            if not _update_fingerprint(digest, value[key]):
+                return False
+        return True
+
+    if value is None or isinstance(value, (str, bytes, int, float, bool)):
+        digest.update(f"{type(value).__name__}:{value!r}".encode())
+        return True
+
+    return _update_pickled(digest, value)
+
+def _update_pickled(digest, value) -> bool:
+    """Feed the pickled form of a value into a digest."""
+    try:
+        digest.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return False
+    return True
+
+def make_cache_key(step_type: str, params: dict, input_fingerprint: str) -> str:
+    """Build the cache key of a step execution.
+
+    Args:
+        step_type (str): Registered operator or datasource name.
+        params (dict): Resolved step parameters.
+        input_fingerprint (str): Fingerprint of the step input.
+
+    Returns:
+        str: A hex digest identifying the execution.
+    """
+    payload = json.dumps([step_type, params, input_fingerprint], sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def _sizeof(value) -> int:
+    """Estimate the memory footprint of a cached value in bytes."""
+    import pandas as pd
+
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if isinstance(value, pd.DataFrame) else usage)
+    return sys.getsizeof(value)
+
+def _copy(value):
+    """Copy a cached value, so the steps consuming it cannot change the cache entry.
+
+    DataFrames, Series and NumPy arrays are copied with their `copy`
+    method, immutable scalars are returned as they are and other values
+    are copied through pickle.
+    """
+    if value is None or isinstance(value, (str, bytes, int, float, bool, frozenset)):
+        return value
+    copy = getattr(value, "copy", None)
+    if callable(copy) and type(value).__module__.split(".")[0] in ("pandas", "numpy"):
+        return copy()
+    try:
+        return pickle.loads(pickle.dumps(value, protocol=5))
+    except Exception:
+        import copy as copy_module
+
+        return copy_module.deepcopy(value)
+
+class MemoryCache:
+    """In-process LRU cache of step results.
+
+    Entries are evicted least recently used first when there are more than
+    `max_entries` of them or their estimated size exceeds `max_bytes`.
+    Values are copied when stored and on every hit, so a step changing its
+    input in place does not change the cached entry.
+    """
+
+    def __init__(self, ttl: float = None, max_entries: int = 128, max_bytes: int = None):
+        """Create an empty cache.
+
+        Args:
+            ttl (float, optional): Seconds before an entry expires. None means never.
+            max_entries (int): Maximum number of entries.
+            max_bytes (int, optional): Maximum estimated size of all entries.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        """Look up an entry.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            tuple: (True, value) on a hit, (False, None) on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None and entry[0] < time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return True, _copy(value)
+
+    def set(self, key: str, value):
+        """Store an entry, evicting old ones if needed.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The step result.
+        """
+        size = _sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        value = _copy(value)
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires_at, value, size)
+            self._size += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._size > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str):
+        """Remove an entry. Must hold the lock."""
+        _, _, size = self._entries.pop(key)
+        self._size -= size
+
+class DiskCache:
+    """Persistent cache of step results stored as pickle files.
+
+    Values are written with pickle protocol 5, which stores the buffers of
+    DataFrames and NumPy arrays as raw binary. When the files exceed
+    `max_bytes` in total, the least recently used ones are deleted.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_DIR, ttl: float = None, max_bytes: int = None):
+        """Create the cache directory if needed.
+
+        Args:
+            path (str): Directory holding the cache files.
+            ttl (float, optional): Seconds before an entry expires. None means never.
+            max_bytes (int, optional): Maximum total size of the cache files.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.pkl")
+
+    def get(self, key: str):
+        """Look up an entry.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            tuple: (True, value) on a hit, (False, None) on a miss.
+        """
+        path = self._file(key)
+        try:
+            with open(path, "rb") as f:
+                expires_at, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            with self._lock:
+                self.misses += 1
+            return False, None
+
+        if expires_at is not None and expires_at < time.time():
+            with self._lock:
+                self.misses += 1
+            self._delete(path)
+            return False, None
+
+        os.utime(path)
+        with self._lock:
+            self.hits += 1
+        return True, value
+
+    def set(self, key: str, value):
+        """Store an entry, evicting old files if needed.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The step result. Unpicklable values are not cached.
+        """
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        path = self._file(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump((expires_at, value), f, protocol=5)
+            os.replace(tmp_path, path)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            logger.warning(f"Result for cache key {key} is not picklable. Skipping disk cache.")
+            self._delete(tmp_path)
+            return
+
+        if self.max_bytes is not None:
+            self._evict()
+
+    def _evict(self):
+        """Delete least recently used files until under `max_bytes`."""
+        with self._lock:
+            files = []
+            for entry in os.scandir(self.path):
+                if entry.name.endswith(".pkl"):
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                self._delete(path)
+                total -= size
+
+    @staticmethod
+    def _delete(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def create_cache(config):
+    """Create a cache backend from a step's `cache` block.
+
+    Args:
+        config (dict | bool): The `cache` block. `true` uses the memory defaults.
+
+    Returns:
+        MemoryCache | DiskCache: The cache backend.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    config = dict(config) if isinstance(config, dict) else {}
+    backend = config.pop("backend", "memory")
+    if backend not in CACHE_BACKENDS:
+        raise ValueError(f"Unknown cache backend '{backend}'. Expected one of {CACHE_BACKENDS}.")
+    if backend == "disk":
+        return DiskCache(**config)
+    return MemoryCache(**config)
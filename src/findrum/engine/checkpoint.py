@@ -0,0 +1,140 @@
+import os
+import shutil
+import pickle
+import logging
+import importlib.util
+
+logger = logging.getLogger("findrum")
+
+_PARQUET = ".parquet"
+_PICKLE = ".pkl"
+_STATE = ".state"
+
+def _has_parquet() -> bool:
+    """Check whether pandas can write Parquet, without importing pyarrow."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+class CheckpointStore:
+    """Step outputs of batch runs saved on local disk, keyed by run id and step id.
+
+    DataFrames are written as Parquet when pyarrow is installed, other
+    values are pickled. A run that fails can be resumed with its run id:
+    the steps it completed are loaded from their checkpoints instead of
+    running again.
+
+    Args:
+        path (str): Directory of the checkpoints, one subdirectory per run.
+        keep (bool): Whether to keep the checkpoints of runs that succeed.
+    """
+
+    def __init__(self, path: str = ".findrum/checkpoints", keep: bool = False):
+        self.path = path
+        self.keep = keep
+
+    def __repr__(self) -> str:
+        return f"CheckpointStore({self.path!r})"
+
+    def _run_dir(self, run_id: str) -> str:
+        return os.path.join(self.path, run_id)
+
+    def completed(self, run_id: str) -> set:
+        """Return the ids of the steps checkpointed for a run.
+
+        Args:
+            run_id (str): The run id.
+
+        Returns:
+            set: Step ids, empty if the run has no checkpoints.
+        """
+        try:
+            names = os.listdir(self._run_dir(run_id))
+        except FileNotFoundError:
+            return set()
+        return {os.path.splitext(name)[0] for name in names if name.endswith((_PARQUET, _PICKLE))}
+
+    def save(self, run_id: str, step_id: str, value, states: dict = None):
+        """Write the output of a step. The file only appears once it is complete.
+
+        Args:
+            run_id (str): The run id.
+            step_id (str): The step id.
+            value (Any): The step output.
+            states (dict, optional): State changes staged by the step (and,
+                for a streaming segment, the steps before it), keyed by step id.
+                Written before the output, so a completed step always has them.
+        """
+        run_dir = self._run_dir(run_id)
+        os.makedirs(run_dir, exist_ok=True)
+        base = os.path.join(run_dir, step_id)
+
+        if states:
+            with open(base + ".tmp", "wb") as f:
+                pickle.dump(states, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(base + ".tmp", base + _STATE)
+
+        if hasattr(value, "to_parquet") and _has_parquet():
+            try:
+                value.to_parquet(base + ".tmp")
+                os.replace(base + ".tmp", base + _PARQUET)
+                return
+            except (ValueError, TypeError, ImportError):
+                logger.debug(f"Could not write step '{step_id}' as Parquet, pickling it instead.")
+
+        with open(base + ".tmp", "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(base + ".tmp", base + _PICKLE)
+
+    def load(self, run_id: str, step_id: str):
+        """Read the output of a step.
+
+        Args:
+            run_id (str): The run id.
+            step_id (str): The step id.
+
+        Returns:
+            Any: The step output.
+
+        Raises:
+            KeyError: If the step has no checkpoint in the run.
+        """
+        base = os.path.join(self._run_dir(run_id), step_id)
+        if os.path.exists(base + _PARQUET):
+            import pandas as pd
+
+            return pd.read_parquet(base + _PARQUET)
+        try:
+            with open(base + _PICKLE, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            raise KeyError(f"Step '{step_id}' has no checkpoint in run '{run_id}'.") from None
+
+    def load_states(self, run_id: str, step_id: str) -> dict:
+        """Read the state changes saved with the checkpoint of a step.
+
+        Args:
+            run_id (str): The run id.
+            step_id (str): The step id.
+
+        Returns:
+            dict: State changes keyed by step id, empty if there are none.
+        """
+        try:
+            with open(os.path.join(self._run_dir(run_id), step_id + _STATE), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def clear(self, run_id: str):
+        """Delete the checkpoints of a run."""
+        shutil.rmtree(self._run_dir(run_id), ignore_errors=True)
+
+def create_checkpoint_store(config) -> CheckpointStore:
+    """Create a checkpoint store from a pipeline's `checkpoint` block.
+
+    Args:
+        config (dict | bool): The `checkpoint` block. `true` uses the defaults.
+
+    Returns:
+        CheckpointStore: The checkpoint store.
+    """
+    return CheckpointStore(**config) if isinstance(config, dict) else CheckpointStore()
@@ -0,0 +1,113 @@
+import importlib.util
+
+TRANSPORTS = ("object", "arrow")
+INPUT_FORMATS = ("pandas", "arrow", "numpy")
+
+def require_pyarrow():
+    """Check that pyarrow is installed, without importing it.
+
+    Raises:
+        ImportError: If pyarrow is missing.
+    """
+    if importlib.util.find_spec("pyarrow") is None:
+        raise ImportError("The arrow transport requires pyarrow: pip install findrum-platform[arrow]")
+
+def _is_table(value) -> bool:
+    """Check for an Arrow table or record batch without importing pyarrow."""
+    return type(value).__module__.startswith("pyarrow") and hasattr(value, "column_names")
+
+def _is_frame(value) -> bool:
+    """Check for a pandas DataFrame without importing pandas."""
+    return type(value).__name__ == "DataFrame" and hasattr(value, "columns")
+
+def to_columnar(value):
+    """Normalize a step output for the arrow transport.
+
+    DataFrames are converted once to an Arrow table, record batches are
+    wrapped in a table without copying, and other values are kept as is.
+
+    Args:
+        value (Any): The step output.
+
+    Returns:
+        Any: A `pyarrow.Table`, or the value unchanged.
+    """
+    if _is_frame(value):
+        import pyarrow as pa
+
+        return pa.Table.from_pandas(value)
+    if _is_table(value) and type(value).__name__ == "RecordBatch":
+        import pyarrow as pa
+
+        return pa.Table.from_batches([value])
+    return value
+
+def project(value, columns: list):
+    """Keep only the given columns of a table or DataFrame.
+
+    Projecting an Arrow table only drops references to the other columns,
+    so they are never converted for the consumer.
+
+    Args:
+        value (Any): A `pyarrow.Table`, a DataFrame or any other value.
+        columns (list): Names of the columns to keep.
+
+    Returns:
+        Any: The projected table or DataFrame, or the value unchanged.
+
+    Raises:
+        KeyError: If a column does not exist.
+    """
+    if _is_table(value):
+        missing = [column for column in columns if column not in value.column_names]
+        if missing:
+            raise KeyError(f"Columns not found: {missing}")
+        return value.select(columns)
+    if _is_frame(value):
+        return value[columns]
+    return value
+
+def to_view(value, input_format: str = "pandas"):
+    """Convert a table or DataFrame to the format a consumer asked for.
+
+    Arrow tables are converted with `split_blocks=True`, so columns are not
+    consolidated into 2D blocks and numeric columns without nulls are
+    wrapped without copying.
+
+    Args:
+        value (Any): A `pyarrow.Table`, a DataFrame or any other value.
+        input_format (str): "pandas", "arrow" or "numpy" (a dict of column
+            name to array).
+
+    Returns:
+        Any: The converted value. Other values are returned unchanged.
+    """
+    if _is_table(value):
+        if input_format == "arrow":
+            return value
+        if input_format == "numpy":
+            return {name: value.column(name).to_numpy() for name in value.column_names}
+        return value.to_pandas(split_blocks=True)
+    if _is_frame(value):
+        if input_format == "arrow":
+            return to_columnar(value)
+        if input_format == "numpy":
+            return {name: value[name].to_numpy() for name in value.columns}
+    return value
+
+def prepare_input(value, columns: list = None, input_format: str = "pandas"):
+    """Project and convert a step input, element-wise for multi-input steps.
+
+    Args:
+        value (Any): The resolved input of the step.
+        columns (list, optional): Columns the step needs.
+        input_format (str): Format the step expects, see `to_view`.
+
+    Returns:
+        Any: The input as the step should receive it.
+    """
+    if isinstance(value, list) and any(_is_table(item) or _is_frame(item) for item in value):
+        return [prepare_input(item, columns, input_format) for item in value]
+    if columns:
+        value = project(value, columns)
+    return to_view(value, input_format)
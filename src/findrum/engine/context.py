@@ -0,0 +1,28 @@
+import uuid
+
+class RunContext:
+    """Mutable state of a single pipeline execution.
+
+    A runner creates a new context for every run, so concurrent runs of the
+    same runner (e.g. events processed in parallel) never share results.
+    The pipeline definition itself lives in the runner's plan and is shared.
+    """
+
+    def __init__(self, param_overrides: dict = None, run_id: str = None):
+        """Initialize an empty run context.
+
+        Args:
+            param_overrides (dict, optional): Mapping of step id to parameter
+                overrides for this run. Copied so later changes do not leak in.
+            run_id (str, optional): Id of the run, e.g. of a run being resumed.
+                A new id is generated by default.
+        """
+        self.run_id = run_id or uuid.uuid4().hex
+        self.results = {}
+        self.param_overrides = {step_id: dict(params) for step_id, params in (param_overrides or {}).items()}
+        self.timings = {}
+        self.metrics = {}
+        self.pending = None
+        self.states = {}
+        self.checkpoints = None
+        self.checkpointed = frozenset()
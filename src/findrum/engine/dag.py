@@ -0,0 +1,138 @@
+import heapq
+
+def get_dependencies(step: dict) -> list:
+    """Return the dependencies declared by a step as a list.
+
+    Args:
+        step (dict): The pipeline step definition.
+
+    Returns:
+        list: Ids the step depends on. Empty if `depends_on` is not set.
+    """
+    depends_on = step.get("depends_on")
+    if isinstance(depends_on, list):
+        return list(depends_on)
+    elif depends_on:
+        return [depends_on]
+    return []
+
+def build_graph(steps: list, external=()) -> dict:
+    """Build the dependency graph of a pipeline.
+
+    Args:
+        steps (list): Pipeline step definitions.
+        external (Iterable[str]): Dependency names that are satisfied outside
+            the pipeline (e.g. the event trigger type) and are not steps.
+
+    Returns:
+        dict: Mapping of step id to the distinct step ids it depends on,
+        in declaration order. External dependencies are left out.
+
+    Raises:
+        ValueError: If a step id is duplicated or a dependency does not exist.
+    """
+    step_ids = [step["id"] for step in steps]
+    known = set()
+    for step_id in step_ids:
+        if step_id in known:
+            raise ValueError(f"Duplicate step id '{step_id}' in pipeline.")
+        known.add(step_id)
+
+    external = set(external)
+    graph = {}
+    for step in steps:
+        deps = []
+        for dep in get_dependencies(step):
+            if dep in external:
+                continue
+            if dep not in known:
+                raise ValueError(f"Step '{step['id']}' depends on unknown step '{dep}'.")
+            if dep not in deps:
+                deps.append(dep)
+        graph[step["id"]] = deps
+    return graph
+
+def get_consumers(graph: dict) -> dict:
+    """Invert a dependency graph.
+
+    Args:
+        graph (dict): Mapping of step id to its dependencies.
+
+    Returns:
+        dict: Mapping of step id to the step ids that consume its output.
+    """
+    consumers = {step_id: [] for step_id in graph}
+    for step_id, deps in graph.items():
+        for dep in deps:
+            if step_id not in consumers[dep]:
+                consumers[dep].append(step_id)
+    return consumers
+
+def find_cycle(graph: dict):
+    """Find a dependency cycle in the graph, if any.
+
+    Steps left over by a topological sort all depend on another left over
+    step, so following their dependencies from any of them runs into a
+    cycle. Nothing is recursive, so long pipelines are fine.
+
+    Args:
+        graph (dict): Mapping of step id to its dependencies.
+
+    Returns:
+        list | None: The step ids forming a cycle (first id repeated at the
+        end), or None if the graph is acyclic.
+    """
+    return _cycle_in(graph, _sort(graph))
+
+def _cycle_in(graph: dict, order: list):
+    """Return a cycle among the steps missing from a partial topological order."""
+    if len(order) == len(graph):
+        return None
+    left = set(graph).difference(order)
+    node = next(step_id for step_id in graph if step_id in left)
+    path, seen = [], {}
+    while node not in seen:
+        seen[node] = len(path)
+        path.append(node)
+        node = next(dep for dep in graph[node] if dep in left)
+    return path[seen[node]:] + [node]
+
+def _sort(graph: dict) -> list:
+    """Kahn's algorithm, breaking ties by pipeline order. Steps in or after a cycle are left out."""
+    position = {step_id: i for i, step_id in enumerate(graph)}
+    consumers = get_consumers(graph)
+    remaining = {step_id: len(deps) for step_id, deps in graph.items()}
+    ready = [position[step_id] for step_id, n in remaining.items() if n == 0]
+    heapq.heapify(ready)
+    steps = list(graph)
+
+    order = []
+    while ready:
+        step_id = steps[heapq.heappop(ready)]
+        order.append(step_id)
+        for consumer in consumers[step_id]:
+            remaining[consumer] -= 1
+            if remaining[consumer] == 0:
+                heapq.heappush(ready, position[consumer])
+    return order
+
+def topological_order(graph: dict) -> list:
+    """Order steps so that every step comes after its dependencies.
+
+    Ties are broken by pipeline order, so an already well-ordered pipeline
+    keeps its original sequence.
+
+    Args:
+        graph (dict): Mapping of step id to its dependencies.
+
+    Returns:
+        list: Step ids in execution order.
+
+    Raises:
+        ValueError: If the graph contains a cycle.
+    """
+    order = _sort(graph)
+    cycle = _cycle_in(graph, order)
+    if cycle:
+        raise ValueError(f"Pipeline contains a dependency cycle: {' -> '.join(cycle)}")
+    return order
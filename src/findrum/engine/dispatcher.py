@@ -0,0 +1,123 @@
+import queue
+import logging
+import threading
+
+logger = logging.getLogger("findrum")
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "reject")
+
+DEFAULT_DISPATCH = {
+    "workers": 4,
+    "queue_size": 1000,
+    "overflow": "block",
+}
+
+_STOP = object()
+
+class EventDispatcher:
+    """Delivers trigger events to pipeline runners through a bounded queue.
+
+    Each call to `submit` enqueues one delivery per runner and returns
+    immediately, so the trigger can keep taking in events while a pool of
+    worker threads runs the pipelines. Deliveries run in parallel, including
+    several events for the same runner, since every run gets its own
+    context. When the queue is full, the overflow policy decides what
+    happens: "block" waits for room, "drop_oldest" discards the oldest
+    queued delivery and "reject" discards the new one.
+    """
+
+    def __init__(self, name: str, workers: int = 4, queue_size: int = 1000, overflow: str = "block"):
+        """Create the dispatcher and start its worker threads.
+
+        Args:
+            name (str): Name used for the worker threads and log messages.
+            workers (int): Number of worker threads.
+            queue_size (int): Maximum number of queued deliveries. 0 means unbounded.
+            overflow (str): One of "block", "drop_oldest" or "reject".
+
+        Raises:
+            ValueError: If the settings are invalid.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow}'. Expected one of {OVERFLOW_POLICIES}.")
+        if workers < 1:
+            raise ValueError("Event dispatcher needs at least one worker.")
+
+        self.name = name
+        self.overflow = overflow
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self._threads = [
+            threading.Thread(target=self._work, name=f"findrum-dispatch-{name}-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, runners: list, data) -> int:
+        """Queue the delivery of an event to every runner.
+
+        Args:
+            runners (list[PipelineRunner]): Runners registered to the event.
+            data (Any): The event data.
+
+        Returns:
+            int: Number of deliveries that were queued.
+        """
+        queued = 0
+        for runner in runners:
+            if self._put((runner, data)):
+                queued += 1
+        return queued
+
+    def _put(self, item) -> bool:
+        """Queue an item according to the overflow policy."""
+        if self.overflow == "block":
+            self.queue.put(item)
+            return True
+
+        while True:
+            try:
+                self.queue.put_nowait(item)
+                return True
+            except queue.Full:
+                self.dropped += 1
+                if self.overflow == "reject":
+                    logger.warning(f"Event queue '{self.name}' is full. Event rejected.")
+                    return False
+                try:
+                    self.queue.get_nowait()
+                    self.queue.task_done()
+                    logger.warning(f"Event queue '{self.name}' is full. Oldest event dropped.")
+                except queue.Empty:
+                    pass
+
+    def _work(self):
+        """Worker loop: run queued deliveries until stopped."""
+        while True:
+            item = self.queue.get()
+            try:
+                if item is _STOP:
+                    return
+                runner, data = item
+                runner.run_with_data(data)
+            except Exception:
+                logger.exception(f"Pipeline failed while processing event from '{self.name}'.")
+            finally:
+                self.queue.task_done()
+
+    def join(self):
+        """Block until every queued delivery has been processed."""
+        self.queue.join()
+
+    def shutdown(self, wait: bool = True):
+        """Stop the workers after the queued deliveries are processed.
+
+        Args:
+            wait (bool): Whether to wait for the worker threads to exit.
+        """
+        for _ in self._threads:
+            self.queue.put(_STOP)
+        if wait:
+            for thread in self._threads:
+                thread.join()
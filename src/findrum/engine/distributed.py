@@ -0,0 +1,431 @@
+import os
+import time
+import uuid
+import pickle
+import socket
+import sqlite3
+import logging
+import threading
+
+from findrum.engine.plan import close_plans, get_plan
+from findrum.engine.process import shutdown_process_pool
+from findrum.loader.load_extensions import load_extensions, preload_pipeline
+from findrum.registry.registry import close_resources
+
+logger = logging.getLogger("findrum")
+
+JOB_STATUSES = ("queued", "running", "done", "failed")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    pipeline TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    status TEXT NOT NULL,
+    worker TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created REAL NOT NULL,
+    claimed REAL,
+    finished REAL,
+    result BLOB,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created);
+CREATE INDEX IF NOT EXISTS jobs_finished ON jobs (finished);
+"""
+
+_NO_DATA = object()
+
+DEFAULT_RETENTION = 7 * 24 * 3600
+
+class Job:
+    """A pipeline run claimed from a broker.
+
+    Attributes:
+        id (str): Job id, returned by `publish`.
+        pipeline (str): Path of the pipeline YAML file, as published.
+        payload (dict): `params` overrides, the `data` of event runs, the
+            run id to `resume` and whether to `keep_results`, if any.
+        attempts (int): Number of times the job has been claimed.
+    """
+
+    def __init__(self, job_id: str, pipeline: str, payload: dict, attempts: int = 1):
+        self.id = job_id
+        self.pipeline = pipeline
+        self.payload = payload
+        self.attempts = attempts
+
+    def __repr__(self) -> str:
+        return f"Job({self.id!r}, {self.pipeline!r})"
+
+class SQLiteBroker:
+    """Job queue and result store backed by a single SQLite file.
+
+    The Platform publishes pipeline runs to the queue and `findrum-run
+    --worker` processes claim, execute and complete them, storing the
+    results (or the error) next to the job. Claiming is a single
+    transaction, so every job is executed by one worker only, however many
+    processes poll the file. Event data, parameter overrides and results
+    are pickled. Results are only stored for jobs published with
+    `keep_results`, and finished jobs are deleted after `retention` seconds.
+
+    Any object with the same `publish`, `claim`, `complete`, `fail`,
+    `result` and `close` methods can be used as a broker.
+
+    Args:
+        path (str): Path of the SQLite file, shared by the publisher and the workers.
+        lease (float, optional): Seconds after which a job still running is
+            considered lost (its worker died) and queued again. Disabled by default.
+        timeout (float): Seconds to wait for the file lock held by another process.
+        retention (float, optional): Seconds finished jobs are kept, results
+            and errors included, before they are purged. One week by default;
+            None keeps them forever.
+        keep_results (bool): Whether jobs keep their results unless `publish`
+            says otherwise, including the runs the Platform and schedulers publish.
+    """
+
+    def __init__(self, path: str = "findrum-queue.db", lease: float = None, timeout: float = 30.0,
+                 retention: float = DEFAULT_RETENTION, keep_results: bool = False):
+        self.path = path
+        self.lease = lease
+        self.retention = retention
+        self.keep_results = keep_results
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+
+    def __repr__(self) -> str:
+        return f"SQLiteBroker({self.path!r})"
+
+    def publish(self, pipeline: str, data=_NO_DATA, params: dict = None, resume: str = None,
+                keep_results: bool = None) -> str:
+        """Queue a run of a pipeline.
+
+        Args:
+            pipeline (str): Path of the pipeline YAML file. Workers resolve it
+                against their own working directory.
+            data (Any, optional): Event data. If given, the worker calls
+                `run_with_data` instead of `run`.
+            params (dict, optional): Parameter overrides by step id.
+            resume (str, optional): Id of a failed run to resume from its checkpoints.
+            keep_results (bool, optional): Whether the worker stores the step
+                results of the run, to be read with `result`. Otherwise only the
+                status or error of the job is recorded. Defaults to the broker's
+                `keep_results`.
+
+        Returns:
+            str: The job id.
+        """
+        payload = {"params": params or {}}
+        if resume is not None:
+            payload["resume"] = resume
+        if self.keep_results if keep_results is None else keep_results:
+            payload["keep_results"] = True
+        if data is not _NO_DATA:
+            payload["data"] = data
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO jobs (id, pipeline, payload, status, created) VALUES (?, ?, ?, 'queued', ?)",
+                (job_id, pipeline, pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL), time.time()),
+            )
+        return job_id
+
+    def claim(self, worker: str):
+        """Take the oldest queued job, if any.
+
+        Args:
+            worker (str): Id of the claiming worker, recorded on the job.
+
+        Returns:
+            Job | None: The claimed job, or None if the queue is empty.
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                if self.lease is not None:
+                    cursor.execute(
+                        "UPDATE jobs SET status = 'queued', worker = NULL WHERE status = 'running' AND claimed < ?",
+                        (now - self.lease,),
+                    )
+                row = cursor.execute(
+                    "SELECT id, pipeline, payload, attempts FROM jobs WHERE status = 'queued' ORDER BY created LIMIT 1"
+                ).fetchone()
+                if row is not None:
+                    cursor.execute(
+                        "UPDATE jobs SET status = 'running', worker = ?, claimed = ?, attempts = attempts + 1 "
+                        "WHERE id = ?",
+                        (worker, now, row[0]),
+                    )
+                cursor.execute("COMMIT")
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        return Job(row[0], row[1], pickle.loads(row[2]), row[3] + 1)
+
+    def complete(self, job_id: str, results: dict = None):
+        """Store the results of a job and mark it done.
+
+        Args:
+            job_id (str): The job id.
+            results (dict, optional): Step results of the run, if they are kept.
+        """
+        result = None if results is None else pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL)
+        self._finish(job_id, "done", result=result)
+
+    def fail(self, job_id: str, error: str):
+        """Store the error of a job and mark it failed.
+
+        Args:
+            job_id (str): The job id.
+            error (str): Description of the error.
+        """
+        self._finish(job_id, "failed", error=error)
+
+    def _finish(self, job_id: str, status: str, result: bytes = None, error: str = None):
+        with self._lock:
+            self._connection.execute(
+                "UPDATE jobs SET status = ?, finished = ?, result = ?, error = ? WHERE id = ?",
+                (status, time.time(), result, error, job_id),
+            )
+        if self.retention is not None:
+            self.purge(self.retention)
+
+    def purge(self, older_than: float = 0) -> int:
+        """Delete the jobs that finished at least `older_than` seconds ago.
+
+        Args:
+            older_than (float): Age in seconds of the finished jobs to delete.
+
+        Returns:
+            int: Number of deleted jobs.
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM jobs WHERE finished <= ? AND status IN ('done', 'failed')", (time.time() - older_than,)
+            )
+        return cursor.rowcount
+
+    def status(self, job_id: str) -> str:
+        """Return the status of a job: one of `JOB_STATUSES`.
+
+        Raises:
+            KeyError: If the job does not exist.
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            raise KeyError(f"Job '{job_id}' not found.")
+        return row[0]
+
+    def result(self, job_id: str, timeout: float = None, poll_interval: float = 0.1) -> dict:
+        """Wait for a job to finish and return its results.
+
+        Args:
+            job_id (str): The job id.
+            timeout (float, optional): Seconds to wait. Waits forever by default.
+            poll_interval (float): Seconds between checks of the job status.
+
+        Returns:
+            dict | None: Step results of the run, or None if the job was not
+                published with `keep_results`.
+
+        Raises:
+            KeyError: If the job does not exist, or was purged.
+            RuntimeError: If the job failed.
+            TimeoutError: If the job is not finished in time.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT status, result, error FROM jobs WHERE id = ?", (job_id,)
+                ).fetchone()
+            if row is None:
+                raise KeyError(f"Job '{job_id}' not found.")
+            status, result, error = row
+            if status == "done":
+                return None if result is None else pickle.loads(result)
+            if status == "failed":
+                raise RuntimeError(f"Job '{job_id}' failed: {error}")
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Job '{job_id}' did not finish within {timeout} seconds.")
+            time.sleep(poll_interval)
+
+    def close(self):
+        """Close the connection to the SQLite file."""
+        with self._lock:
+            self._connection.close()
+
+BROKER_TYPES = {"sqlite": SQLiteBroker}
+
+def create_broker(config):
+    """Create a broker from its configuration.
+
+    Args:
+        config (str | dict): Path of a SQLite queue file, or a mapping with a
+            `type` (default "sqlite") and the broker's keyword arguments.
+
+    Returns:
+        SQLiteBroker: The broker.
+
+    Raises:
+        ValueError: If the broker type is unknown.
+    """
+    if isinstance(config, str):
+        return SQLiteBroker(config)
+
+    options = dict(config)
+    broker_type = options.pop("type", "sqlite")
+    if broker_type not in BROKER_TYPES:
+        raise ValueError(f"Unknown broker '{broker_type}'. Expected one of {tuple(BROKER_TYPES)}.")
+    return BROKER_TYPES[broker_type](**options)
+
+class RemoteRunner:
+    """Stand-in for a `PipelineRunner` that publishes runs to a broker.
+
+    Used by the Platform when it coordinates workers: the event dispatcher
+    and unscheduled pipelines call `run` and `run_with_data` as usual, and
+    the run is executed by whichever worker claims it. Both return the job
+    id instead of the results, which are kept in the broker.
+    """
+
+    def __init__(self, pipeline_path: str, broker):
+        """
+        Args:
+            pipeline_path (str): Path of the pipeline YAML file.
+            broker (SQLiteBroker): Broker the runs are published to.
+        """
+        self.pipeline_path = pipeline_path
+        self.broker = broker
+        self.param_overrides = {}
+
+    def override_params(self, overrides: dict):
+        """Set parameter overrides sent with every following run."""
+        self.param_overrides = overrides
+
+    def run(self, resume: str = None) -> str:
+        """Publish a batch run of the pipeline.
+
+        Args:
+            resume (str, optional): Id of a failed run to resume from its checkpoints.
+
+        Returns:
+            str: The job id.
+        """
+        return self.broker.publish(self.pipeline_path, params=self.param_overrides, resume=resume)
+
+    def run_with_data(self, data) -> str:
+        """Publish a run of the pipeline with external input data.
+
+        Returns:
+            str: The job id.
+        """
+        return self.broker.publish(self.pipeline_path, data=data, params=self.param_overrides)
+
+    def close(self):
+        """Nothing to tear down: the steps live in the workers."""
+
+class Worker:
+    """Executes the pipeline runs queued in a broker.
+
+    Started with `findrum-run --worker`. Workers on any number of hosts
+    can share a broker; each job is claimed by one of them. The compiled
+    plans and step instances are kept between jobs, as in the Platform.
+    """
+
+    def __init__(self, broker, extensions_config: str = None, poll_interval: float = 1.0, worker_id: str = None):
+        """
+        Args:
+            broker (SQLiteBroker): Broker the jobs are claimed from.
+            extensions_config (str, optional): Path to the extensions config
+                YAML, loaded lazily if given.
+            poll_interval (float): Seconds to wait when the queue is empty.
+            worker_id (str, optional): Defaults to the host name and process id.
+        """
+        self.broker = broker
+        self.poll_interval = poll_interval
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._stopped = threading.Event()
+
+        if extensions_config is not None:
+            load_extensions(extensions_config, lazy=True)
+
+    def execute(self, job: Job) -> dict:
+        """Run the pipeline of a job in this process.
+
+        Args:
+            job (Job): The claimed job.
+
+        Returns:
+            dict: Step results of the run.
+        """
+        from findrum.engine.pipeline_runner import PipelineRunner
+
+        plan = get_plan(job.pipeline)
+        preload_pipeline(plan.definition)
+        runner = PipelineRunner(plan)
+        runner.override_params(job.payload.get("params", {}))
+        if "data" in job.payload:
+            return runner.run_with_data(job.payload["data"])
+        return runner.run(resume=job.payload.get("resume"))
+
+    def run_once(self) -> bool:
+        """Claim and execute one job, recording its error, or its results if they are kept.
+
+        Returns:
+            bool: False if the queue was empty.
+        """
+        job = self.broker.claim(self.worker_id)
+        if job is None:
+            return False
+
+        logger.info(f"🛠️ Worker {self.worker_id} running {job.pipeline} (job {job.id})")
+        try:
+            results = self.execute(job)
+        except Exception as error:
+            logger.exception(f"Job {job.id} failed.")
+            self.broker.fail(job.id, f"{type(error).__name__}: {error}")
+            return True
+
+        try:
+            self.broker.complete(job.id, results if job.payload.get("keep_results") else None)
+        except Exception as error:
+            logger.exception(f"Could not store the results of job {job.id}.")
+            self.broker.fail(job.id, f"{type(error).__name__}: {error}")
+        return True
+
+    def run(self, max_jobs: int = None):
+        """Process jobs until `stop` is called or the process is interrupted.
+
+        Args:
+            max_jobs (int, optional): Stop after this many jobs.
+        """
+        processed = 0
+        logger.info(f"Worker {self.worker_id} polling {self.broker!r}")
+        try:
+            while not self._stopped.is_set() and (max_jobs is None or processed < max_jobs):
+                if self.run_once():
+                    processed += 1
+                else:
+                    self._stopped.wait(self.poll_interval)
+        except KeyboardInterrupt:
+            logger.info("Interrupt received. Exiting.")
+        finally:
+            self.close()
+
+    def stop(self):
+        """Make `run` return after the current job."""
+        self._stopped.set()
+
+    def close(self):
+        """Shut down the process pool, tear down the step instances and close the shared resources."""
+        shutdown_process_pool()
+        close_plans()
+        close_resources()
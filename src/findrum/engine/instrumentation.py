@@ -0,0 +1,440 @@
+import os
+import sys
+import json
+import time
+import logging
+import threading
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger("findrum")
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+def peak_rss() -> int:
+    """Return the peak resident set size of the process in bytes.
+
+    Returns:
+        int | None: The high-water mark of the process RSS, or None if the
+        platform does not expose it.
+    """
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == "darwin" else usage * 1024
+
+def output_size(value):
+    """Measure the size of a step output.
+
+    Args:
+        value (Any): The step output.
+
+    Returns:
+        tuple: Number of rows and bytes. Rows are reported for DataFrames,
+        Series and sequences; bytes for DataFrames and Series only. Either
+        is None when unknown.
+    """
+    import pandas as pd
+
+    if isinstance(value, pd.DataFrame):
+        return len(value), int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return len(value), int(value.memory_usage(deep=True))
+    if isinstance(value, (list, tuple)):
+        return len(value), None
+    return None, None
+
+class MemorySink:
+    """Keeps every metric record in the `records` list."""
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    def emit(self, record: dict):
+        with self._lock:
+            self.records.append(record)
+
+    def close(self):
+        pass
+
+class JsonLinesSink:
+    """Appends every metric record as a JSON line to a file."""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): File to append to. Parent directories are created.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def emit(self, record: dict):
+        line = json.dumps(record, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+class PrometheusSink:
+    """Aggregates step and run records into Prometheus metrics.
+
+    The metrics are rendered in the text exposition format after every run
+    and written atomically to `path` (e.g. for the node exporter textfile
+    collector) and/or sent with an HTTP PUT to `url` (e.g. a Pushgateway
+    job URL). Push failures are logged and do not fail the pipeline.
+    """
+
+    STEP_METRICS = (
+        ("findrum_step_runs_total", "counter", "Step executions."),
+        ("findrum_step_errors_total", "counter", "Failed step executions."),
+        ("findrum_step_cache_hits_total", "counter", "Step executions served from the cache."),
+        ("findrum_step_wall_seconds_total", "counter", "Wall time spent in the step."),
+        ("findrum_step_cpu_seconds_total", "counter", "CPU time spent in the step."),
+        ("findrum_step_output_rows", "gauge", "Rows in the last step output."),
+        ("findrum_step_output_bytes", "gauge", "Bytes in the last step output."),
+        ("findrum_step_memory_bytes", "gauge", "Traced memory peak above the start of the last execution."),
+    )
+    RUN_METRICS = (
+        ("findrum_pipeline_runs_total", "counter", "Pipeline runs."),
+        ("findrum_pipeline_errors_total", "counter", "Failed pipeline runs."),
+        ("findrum_pipeline_wall_seconds_total", "counter", "Wall time spent in pipeline runs."),
+        ("findrum_pipeline_cpu_seconds_total", "counter", "Process CPU time spent in pipeline runs."),
+        ("findrum_process_peak_rss_bytes", "gauge", "Peak resident set size of the process."),
+    )
+
+    def __init__(self, path: str = None, url: str = None, timeout: float = 5.0):
+        """
+        Args:
+            path (str, optional): File the exposition is written to.
+            url (str, optional): Endpoint the exposition is pushed to.
+            timeout (float): Timeout of the HTTP push in seconds.
+
+        Raises:
+            ValueError: If neither `path` nor `url` is given.
+        """
+        if not path and not url:
+            raise ValueError("Prometheus sink needs a 'path' or a 'url'.")
+        self.path = path
+        self.url = url
+        self.timeout = timeout
+        self._steps = {}
+        self._runs = {}
+        self._rss = None
+        self._lock = threading.Lock()
+
+    def emit(self, record: dict):
+        with self._lock:
+            if record["type"] == "step":
+                self._add_step(record)
+                return
+            self._add_run(record)
+            text = self.render()
+        self._export(text)
+
+    def _add_step(self, record: dict):
+        key = (record["pipeline"], record["step"])
+        values = self._steps.setdefault(key, dict.fromkeys(name for name, _, _ in self.STEP_METRICS))
+        self._increment(values, "findrum_step_runs_total", 1)
+        self._increment(values, "findrum_step_errors_total", 1 if record["error"] else 0)
+        self._increment(values, "findrum_step_cache_hits_total", 1 if record["cached"] else 0)
+        self._increment(values, "findrum_step_wall_seconds_total", record["wall_time"])
+        self._increment(values, "findrum_step_cpu_seconds_total", record["cpu_time"])
+        for name, field in (
+            ("findrum_step_output_rows", "rows"),
+            ("findrum_step_output_bytes", "bytes"),
+            ("findrum_step_memory_bytes", "memory_delta"),
+        ):
+            if record[field] is not None:
+                values[name] = record[field]
+
+    def _add_run(self, record: dict):
+        values = self._runs.setdefault(record["pipeline"], dict.fromkeys(name for name, _, _ in self.RUN_METRICS[:-1]))
+        self._increment(values, "findrum_pipeline_runs_total", 1)
+        self._increment(values, "findrum_pipeline_errors_total", 1 if record["error"] else 0)
+        self._increment(values, "findrum_pipeline_wall_seconds_total", record["wall_time"])
+        self._increment(values, "findrum_pipeline_cpu_seconds_total", record["cpu_time"])
+        if record["peak_rss"] is not None:
+            self._rss = record["peak_rss"]
+
+    @staticmethod
+    def _increment(values: dict, name: str, amount):
+        if amount is not None:
+            values[name] = (values[name] or 0) + amount
+
+    def render(self) -> str:
+        """Render the aggregated metrics in the Prometheus text format.
+
+        Returns:
+            str: The exposition text.
+        """
+        lines = []
+        for name, metric_type, help_text in self.STEP_METRICS:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+            for (pipeline, step), values in sorted(self._steps.items()):
+                if values[name] is not None:
+                    lines.append(f'{name}{{pipeline="{_escape(pipeline)}",step="{_escape(step)}"}} {values[name]}')
+        for name, metric_type, help_text in self.RUN_METRICS:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+            if name == "findrum_process_peak_rss_bytes":
+                if self._rss is not None:
+                    lines.append(f"{name} {self._rss}")
+                continue
+            for pipeline, values in sorted(self._runs.items()):
+                if values[name] is not None:
+                    lines.append(f'{name}{{pipeline="{_escape(pipeline)}"}} {values[name]}')
+        return "\n".join(lines) + "\n"
+
+    def _export(self, text: str):
+        """Write the exposition to the file and/or push it to the endpoint."""
+        if self.path:
+            tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, self.path)
+        if self.url:
+            import urllib.request
+
+            request = urllib.request.Request(
+                self.url, data=text.encode(), method="PUT",
+                headers={"Content-Type": PROMETHEUS_CONTENT_TYPE},
+            )
+            try:
+                urllib.request.urlopen(request, timeout=self.timeout).close()
+            except OSError as e:
+                logger.warning(f"Failed to push metrics to {self.url}: {e}")
+
+    def close(self):
+        pass
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+SINK_TYPES = {
+    "memory": MemorySink,
+    "jsonl": JsonLinesSink,
+    "prometheus": PrometheusSink,
+}
+
+def create_sink(config: dict):
+    """Create a metrics sink from its configuration.
+
+    Args:
+        config (dict): The sink block, with a `type` and its settings.
+
+    Returns:
+        MemorySink | JsonLinesSink | PrometheusSink: The sink.
+
+    Raises:
+        ValueError: If the sink type is unknown.
+    """
+    config = dict(config)
+    sink_type = config.pop("type", None)
+    if sink_type not in SINK_TYPES:
+        raise ValueError(f"Unknown metrics sink '{sink_type}'. Expected one of {tuple(SINK_TYPES)}.")
+    return SINK_TYPES[sink_type](**config)
+
+class StepProbe:
+    """Measures a single step execution. Created by `Instrumentation.start_step`."""
+
+    def __init__(self, instrumentation, pipeline: str, step_id: str, context, measure_cpu: bool):
+        self.instrumentation = instrumentation
+        self.pipeline = pipeline
+        self.step_id = step_id
+        self.context = context
+        self._measure_cpu = measure_cpu
+        self._cpu_start = time.thread_time() if measure_cpu else None
+        self._memory_start = None
+        if instrumentation.trace_memory:
+            tracemalloc.reset_peak()
+            self._memory_start = tracemalloc.get_traced_memory()[0]
+        self._wall_start = time.perf_counter()
+
+    def finish(self, result=None, cached: bool = False, error: BaseException = None, cpu_time: float = None) -> dict:
+        """Record the end of the step and emit its metrics.
+
+        Args:
+            result (Any): The step output.
+            cached (bool): Whether the output came from the step cache.
+            error (BaseException, optional): The error raised by the step.
+            cpu_time (float, optional): CPU time measured elsewhere, e.g. in
+                a worker process. Otherwise measured on the calling thread.
+
+        Returns:
+            dict: The step record.
+        """
+        wall_time = time.perf_counter() - self._wall_start
+        if self._measure_cpu:
+            cpu_time = time.thread_time() - self._cpu_start
+        memory_delta = None
+        if self._memory_start is not None:
+            memory_delta = max(tracemalloc.get_traced_memory()[1] - self._memory_start, 0)
+        rows, size = output_size(result) if error is None else (None, None)
+
+        record = {
+            "type": "step",
+            "pipeline": self.pipeline,
+            "run_id": self.context.run_id,
+            "step": self.step_id,
+            "wall_time": wall_time,
+            "cpu_time": cpu_time,
+            "memory_delta": memory_delta,
+            "peak_rss": peak_rss(),
+            "rows": rows,
+            "bytes": size,
+            "cached": cached,
+            "error": repr(error) if error is not None else None,
+        }
+        self.context.metrics[self.step_id] = record
+        self.instrumentation.emit(record)
+        self.instrumentation.call_hook("on_step_end", record)
+        return record
+
+class RunProbe:
+    """Measures a whole pipeline run. Created by `Instrumentation.start_run`."""
+
+    def __init__(self, instrumentation, pipeline: str, context):
+        self.instrumentation = instrumentation
+        self.pipeline = pipeline
+        self.context = context
+        self._cpu_start = time.process_time()
+        self._wall_start = time.perf_counter()
+
+    def finish(self, error: BaseException = None) -> dict:
+        """Record the end of the run and emit its metrics.
+
+        Args:
+            error (BaseException, optional): The error that failed the run.
+
+        Returns:
+            dict: The run record.
+        """
+        record = {
+            "type": "run",
+            "pipeline": self.pipeline,
+            "run_id": self.context.run_id,
+            "wall_time": time.perf_counter() - self._wall_start,
+            "cpu_time": time.process_time() - self._cpu_start,
+            "steps": len(self.context.metrics),
+            "peak_rss": peak_rss(),
+            "error": repr(error) if error is not None else None,
+        }
+        self.instrumentation.emit(record)
+        return record
+
+class Instrumentation:
+    """Collects per-step and per-run metrics of pipeline executions.
+
+    For every step it records wall time, CPU time, the process peak RSS,
+    output rows and bytes, whether the result came from the cache and, with
+    `trace_memory`, the tracemalloc peak above the memory in use when the
+    step started. Records are stored in the run's `context.metrics` and
+    sent to every sink. `on_step_start(step_id, context)` and
+    `on_step_end(record)` hooks are called around each step; hook errors
+    are logged and ignored.
+
+    CPU time is measured on the thread running the step, or in the worker
+    process for the process executor; it is not measured for async steps,
+    which share the event loop thread. Traced memory is process-wide, so
+    it is only exact when steps do not run concurrently.
+
+    Configured from the `instrumentation` block of a pipeline:
+
+        instrumentation:
+          trace_memory: true
+          sinks:
+            - type: jsonl
+              path: metrics/steps.jsonl
+            - type: prometheus
+              path: metrics/findrum.prom
+    """
+
+    def __init__(self, sinks: list = None, trace_memory: bool = False, on_step_start=None, on_step_end=None):
+        """
+        Args:
+            sinks (list, optional): Sinks receiving the metric records.
+            trace_memory (bool): Whether to trace allocations with tracemalloc.
+                Starts tracing if it is not already on.
+            on_step_start (Callable, optional): Called with the step id and the run context.
+            on_step_end (Callable, optional): Called with the step record.
+        """
+        self.sinks = list(sinks or [])
+        self.trace_memory = trace_memory
+        self.hooks = {"on_step_start": on_step_start, "on_step_end": on_step_end}
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @classmethod
+    def from_config(cls, config: dict):
+        """Create the instrumentation from a pipeline's `instrumentation` block.
+
+        Args:
+            config (dict): The block. `true` records metrics in memory only.
+
+        Returns:
+            Instrumentation: The instrumentation.
+        """
+        config = config if isinstance(config, dict) else {}
+        sinks = [create_sink(sink) for sink in config.get("sinks", [])]
+        return cls(sinks=sinks, trace_memory=config.get("trace_memory", False))
+
+    def start_step(self, pipeline: str, step_id: str, context, measure_cpu: bool = True) -> StepProbe:
+        """Start measuring a step and call the `on_step_start` hook.
+
+        Args:
+            pipeline (str): Name of the pipeline.
+            step_id (str): The step id.
+            context (RunContext): The context of the run.
+            measure_cpu (bool): Whether to measure CPU time on the calling thread.
+
+        Returns:
+            StepProbe: The probe to finish when the step ends.
+        """
+        self.call_hook("on_step_start", step_id, context)
+        return StepProbe(self, pipeline, step_id, context, measure_cpu)
+
+    def start_run(self, pipeline: str, context) -> RunProbe:
+        """Start measuring a pipeline run.
+
+        Args:
+            pipeline (str): Name of the pipeline.
+            context (RunContext): The context of the run.
+
+        Returns:
+            RunProbe: The probe to finish when the run ends.
+        """
+        return RunProbe(self, pipeline, context)
+
+    def emit(self, record: dict):
+        """Send a record to every sink, logging sink errors."""
+        for sink in self.sinks:
+            try:
+                sink.emit(record)
+            except Exception:
+                logger.exception(f"Metrics sink {type(sink).__name__} failed.")
+
+    def call_hook(self, name: str, *args):
+        """Call a hook if it is set, logging its errors."""
+        hook = self.hooks[name]
+        if hook is None:
+            return
+        try:
+            hook(*args)
+        except Exception:
+            logger.exception(f"Instrumentation hook {name} failed.")
+
+    def close(self):
+        """Close every sink."""
+        for sink in self.sinks:
+            sink.close()
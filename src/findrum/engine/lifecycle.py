@@ -0,0 +1,124 @@
+import json
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger("findrum")
+
+def params_key(params: dict) -> str:
+    """Build a stable key from step parameters.
+
+    Args:
+        params (dict): Resolved step parameters.
+
+    Returns:
+        str: The parameters serialized with sorted keys.
+    """
+    return json.dumps(params, sort_keys=True, default=repr)
+
+def create_instance(step_class, params: dict):
+    """Instantiate a step class and call its `setup` method, if any.
+
+    Args:
+        step_class (type): Operator or datasource class.
+        params (dict): Resolved constructor parameters.
+
+    Returns:
+        Any: The ready instance.
+    """
+    instance = step_class(**params)
+    setup = getattr(instance, "setup", None)
+    if callable(setup):
+        setup()
+    return instance
+
+def teardown_instance(instance):
+    """Call the `teardown` method of a step instance, logging its errors."""
+    teardown = getattr(instance, "teardown", None)
+    if not callable(teardown):
+        return
+    try:
+        teardown()
+    except Exception:
+        logger.exception(f"Teardown of {type(instance).__name__} failed.")
+
+class InstancePool:
+    """Step instances reused across runs.
+
+    Instances are keyed by step and parameters, so a run with overridden
+    parameters gets its own instance. Each one is set up once when first
+    requested and torn down by `close`. Reused instances may serve
+    concurrent runs.
+
+    Only the `max_variants` most recently used parameter sets of each step
+    are kept: when a step is requested with one more, the least recently
+    used instance is torn down, so per-run overrides do not pile up.
+    """
+
+    def __init__(self, max_variants: int = 8):
+        """
+        Args:
+            max_variants (int): Instances kept per step, one per parameter set.
+
+        Raises:
+            ValueError: If `max_variants` is lower than 1.
+        """
+        if max_variants < 1:
+            raise ValueError(f"Instance pool max_variants must be at least 1, got {max_variants}.")
+        self.max_variants = max_variants
+        self._instances = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def get(self, step_key: str, step_class, params: dict):
+        """Return the instance of a step, creating and setting it up on first use.
+
+        Args:
+            step_key (str): Identifies the step, e.g. its id.
+            step_class (type): Operator or datasource class.
+            params (dict): Resolved constructor parameters.
+
+        Returns:
+            Any: The instance.
+        """
+        key = params_key(params)
+        variants = self._instances.get(step_key)
+        instance = variants.get(key) if variants is not None else None
+        if instance is not None:
+            if len(variants) > 1:
+                with self._lock:
+                    if key in variants:
+                        variants.move_to_end(key)
+            return instance
+
+        with self._lock:
+            lock = self._locks.setdefault((step_key, key), threading.Lock())
+        with lock:
+            variants = self._instances.get(step_key)
+            instance = variants.get(key) if variants is not None else None
+            if instance is not None:
+                return instance
+            instance = create_instance(step_class, params)
+            with self._lock:
+                variants = self._instances.setdefault(step_key, OrderedDict())
+                variants[key] = instance
+                evicted = []
+                while len(variants) > self.max_variants:
+                    old_key, old_instance = variants.popitem(last=False)
+                    self._locks.pop((step_key, old_key), None)
+                    evicted.append(old_instance)
+        for old_instance in evicted:
+            teardown_instance(old_instance)
+        return instance
+
+    def close(self):
+        """Tear down and forget every instance."""
+        with self._lock:
+            instances, self._instances = self._instances, {}
+            self._locks.clear()
+        for variants in instances.values():
+            for instance in variants.values():
+                teardown_instance(instance)
+
+    def __len__(self) -> int:
+        return sum(len(variants) for variants in self._instances.values())
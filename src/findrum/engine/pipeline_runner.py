@@ -1,84 +1,921 @@
-import yaml
+import os
+import time
+import pickle
+import inspect
 import logging
 from datetime import datetime
+from contextlib import contextmanager
+from multiprocessing.util import Finalize
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
 
-from findrum.registry.registry import get_trigger, get_operator, get_datasource
+from findrum.engine.batching import MicroBatcher
+from findrum.engine.cache import fingerprint, make_cache_key
+from findrum.engine.columnar import INPUT_FORMATS, TRANSPORTS, prepare_input, require_pyarrow, to_columnar
+from findrum.engine.context import RunContext
+from findrum.engine.instrumentation import Instrumentation
+from findrum.engine.lifecycle import InstancePool
+from findrum.engine.plan import PipelinePlan, get_plan
+from findrum.engine.process import get_process_pool, submit_shared
+from findrum.engine.resilience import (
+    POLICY_KEYS, acall_with_policies, call_with_policies, create_retry_policy, run_in_thread, run_with_timeout,
+    wait_future,
+)
+from findrum.engine.state import StepState, filter_delta
+from findrum.engine.streaming import combine_chunks, is_stream_source, run_stream, supports_chunks
+from findrum.registry.registry import get_trigger, get_operator, get_datasource, get_resource
 
 logger = logging.getLogger("findrum")
 
+EXECUTION_MODES = ("sequential", "dag")
+EXECUTOR_TYPES = ("thread", "process")
+
+def _log_step(message: str):
+    """Log a timestamped step message, skipping the formatting when INFO is disabled."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] → {message}")
+
+_WORKER_INSTANCES = InstancePool()
+
+def _call_step(instance, kind: str, input_data=None, state: StepState = None):
+    """Call the entry point of a step instance, passing its state if it has one.
+
+    Returns:
+        Any: What `run` or `fetch` returned, possibly a coroutine.
+    """
+    kwargs = {} if state is None else {"state": state}
+    if kind == "operator":
+        return instance.run(input_data, **kwargs)
+    return instance.fetch(**kwargs)
+
+def _run_instance(instance, kind: str, input_data=None, state: StepState = None):
+    """Execute a step instance.
+
+    Args:
+        instance (Any): Operator or datasource instance.
+        kind (str): Either "operator" or "datasource".
+        input_data (optional): Input passed to operators.
+        state (StepState, optional): State passed to stateful steps.
+
+    Returns:
+        Any: The step output. Coroutines returned by async steps are run
+        to completion on a fresh event loop.
+    """
+    result = _call_step(instance, kind, input_data, state)
+
+    if inspect.iscoroutine(result):
+        import asyncio
+
+        result = asyncio.run(result)
+    return result
+
+def _execute_step(step_class, kind: str, params: dict, input_data=None):
+    """Execute a step in a worker process.
+
+    Defined at module level so it can be submitted to a process pool. Each
+    worker reuses one instance per class and parameters, and tears them
+    down when it exits.
+
+    Args:
+        step_class (type): Operator or datasource class.
+        kind (str): Either "operator" or "datasource".
+        params (dict): Resolved constructor parameters.
+        input_data (optional): Input passed to operators.
+
+    Returns:
+        Any: The step output.
+    """
+    if not len(_WORKER_INSTANCES):
+        Finalize(None, _WORKER_INSTANCES.close, exitpriority=10)
+    key = f"{step_class.__module__}.{step_class.__qualname__}"
+    return _run_instance(_WORKER_INSTANCES.get(key, step_class, params), kind, input_data)
+
+def _timed(func, *args):
+    """Call a function and measure the CPU time it used on the executing thread.
+
+    Returns:
+        tuple: The function's return value and its CPU time in seconds.
+    """
+    started = time.thread_time()
+    result = func(*args)
+    return result, time.thread_time() - started
+
+def _is_async_step(step_class, kind: str) -> bool:
+    """Check whether a step class implements its entry point as a coroutine.
+
+    Args:
+        step_class (type): Operator or datasource class.
+        kind (str): Either "operator" or "datasource".
+
+    Returns:
+        bool: True if `run` (operators) or `fetch` (datasources) is `async def`.
+    """
+    method = getattr(step_class, "run" if kind == "operator" else "fetch", None)
+    return inspect.iscoroutinefunction(method)
+
 class PipelineRunner:
     """Executes a data pipeline defined by a series of steps.
 
     Supports both batch and event-driven execution. Each step in the
     pipeline can be an operator or a datasource, and steps may depend
     on the output of other steps or an external event.
+
+    Steps run one after another in pipeline order by default. In "dag" mode
+    the dependency graph is built from `depends_on` and every step whose
+    dependencies are satisfied runs concurrently on a thread or process pool.
+    The mode can be set in the pipeline's `execution` block:
+
+        execution:
+          mode: dag
+          executor: thread
+          max_workers: 8
+
+    With `streaming: true`, datasources whose `fetch` is a generator are
+    piped chunk by chunk through the chain of chunk-aware operators
+    (`chunked = True`) that directly follows them, with a bounded queue of
+    `queue_size` chunks between stages.
+
+    If the pipeline declares its `outputs`, the result of any other step is
+    dropped from `results` as soon as the last step consuming it has run.
+
+    A step with `executor: process` runs in the worker process pool shared
+    by all runners, so CPU-bound operators are not serialized by the GIL.
+    Its input and output are handed over through shared memory. The step
+    class must be importable by the workers (defined at module level).
+
+    Steps can receive shared resource pools from the registry as
+    constructor arguments with a `resources` block mapping argument names
+    to resource names.
+
+    With `transport: arrow` in the `execution` block, DataFrame outputs are
+    converted once to Arrow tables and each operator gets its own pandas
+    view of them. Operators can limit their input to the columns they need
+    with `input_columns` (a step key or class attribute) and ask for
+    `input_format: arrow` or `numpy` instead of pandas.
+
+    Steps with `state: true` receive a `StepState` as the `state` keyword
+    argument of `fetch` (or `run`), e.g. to remember a watermark between
+    runs. Operators with `delta: <column>` only receive the input rows
+    whose column is greater than the largest value of a previous run.
+    State changes are saved in the plan's state store once the run succeeds.
+
+    With a `checkpoint` block, the output of every step of a batch run is
+    saved to disk as it completes. A failed run can be resumed with
+    `run(resume=run_id)`: completed steps are loaded from their checkpoints
+    and only the failed step and the steps after it run again.
+
+    Steps can be guarded with a `retry` block (`max_attempts`, exponential
+    `backoff` with jitter), a `timeout` in seconds and a `circuit_breaker`
+    (`failures`, `cooldown`) that fails the step fast after consecutive
+    failures. A step that times out stops blocking the run, but its call
+    keeps running in the background until it returns.
+
+    Steps with a `cache` block are memoized: their result is keyed by the
+    step type, resolved parameters and a fingerprint of the input, and a
+    cache hit skips execution. Hit and miss counts are in `cache_stats`.
+
+    With an `instrumentation` block (or an `Instrumentation` passed in),
+    wall time, CPU time, memory and output size are recorded for every step
+    and run, stored in `context.metrics` and sent to the configured sinks.
+
+    Operator and datasource instances are created once per step (and
+    parameter set) and reused across runs; their optional `setup()` is
+    called when they are created and `teardown()` when the runner's plan
+    is closed, e.g. on Platform shutdown.
+
+    Every run gets its own `RunContext` holding its results, parameter
+    overrides and timings, so one runner can serve concurrent runs (e.g.
+    events processed in parallel). `results` and `context` refer to the
+    most recently completed run.
     """
 
-    def __init__(self, pipeline_def: dict):
+    def __init__(self, pipeline_def, mode: str = None, executor: str = None, max_workers: int = None,
+                 streaming: bool = None, instrumentation: Instrumentation = None):
         """Initialize the PipelineRunner with a pipeline definition.
 
         Args:
-            pipeline_def (dict): Parsed YAML dictionary defining the pipeline.
+            pipeline_def (dict | PipelinePlan): Parsed YAML dictionary defining
+                the pipeline, or an already compiled plan to share.
+            mode (str, optional): "sequential" or "dag". Overrides `execution.mode`.
+            executor (str, optional): "thread" or "process" pool used in dag mode.
+                Overrides `execution.executor`.
+            max_workers (int, optional): Pool size used in dag mode.
+                Overrides `execution.max_workers`.
+            streaming (bool, optional): Whether to stream chunked datasources.
+                Overrides `execution.streaming`.
+            instrumentation (Instrumentation, optional): Collects step and run
+                metrics. Overrides the pipeline's `instrumentation` block.
+
+        Raises:
+            ValueError: If the execution settings are invalid, or in dag or
+                streaming mode or with declared outputs, if the dependency graph
+                has missing steps or cycles.
+            ImportError: If the arrow transport is used without pyarrow.
         """
-        self.event_def = pipeline_def.get("event", {})
-        self.pipeline_steps = pipeline_def.get("pipeline", [])
-        self.results = {}
+        if not isinstance(pipeline_def, PipelinePlan):
+            pipeline_def = PipelinePlan(pipeline_def)
+
+        self.plan = pipeline_def
+        self.event_def = self.plan.event_def
+        self.pipeline_steps = self.plan.steps
+        self.context = RunContext()
         self.param_overrides = {}
+        self.instrumentation = instrumentation or self.plan.get_instrumentation()
+
+        execution = self.plan.definition.get("execution", {})
+        self.mode = mode or execution.get("mode", "sequential")
+        self.executor = executor or execution.get("executor", "thread")
+        self.max_workers = max_workers or execution.get("max_workers")
+        self.streaming = execution.get("streaming", False) if streaming is None else streaming
+        self.queue_size = execution.get("queue_size", 8)
+        self.transport = execution.get("transport", "object")
+
+        if self.mode not in EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode '{self.mode}'. Expected one of {EXECUTION_MODES}.")
+        if self.executor not in EXECUTOR_TYPES:
+            raise ValueError(f"Unknown executor '{self.executor}'. Expected one of {EXECUTOR_TYPES}.")
+        if self.streaming and self.mode == "dag" and self.executor == "process":
+            raise ValueError("Streaming is not supported with the process executor.")
+        if self.transport not in TRANSPORTS:
+            raise ValueError(f"Unknown transport '{self.transport}'. Expected one of {TRANSPORTS}.")
+        if self.transport == "arrow":
+            require_pyarrow()
+        for step in self.pipeline_steps:
+            if step.get("executor", "thread") not in EXECUTOR_TYPES:
+                raise ValueError(
+                    f"Unknown executor '{step['executor']}' for step '{step['id']}'. Expected one of {EXECUTOR_TYPES}."
+                )
+            if step.get("resources") and (
+                step.get("executor") == "process" or (self.mode == "dag" and self.executor == "process")
+            ):
+                raise ValueError(f"Step '{step['id']}' uses shared resources and cannot run in a worker process.")
+            if (step.get("state") or step.get("delta")) and (
+                step.get("executor") == "process" or (self.mode == "dag" and self.executor == "process")
+            ):
+                raise ValueError(f"Step '{step['id']}' keeps state and cannot run in a worker process.")
+            if step.get("input_format", "pandas") not in INPUT_FORMATS:
+                raise ValueError(
+                    f"Unknown input format '{step['input_format']}' for step '{step['id']}'. "
+                    f"Expected one of {INPUT_FORMATS}."
+                )
+            if step.get("delta") and not isinstance(step.get("depends_on"), str):
+                raise ValueError(f"Step '{step['id']}' takes a delta and must depend on a single step.")
+            if (step.get("state") or step.get("delta")) and self._state_key(step) is None:
+                raise ValueError(
+                    f"Step '{step['id']}' keeps state in a shared store and needs a state key: "
+                    f"set 'state: {{key: ...}}' on the step or a 'name' on the pipeline."
+                )
+            timeout = step.get("timeout")
+            if timeout is not None and (isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or timeout <= 0):
+                raise ValueError(f"Timeout of step '{step['id']}' must be a positive number of seconds.")
+
+        if self.mode == "dag" or self.streaming or self.plan.outputs is not None:
+            self.plan.get_graph()
+
+    @property
+    def graph(self) -> dict:
+        """dict: Step dependency graph of the pipeline, from the compiled plan."""
+        return self.plan.get_graph()
+
+    @property
+    def results(self) -> dict:
+        """dict: Step results of the most recently completed run."""
+        return self.context.results
+
+    @results.setter
+    def results(self, value: dict):
+        self.context.results = value
+
+    @property
+    def cache_stats(self) -> dict:
+        """dict: Cache hits and misses of every cached step, keyed by step id."""
+        return {
+            step_id: {"hits": cache.hits, "misses": cache.misses}
+            for step_id, cache in self.plan.caches.items()
+        }
+
+    def _new_context(self, run_id: str = None) -> RunContext:
+        """Create the isolated context of a new run.
+
+        Args:
+            run_id (str, optional): Id of the run. Generated by default.
+
+        Returns:
+            RunContext: A context with the current parameter overrides and,
+            if the pipeline declares outputs, its result retention counters.
+        """
+        context = RunContext(self.param_overrides, run_id)
+        context.pending = self._new_retention()
+        return context
+
+    def _start_checkpoints(self, context: RunContext, resume: bool = False):
+        """Enable checkpointing for a batch run, if the pipeline has a `checkpoint` block.
+
+        Args:
+            context (RunContext): The context of the run.
+            resume (bool): Whether the run resumes an earlier run with the same id.
+
+        Raises:
+            ValueError: If resuming a pipeline without checkpoints, or a run
+                that has no checkpoints.
+        """
+        store = self.plan.get_checkpoint_store()
+        if store is None:
+            if resume:
+                raise ValueError(f"Pipeline '{self.plan.name}' has no checkpoint block and cannot be resumed.")
+            return
+
+        context.checkpoints = store
+        if resume:
+            context.checkpointed = frozenset(store.completed(context.run_id))
+            if not context.checkpointed:
+                raise ValueError(f"Run '{context.run_id}' has no checkpoints to resume from.")
+            logger.info(f"Resuming run {context.run_id}: {len(context.checkpointed)} steps checkpointed.")
+
+    def _restore_checkpoint(self, step_id: str, context: RunContext):
+        """Load the checkpointed output of a step into the run's results.
+
+        The state changes the step staged in the failed run are staged
+        again, so they are saved when the resumed run succeeds.
+
+        Returns:
+            Any: The step output.
+        """
+        _log_step(f"Restoring step from checkpoint: {step_id}")
+        result = context.results[step_id] = context.checkpoints.load(context.run_id, step_id)
+        context.timings[step_id] = 0.0
+
+        states = context.checkpoints.load_states(context.run_id, step_id)
+        if states:
+            steps_by_id = {step["id"]: step for step in self.pipeline_steps}
+            for state_step_id, changes in states.items():
+                self._get_step_state(steps_by_id[state_step_id], context).stage(changes)
+        return result
+
+    def _save_checkpoint(self, step_id: str, result, context: RunContext, step_ids: list = None):
+        """Save the output of a step if the run is checkpointed, with the
+        state changes staged by `step_ids` (by default the step itself)."""
+        if context.checkpoints is None:
+            return
+        states = {
+            state_step_id: context.states[state_step_id].changes
+            for state_step_id in step_ids or [step_id]
+            if state_step_id in context.states and context.states[state_step_id].changes
+        }
+        context.checkpoints.save(context.run_id, step_id, result, states)
+
+    def override_params(self, overrides: dict):
+        """Override step parameters for the next runs of this runner.
+
+        Args:
+            overrides (dict): Mapping of step id to the parameters to override.
+        """
+        for step_id, params in overrides.items():
+            self.param_overrides.setdefault(step_id, {}).update(params)
+
+    def _new_retention(self):
+        """Create the consumer counters used to free intermediate results.
+
+        Returns:
+            dict | None: Mapping of step id to the number of consumers still
+            to run, or None if the pipeline does not declare its outputs.
+        """
+        if self.plan.outputs is None:
+            return None
+        return {step_id: len(consumers) for step_id, consumers in self.plan.get_consumers().items()}
+
+    def _release_results(self, step_id: str, context: RunContext):
+        """Drop results that are no longer needed once a step has run.
+
+        Each dependency of the step loses a pending consumer and is removed
+        from the context's results when none remain. The step's own result is
+        removed right away if nothing consumes it. Declared outputs are always kept.
 
-    def _resolve_input(self, step):
+        Args:
+            step_id (str): The step that just finished.
+            context (RunContext): The context of the run.
+        """
+        pending = context.pending
+        if pending is None:
+            return
+
+        for dep in self.plan.get_graph()[step_id]:
+            pending[dep] -= 1
+            if pending[dep] == 0 and dep not in self.plan.outputs:
+                context.results.pop(dep, None)
+
+        if pending[step_id] == 0 and step_id not in self.plan.outputs:
+            context.results.pop(step_id, None)
+
+    def _resolve_input(self, step, context: RunContext):
         """Resolve the input for a given step based on its dependencies.
 
         Args:
             step (dict): The pipeline step definition.
+            context (RunContext): The context of the run.
 
         Returns:
             Any: The resolved input data from dependent steps.
         """
         depends_on = step.get("depends_on")
         if isinstance(depends_on, list):
-            return [self.results.get(dep) for dep in depends_on]
+            return [context.results.get(dep) for dep in depends_on]
         elif depends_on:
-            return self.results.get(depends_on)
+            return context.results.get(depends_on)
         return None
 
-    def _run_step(self, step, input_data=None):
-        """Run a single step in the pipeline.
+    def _prepare_step(self, step, context: RunContext, input_data=None):
+        """Resolve everything needed to execute a step.
 
         Args:
             step (dict): The step definition.
+            context (RunContext): The context of the run.
             input_data (optional): Input data to the step. If not provided, resolved from dependencies.
 
         Returns:
-            Any: The result of executing the step.
+            tuple: The step class, its kind ("operator" or "datasource"),
+            the resolved parameters, the input data (only the delta for steps
+            with a `delta` block) and the state passed to stateful steps.
 
         Raises:
             ValueError: If neither operator nor datasource is defined for the step.
         """
-        step_id = step["id"]
-        operator_type = step.get("operator")
-        datasource_type = step.get("datasource")
-        params = step.get("params", {})
+        if input_data is None:
+            input_data = self._resolve_input(step, context)
 
-        resolved_params = {
-            str(k): self.param_overrides.get(step_id, {}).get(k, v)
-            for k, v in params.items()
-        }
+        step_class, kind = self._get_step_class(step)
+        if kind == "operator":
+            input_data = self._view_input(step, step_class, input_data)
 
-        if input_data is None:
-            input_data = self._resolve_input(step)
+        state = None
+        if step.get("state") or step.get("delta"):
+            state = self._get_step_state(step, context)
+            if step.get("delta"):
+                input_data = self._take_delta(step, input_data, state)
+        return step_class, kind, self._resolve_params(step, context), input_data, state if step.get("state") else None
+
+    def _view_input(self, step, step_class, input_data):
+        """Project an operator's input to the columns it needs, in the format it expects.
+
+        The columns come from the step's `input_columns`, or else the
+        class's `input_columns` attribute; the format from `input_format`.
+
+        Returns:
+            Any: The input as the operator should receive it.
+        """
+        columns = step.get("input_columns") or getattr(step_class, "input_columns", None)
+        input_format = step.get("input_format", "pandas")
+        if not columns and input_format == "pandas" and self.transport == "object":
+            return input_data
+        return prepare_input(input_data, columns, input_format)
+
+    def _to_transport(self, result):
+        """Normalize a step output for the runner's transport."""
+        if self.transport == "arrow":
+            return to_columnar(result)
+        return result
+
+    def _state_key(self, step) -> str:
+        """Return the key the state of a step is stored under.
+
+        The step's `state` block may set a `key`. Otherwise, it is the
+        absolute path of the pipeline file and the step id, so pipelines
+        with the same file name in different directories do not share
+        state. Pipelines defined as dictionaries use their `name`, which is
+        required with the sqlite backend, since its file is shared.
+
+        Returns:
+            str | None: The key, or None if the pipeline needs a name for it.
+        """
+        config = step.get("state")
+        if isinstance(config, dict) and config.get("key"):
+            return config["key"]
+        if self.plan.path:
+            return f"{os.path.abspath(self.plan.path)}:{step['id']}"
+        state_config = self.plan.definition.get("state")
+        backend = state_config.get("backend", "memory") if isinstance(state_config, dict) else "memory"
+        if "name" not in self.plan.definition and backend != "memory":
+            return None
+        return f"{self.plan.name}.{step['id']}"
+
+    def _get_step_state(self, step, context: RunContext) -> StepState:
+        """Load the state of a step for a run. It is saved when the run succeeds.
+
+        The state is stored under `_state_key`.
+
+        Args:
+            step (dict): The step definition.
+            context (RunContext): The context of the run.
+
+        Returns:
+            StepState: The state of the step.
+        """
+        state = StepState(self.plan.get_state_store(), self._state_key(step))
+        context.states[step["id"]] = state
+        return state
+
+    def _take_delta(self, step, input_data, state: StepState):
+        """Keep the input rows newer than those seen by previous runs of the step.
+
+        Args:
+            step (dict): The step definition, with a `delta` column or `{column: ...}` block.
+            input_data (Any): The full input of the step.
+            state (StepState): The state of the step, holding its delta watermark.
+
+        Returns:
+            Any: The new input rows.
+        """
+        column = step["delta"]["column"] if isinstance(step["delta"], dict) else step["delta"]
+        delta, watermark = filter_delta(input_data, column, state.get("delta_watermark"))
+        state.set("delta_watermark", watermark)
+        return delta
+
+    def _commit_state(self, context: RunContext):
+        """Save the state changes of a successful run."""
+        for state in context.states.values():
+            state.commit()
+
+    def _resolve_params(self, step, context: RunContext) -> dict:
+        """Return the parameters of a step with the run's overrides applied
+        and its shared resources injected.
 
-        logger.info(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] → Executing step: {step_id}")
+        Args:
+            step (dict): The step definition.
+            context (RunContext): The context of the run.
+
+        Returns:
+            dict: A fresh dictionary of constructor parameters.
+
+        Raises:
+            ValueError: If a resource is not registered.
+        """
+        params = self.plan.params[step["id"]]
+        overrides = context.param_overrides.get(step["id"])
+        if overrides:
+            params = {k: overrides.get(k, v) for k, v in params.items()}
+        else:
+            params = dict(params)
+
+        for argument, resource in step.get("resources", {}).items():
+            params[argument] = get_resource(resource)
+        return params
+
+    def _get_step_class(self, step):
+        """Resolve the class of a step, caching it in the plan.
+
+        Args:
+            step (dict): The step definition.
+
+        Returns:
+            tuple: The step class and its kind ("operator" or "datasource").
+
+        Raises:
+            ValueError: If neither operator nor datasource is defined for the step.
+        """
+        step_id = step["id"]
+        operator_type = step.get("operator")
+        datasource_type = step.get("datasource")
 
         if operator_type:
-            OperatorClass = get_operator(operator_type)
-            self.results[step_id] = OperatorClass(**resolved_params).run(input_data)
+            kind = "operator"
         elif datasource_type:
-            DataSourceClass = get_datasource(datasource_type)
-            self.results[step_id] = DataSourceClass(**resolved_params).fetch()
+            kind = "datasource"
         else:
             raise ValueError(f"Step '{step_id}' must have either 'operator' or 'datasource'.")
 
-        return self.results[step_id]
+        step_class = self.plan.step_classes.get(step_id)
+        if step_class is None:
+            step_class = get_operator(operator_type) if operator_type else get_datasource(datasource_type)
+            self.plan.step_classes[step_id] = step_class
+        return step_class, kind
+
+    def _check_importable(self, step, step_class):
+        """Check that a step class can be sent to a worker process.
+
+        Raises:
+            ValueError: If the class cannot be pickled by reference.
+        """
+        try:
+            pickle.dumps(step_class)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            raise ValueError(
+                f"Step '{step['id']}' runs in a process, but {step_class.__qualname__} cannot be imported "
+                f"by the workers. Define it at module level in an importable module."
+            ) from e
+
+    def _execute_in_process(self, step, step_class, kind: str, params: dict, input_data, pool=None):
+        """Submit a step to a process pool, handing its data over through shared memory.
+
+        Args:
+            step (dict): The step definition.
+            step_class (type): Operator or datasource class.
+            kind (str): Either "operator" or "datasource".
+            params (dict): Resolved constructor parameters.
+            input_data (Any): The step input.
+            pool (ProcessPoolExecutor, optional): Defaults to the shared pool.
+
+        Returns:
+            Future: Resolves to the step output and its CPU time.
+        """
+        self._check_importable(step, step_class)
+        return submit_shared(_timed, (_execute_step, step_class, kind, params), input_data, pool)
+
+    def _timed_step(self, step, step_class, kind: str, params: dict, input_data, state: StepState = None):
+        """Run a step on the calling thread with the plan's instance, measuring its CPU time."""
+        instance = self.plan.instances.get(step["id"], step_class, params)
+        return _timed(_run_instance, instance, kind, input_data, state)
+
+    def _guarded(self, step, execute, state: StepState = None):
+        """Execute a step under its `retry` policy and circuit breaker.
+
+        Every attempt gets a fork of the step's state, and only the changes
+        of the attempt that succeeds are staged: a failed attempt, or one
+        that timed out and keeps running in the background, leaves no trace.
+
+        Args:
+            step (dict): The step definition.
+            execute (Callable): Executes the step once with the given state,
+                enforcing its timeout.
+            state (StepState, optional): State of a stateful step.
+
+        Returns:
+            Any: What the first successful execution returned.
+        """
+        if not any(key in step for key in POLICY_KEYS):
+            return execute(state)
+
+        def attempt():
+            if state is None:
+                return execute(None)
+            fork = state.fork()
+            result = execute(fork)
+            state.stage(fork.changes)
+            return result
+
+        return call_with_policies(
+            step["id"], attempt, create_retry_policy(step.get("retry")), self.plan.get_circuit_breaker(step)
+        )
+
+    async def _aguarded(self, step, execute, state: StepState = None):
+        """Async version of `_guarded`, where `execute` returns an awaitable."""
+        async def attempt():
+            if state is None:
+                return await execute(None)
+            fork = state.fork()
+            result = await execute(fork)
+            state.stage(fork.changes)
+            return result
+
+        return await acall_with_policies(
+            step["id"], attempt, step.get("timeout"), create_retry_policy(step.get("retry")),
+            self.plan.get_circuit_breaker(step),
+        )
+
+    def _lookup_cache(self, step, params: dict, input_data):
+        """Look up the cached result of a step execution.
+
+        Args:
+            step (dict): The step definition.
+            params (dict): Resolved step parameters.
+            input_data (Any): The step input.
+
+        Returns:
+            tuple: The cache (or None if the step is not cached or its input
+            cannot be fingerprinted), the cache key, whether it was a hit and
+            the cached value.
+        """
+        cache = self.plan.get_cache(step)
+        if cache is None:
+            return None, None, False, None
+
+        input_fingerprint = fingerprint(input_data)
+        if input_fingerprint is None:
+            return None, None, False, None
+
+        key = make_cache_key(step.get("operator") or step.get("datasource"), params, input_fingerprint)
+        hit, value = cache.get(key)
+        if hit:
+            _log_step(f"Cache hit for step: {step['id']}")
+        return cache, key, hit, value
+
+    def _run_step(self, step, input_data=None, context: RunContext = None):
+        """Run a single step in the pipeline.
+
+        Args:
+            step (dict): The step definition.
+            input_data (optional): Input data to the step. If not provided, resolved from dependencies.
+            context (RunContext, optional): The context of the run. Defaults to
+                the runner's current context.
+
+        Returns:
+            Any: The result of executing the step.
+
+        Raises:
+            ValueError: If neither operator nor datasource is defined for the step.
+        """
+        context = context or self.context
+        step_id = step["id"]
+        if step_id in context.checkpointed:
+            return self._restore_checkpoint(step_id, context)
+        step_class, kind, params, input_data, state = self._prepare_step(step, context, input_data)
+
+        in_process = step.get("executor") == "process"
+        timeout = step.get("timeout")
+        probe = self._start_probe(step_id, context, measure_cpu=not in_process and not timeout)
+        started = time.perf_counter()
+        cpu_time = None
+        try:
+            cache, key, hit, result = self._lookup_cache(step, params, input_data)
+            if not hit:
+                _log_step(f"Executing step: {step_id}")
+                if in_process:
+                    result, cpu_time = self._guarded(step, lambda _: wait_future(
+                        step_id, timeout, self._execute_in_process(step, step_class, kind, params, input_data)
+                    ))
+                elif timeout:
+                    result, cpu_time = self._guarded(step, lambda attempt_state: run_with_timeout(
+                        step_id, timeout, self._timed_step, step, step_class, kind, params, input_data, attempt_state
+                    ), state)
+                else:
+                    instance = self.plan.instances.get(step_id, step_class, params)
+                    result = self._guarded(
+                        step, lambda attempt_state: _run_instance(instance, kind, input_data, attempt_state), state
+                    )
+                result = self._to_transport(result)
+                if cache is not None:
+                    cache.set(key, result)
+        except Exception as error:
+            if probe:
+                probe.finish(error=error)
+            raise
+
+        context.results[step_id] = result
+        context.timings[step_id] = time.perf_counter() - started
+        self._save_checkpoint(step_id, result, context)
+        if probe:
+            probe.finish(result, cached=hit, cpu_time=cpu_time)
+        return result
+
+    def _start_probe(self, step_id: str, context: RunContext, measure_cpu: bool = True):
+        """Start measuring a step if the runner is instrumented.
+
+        Returns:
+            StepProbe | None: The probe, or None without instrumentation.
+        """
+        if self.instrumentation is None:
+            return None
+        return self.instrumentation.start_step(self.plan.name, step_id, context, measure_cpu)
+
+    def _get_stream_segments(self) -> dict:
+        """Group streaming datasources with the chunk-aware operators that follow them.
+
+        A segment starts at a datasource whose `fetch` is a generator and
+        extends through each operator that is the only consumer of the
+        previous step, depends on it alone and declares `chunked = True`.
+        Operators with their own `retry`, `timeout` or `circuit_breaker` end
+        the segment.
+
+        Returns:
+            dict: Mapping of the first step id of each segment to the step ids in the segment.
+        """
+        steps_by_id = {step["id"]: step for step in self.pipeline_steps}
+        consumers = self.plan.get_consumers()
+        segments = {}
+
+        for step in self.pipeline_steps:
+            if not step.get("datasource") or not is_stream_source(self._get_step_class(step)[0]):
+                continue
+
+            chain = [step["id"]]
+            while len(consumers[chain[-1]]) == 1:
+                next_step = steps_by_id[consumers[chain[-1]][0]]
+                if next_step.get("depends_on") != chain[-1] or not next_step.get("operator"):
+                    break
+                if next_step.get("executor") == "process" or next_step.get("state") or next_step.get("delta"):
+                    break
+                if any(key in next_step for key in POLICY_KEYS):
+                    break
+                if not supports_chunks(self._get_step_class(next_step)[0]):
+                    break
+                chain.append(next_step["id"])
+            segments[step["id"]] = chain
+
+        return segments
+
+    def _run_stream_segment(self, chain: list, context: RunContext):
+        """Stream chunks from a datasource through a chain of chunk-aware operators.
+
+        Only the output of the last step in the chain is materialized and
+        stored in the context's results. The `retry`, `timeout` and
+        `circuit_breaker` of the datasource apply to the whole segment.
+
+        Args:
+            chain (list): Step ids of the segment, starting with the datasource.
+            context (RunContext): The context of the run.
+
+        Returns:
+            Any: The combined output of the last step.
+        """
+        if chain[-1] in context.checkpointed:
+            return self._restore_checkpoint(chain[-1], context)
+
+        steps_by_id = {step["id"]: step for step in self.pipeline_steps}
+        stages = []
+        for step_id in chain:
+            step = steps_by_id[step_id]
+            step_class, _ = self._get_step_class(step)
+            stages.append(self.plan.instances.get(step_id, step_class, self._resolve_params(step, context)))
+
+        head = steps_by_id[chain[0]]
+        state = self._get_step_state(head, context) if head.get("state") else None
+
+        _log_step(f"Streaming steps: {' → '.join(chain)}")
+
+        probe = self._start_probe(chain[-1], context, measure_cpu=False)
+        started = time.perf_counter()
+        try:
+            def stream(attempt_state):
+                chunks = run_stream(_call_step(stages[0], "datasource", state=attempt_state), [operator.run for operator in stages[1:]], self.queue_size)
+                return combine_chunks(chunks)
+
+            timeout = head.get("timeout")
+            execute = stream
+            if timeout:
+                def execute(attempt_state):
+                    return run_with_timeout(chain[0], timeout, stream, attempt_state)
+            result = self._guarded(head, execute, state)
+            result = self._to_transport(result)
+        except Exception as error:
+            if probe:
+                probe.finish(error=error)
+            raise
+
+        context.results[chain[-1]] = result
+        context.timings[chain[-1]] = time.perf_counter() - started
+        self._save_checkpoint(chain[-1], result, context, chain)
+        if probe:
+            probe.finish(result)
+        return result
+
+    async def _arun_step(self, step, context: RunContext, input_data=None):
+        """Run a single step on the running event loop.
+
+        Async steps are awaited directly. Sync steps are run in the loop's
+        default thread executor so they do not block other steps. CPU time
+        is only recorded for sync steps.
+
+        Args:
+            step (dict): The step definition.
+            context (RunContext): The context of the run.
+            input_data (optional): Input data to the step. If not provided, resolved from dependencies.
+
+        Returns:
+            Any: The result of executing the step.
+
+        Raises:
+            ValueError: If neither operator nor datasource is defined for the step.
+        """
+        import asyncio
+
+        step_id = step["id"]
+        if step_id in context.checkpointed:
+            return self._restore_checkpoint(step_id, context)
+        step_class, kind, params, input_data, state = self._prepare_step(step, context, input_data)
+
+        probe = self._start_probe(step_id, context, measure_cpu=False)
+        started = time.perf_counter()
+        cpu_time = None
+        try:
+            cache, key, hit, result = self._lookup_cache(step, params, input_data)
+            if not hit:
+                _log_step(f"Executing step: {step_id}")
+                if step.get("executor") == "process":
+                    result, cpu_time = await self._aguarded(step, lambda _: asyncio.wrap_future(
+                        self._execute_in_process(step, step_class, kind, params, input_data)
+                    ))
+                elif _is_async_step(step_class, kind):
+                    instance = self.plan.instances.get(step_id, step_class, params)
+                    result = await self._aguarded(
+                        step, lambda attempt_state: _call_step(instance, kind, input_data, attempt_state), state
+                    )
+                else:
+                    loop = asyncio.get_running_loop()
+                    result, cpu_time = await self._aguarded(step, lambda attempt_state: loop.run_in_executor(
+                        None, self._timed_step, step, step_class, kind, params, input_data, attempt_state
+                    ), state)
+                result = self._to_transport(result)
+                if cache is not None:
+                    cache.set(key, result)
+        except Exception as error:
+            if probe:
+                probe.finish(error=error)
+            raise
+
+        context.results[step_id] = result
+        context.timings[step_id] = time.perf_counter() - started
+        self._save_checkpoint(step_id, result, context)
+        if probe:
+            probe.finish(result, cached=hit, cpu_time=cpu_time)
+        return result
 
     def _should_use_event(self) -> bool:
         """Check whether the pipeline should be triggered by an event.
@@ -89,74 +926,402 @@ class PipelineRunner:
         trigger_type = self.event_def.get("type")
         return any(step.get("depends_on") == trigger_type for step in self.pipeline_steps)
 
-    def _execute_pipeline_with_data(self, data):
+    def _execute_pipeline_with_data(self, data, context: RunContext):
         """Execute steps that depend on an event, followed by others.
 
         Args:
             data (Any): The data passed from the event trigger.
+            context (RunContext): The context of the run.
         """
+        if self.mode == "dag":
+            self._run_dag_pipeline(context, event_data=data)
+            return
+
         executed_steps = set()
         trigger_type = self.event_def.get("type")
 
         for step in self.pipeline_steps:
             if step.get("depends_on") == trigger_type:
-                self._run_step(step, input_data=data)
+                self._run_step(step, input_data=data, context=context)
+                self._release_results(step["id"], context)
                 executed_steps.add(step["id"])
 
         for step in self.pipeline_steps:
             if step["id"] not in executed_steps:
-                self._run_step(step)
+                self._run_step(step, context=context)
+                self._release_results(step["id"], context)
 
     def _run_event_trigger(self):
-        """Set up and start the event trigger to run the pipeline on event."""
+        """Set up and start the event trigger to run the pipeline on event.
+
+        If the event block has a `batch` section, emitted events are
+        coalesced and the pipeline runs once per batch.
+        """
         trigger_type = self.event_def["type"]
         config = self.event_def.get("config", {})
         TriggerClass = get_trigger(trigger_type)
         trigger_instance = TriggerClass(**config)
 
-        def emit(data):
-            self._execute_pipeline_with_data(data)
+        if "batch" in self.event_def:
+            batcher = MicroBatcher(self.run_with_data, name=trigger_type, **self.event_def["batch"])
+            emit = batcher.add
+        else:
+            def emit(data):
+                self.run_with_data(data)
 
         trigger_instance.emit = emit
         trigger_instance.start()
 
-    def _run_batch_pipeline(self):
-        """Run all pipeline steps sequentially in batch mode."""
+    def _run_batch_pipeline(self, context: RunContext):
+        """Run all pipeline steps in batch mode.
+
+        Steps run sequentially in pipeline order, or through the DAG
+        scheduler when the runner is in "dag" mode.
+
+        Args:
+            context (RunContext): The context of the run.
+        """
+        if self.mode == "dag":
+            self._run_dag_pipeline(context)
+            return
+
+        segments = self._get_stream_segments() if self.streaming else {}
+        streamed = {step_id for chain in segments.values() for step_id in chain[1:]}
+
         for step in self.pipeline_steps:
-            self._run_step(step)
+            if step["id"] in segments:
+                self._run_stream_segment(segments[step["id"]], context)
+                for step_id in segments[step["id"]]:
+                    self._release_results(step_id, context)
+            elif step["id"] not in streamed:
+                self._run_step(step, context=context)
+                self._release_results(step["id"], context)
+
+    def _create_executor(self):
+        """Create the pool used to run ready steps in dag mode.
+
+        Process steps go to the process pool shared by every run, like
+        steps with `executor: process`, instead of starting workers per run.
+
+        Returns:
+            Executor: A new thread pool, or the shared process pool.
+        """
+        if self.executor == "process":
+            return get_process_pool(self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="findrum-step")
+
+    def _submit_step(self, pool, step, context: RunContext, input_data=None):
+        """Submit a single step to the pool.
+
+        Thread pools run the full `_run_step`. Process pools only receive the
+        resolved class, parameters and input, through shared memory like steps
+        with `executor: process`; the returned future resolves to
+        the step output once it has been cached and measured, and the result
+        is stored by the caller.
+
+        Args:
+            pool (Executor): The pool to submit to.
+            step (dict): The step definition.
+            context (RunContext): The context of the run.
+            input_data (optional): Input data to the step.
+
+        Returns:
+            Future: The future of the step execution.
+        """
+        if self.executor != "process":
+            return pool.submit(self._run_step, step, input_data, context)
+
+        future = Future()
+        if step["id"] in context.checkpointed:
+            future.set_result(self._restore_checkpoint(step["id"], context))
+            return future
+
+        step_class, kind, params, input_data, _ = self._prepare_step(step, context, input_data)
+        probe = self._start_probe(step["id"], context, measure_cpu=False)
+        cache, key, hit, result = self._lookup_cache(step, params, input_data)
+        if hit:
+            self._save_checkpoint(step["id"], result, context)
+            future.set_result(result)
+            if probe:
+                probe.finish(result, cached=True)
+            return future
+
+        def done(execution):
+            try:
+                result, cpu_time = execution.result()
+            except BaseException as error:
+                if probe:
+                    probe.finish(error=error)
+                future.set_exception(error)
+                return
+            try:
+                result = self._to_transport(result)
+                if cache is not None:
+                    cache.set(key, result)
+                self._save_checkpoint(step["id"], result, context)
+            except BaseException as error:
+                future.set_exception(error)
+                return
+            if probe:
+                probe.finish(result, cpu_time=cpu_time)
+            future.set_result(result)
 
-    def run(self):
+        _log_step(f"Executing step: {step['id']}")
+        if any(key in step for key in POLICY_KEYS):
+            execution = run_in_thread(step["id"], self._guarded, step, lambda _: wait_future(
+                step["id"], step.get("timeout"), self._execute_in_process(step, step_class, kind, params, input_data, pool)
+            ))
+        else:
+            execution = self._execute_in_process(step, step_class, kind, params, input_data, pool)
+        execution.add_done_callback(done)
+        return future
+
+    def _run_dag_pipeline(self, context: RunContext, event_data=None):
+        """Run the pipeline as a DAG, executing independent steps concurrently.
+
+        A step is submitted to the pool as soon as all of its dependencies
+        have finished. Its output is stored in the context's results when it
+        completes, and inputs no longer needed are released from the
+        scheduling thread. If a step fails, pending steps are cancelled and
+        the error is raised without waiting for the steps still running.
+
+        Args:
+            context (RunContext): The context of the run.
+            event_data (optional): Data from the event trigger, passed to the
+                steps that depend directly on the trigger type.
+        """
+        trigger_type = self.event_def.get("type")
+        steps_by_id = {step["id"]: step for step in self.pipeline_steps}
+        consumers = self.plan.get_consumers()
+        remaining = {step_id: set(deps) for step_id, deps in self.graph.items()}
+        segments = self._get_stream_segments() if self.streaming else {}
+        segments_by_tail = {chain[-1]: chain for chain in segments.values()}
+        submitted_at = {}
+
+        pool = self._create_executor()
+        futures = {}
+
+        def submit(step_id):
+            submitted_at[step_id] = time.perf_counter()
+            if step_id in segments:
+                futures[pool.submit(self._run_stream_segment, segments[step_id], context)] = segments[step_id][-1]
+                return
+            step = steps_by_id[step_id]
+            input_data = event_data if trigger_type and step.get("depends_on") == trigger_type else None
+            futures[self._submit_step(pool, step, context, input_data)] = step_id
+
+        try:
+            for step_id, deps in remaining.items():
+                if not deps:
+                    submit(step_id)
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step_id = futures.pop(future)
+                    context.results[step_id] = future.result()
+                    if step_id not in context.timings:
+                        context.timings[step_id] = time.perf_counter() - submitted_at[step_id]
+                    for finished in segments_by_tail.get(step_id, [step_id]):
+                        self._release_results(finished, context)
+                    for consumer in consumers[step_id]:
+                        remaining[consumer].discard(step_id)
+                        if not remaining[consumer]:
+                            submit(consumer)
+        except BaseException:
+            # Steps still running (e.g. one that timed out) are not waited for.
+            if self.executor == "process":
+                for future in futures:
+                    future.cancel()
+            else:
+                pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        if self.executor != "process":
+            pool.shutdown(wait=True)
+
+    def run(self, resume: str = None):
         """Run the pipeline either in event or batch mode.
 
+        Args:
+            resume (str, optional): Id of a failed batch run to resume from
+                its checkpoints. Requires a `checkpoint` block.
+
         Returns:
             dict: Results from all executed steps.
+
+        Raises:
+            ValueError: If `resume` is given but there is nothing to resume.
         """
         if self.event_def and self._should_use_event():
             self._run_event_trigger()
-        else:
-            self._run_batch_pipeline()
+            return self.results
+
+        context = self._new_context(resume)
+        self._start_checkpoints(context, resume=resume is not None)
+        with self._checkpointed(context):
+            self._measure_run(context, self._run_batch_pipeline, context)
+        self.context = context
+        return context.results
 
-        return self.results
+    @contextmanager
+    def _checkpointed(self, context: RunContext):
+        """Drop the checkpoints of a run once it succeeds, unless they are kept.
+
+        On failure, the run id to resume from is logged and added as a note
+        to the exception.
+        """
+        try:
+            yield
+        except Exception as error:
+            if context.checkpoints is not None:
+                error.add_note(f"Completed steps are checkpointed; resume with run id {context.run_id}.")
+                logger.error(f"Run {context.run_id} of '{self.plan.name}' failed. "
+                             f"Completed steps are checkpointed; resume with run id {context.run_id}.")
+            raise
+        if context.checkpoints is not None and not context.checkpoints.keep:
+            context.checkpoints.clear(context.run_id)
 
     def run_with_data(self, data):
         """Run the pipeline using external input data (used for triggers).
 
+        Each call runs in its own context, so it is safe to call from several
+        threads at once.
+
         Args:
             data (Any): Data injected into the pipeline.
 
         Returns:
             dict: Results from all executed steps.
         """
-        return self.results
+        context = self._new_context()
+        self._measure_run(context, self._execute_pipeline_with_data, data, context)
+        self.context = context
+        return context.results
 
-    def run_with_data(self, data):
-        self._execute_pipeline_with_data(data)
-        return self.results
+    def _measure_run(self, context: RunContext, execute, *args):
+        """Call `execute(*args)`, recording run metrics if the runner is
+        instrumented, and save the step state once it succeeded.
+
+        Args:
+            context (RunContext): The context of the run.
+            execute (Callable): Executes the pipeline.
+        """
+        if self.instrumentation is None:
+            execute(*args)
+            self._commit_state(context)
+            return
+
+        probe = self.instrumentation.start_run(self.plan.name, context)
+        try:
+            execute(*args)
+        except Exception as error:
+            probe.finish(error=error)
+            raise
+        self._commit_state(context)
+        probe.finish()
+
+    async def _ameasure_run(self, context: RunContext, event_data=None):
+        """Async counterpart of `_measure_run` around `_arun_pipeline`."""
+        if self.instrumentation is None:
+            await self._arun_pipeline(context, event_data)
+            self._commit_state(context)
+            return
+
+        probe = self.instrumentation.start_run(self.plan.name, context)
+        try:
+            await self._arun_pipeline(context, event_data)
+        except Exception as error:
+            probe.finish(error=error)
+            raise
+        self._commit_state(context)
+        probe.finish()
+
+    async def _arun_pipeline(self, context: RunContext, event_data=None):
+        """Run all steps as tasks on the running event loop.
+
+        Each step waits for the tasks of its dependencies, so independent
+        steps run concurrently regardless of the execution mode. If a step
+        fails, the remaining tasks are cancelled and the error is raised.
+
+        Args:
+            context (RunContext): The context of the run.
+            event_data (optional): Data from the event trigger, passed to the
+                steps that depend directly on the trigger type.
+        """
+        import asyncio
+
+        graph = self.plan.get_graph()
+        order = self.plan.get_order()
+        trigger_type = self.event_def.get("type")
+        steps_by_id = {step["id"]: step for step in self.pipeline_steps}
+        tasks = {}
+
+        async def run(step_id):
+            await asyncio.gather(*(tasks[dep] for dep in graph[step_id]))
+            step = steps_by_id[step_id]
+            input_data = event_data if trigger_type and step.get("depends_on") == trigger_type else None
+            await self._arun_step(step, context, input_data)
+            self._release_results(step_id, context)
+
+        for step_id in order:
+            tasks[step_id] = asyncio.ensure_future(run(step_id))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+    async def arun(self, resume: str = None):
+        """Run the pipeline in batch mode on the running event loop.
+
+        Async operators and datasources (`async def run` / `async def fetch`)
+        are awaited concurrently; sync steps fall back to a thread executor.
+
+        Args:
+            resume (str, optional): Id of a failed run to resume from its checkpoints.
+
+        Returns:
+            dict: Results from all executed steps.
+
+        Raises:
+            ValueError: If `resume` is given but there is nothing to resume.
+        """
+        context = self._new_context(resume)
+        self._start_checkpoints(context, resume=resume is not None)
+        with self._checkpointed(context):
+            await self._ameasure_run(context)
+        self.context = context
+        return context.results
+
+    async def arun_with_data(self, data):
+        """Async counterpart of `run_with_data`.
+
+        Args:
+            data (Any): Data injected into the pipeline.
+
+        Returns:
+            dict: Results from all executed steps.
+        """
+        context = self._new_context()
+        await self._ameasure_run(context, event_data=data)
+        self.context = context
+        return context.results
+
+    def close(self):
+        """Tear down the operator and datasource instances of the runner's plan."""
+        self.plan.close()
 
     @classmethod
     def from_yaml(cls, path: str):
         """Create a PipelineRunner from a YAML file.
 
+        The compiled pipeline plan is cached per path and only re-parsed when
+        the file changes, so repeated calls (e.g. on every scheduler tick)
+        skip YAML parsing and registry lookups.
+
         Args:
             path (str): Path to the YAML pipeline file.
 
@@ -166,10 +1331,4 @@ class PipelineRunner:
         Raises:
             ValueError: If the YAML file is not valid or does not contain a dictionary.
         """
-        with open(path, "r") as f:
-            config = yaml.safe_load(f)
-
-        if not isinstance(config, dict):
-            raise ValueError(f"{path} must contain a valid dictionary with pipeline definition.")
-
-        return cls(config)
\ No newline at end of file
+        return cls(get_plan(path))
\ No newline at end of file
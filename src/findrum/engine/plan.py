@@ -0,0 +1,374 @@
+import os
+import hashlib
+import threading
+
+from findrum.engine.cache import create_cache
+from findrum.engine.checkpoint import create_checkpoint_store
+from findrum.engine.dag import build_graph, get_consumers, topological_order
+from findrum.engine.instrumentation import Instrumentation
+from findrum.engine.lifecycle import InstancePool
+from findrum.engine.resilience import create_circuit_breaker
+from findrum.engine.state import create_state_store
+from findrum.loader.yaml_loader import parse_yaml
+
+_PLAN_CACHE = {}
+_PLAN_CACHE_LOCK = threading.Lock()
+# Last plan replaced per path, closed once it is replaced again or by `close_plans`.
+_REPLACED_PLANS = {}
+
+class PipelinePlan:
+    """Compiled form of a pipeline definition.
+
+    A plan holds everything about a pipeline that does not change between
+    runs: the parsed definition, the dependency graph and its topological
+    order, the normalized parameters of every step, the declared output
+    steps, the operator and datasource classes once they have been
+    resolved from the registry, the step instances reused across runs, the
+    result caches of cached steps, the circuit breakers of guarded steps,
+    the instrumentation configured for
+    the pipeline, the store holding the state of stateful steps and the
+    checkpoint store of batch runs.
+    Plans are shared by every runner created for the same pipeline and must
+    not be mutated by a run.
+
+    Attributes:
+        owned (bool): Whether an owner such as the Platform closes the plan.
+            The plan cache then does not close it when the file changes.
+    """
+
+    def __init__(self, pipeline_def: dict, path: str = None):
+        """Compile a pipeline definition.
+
+        Args:
+            pipeline_def (dict): Parsed YAML dictionary defining the pipeline.
+            path (str, optional): Path of the YAML file the plan was loaded from.
+
+        Raises:
+            ValueError: If `outputs` references a step that does not exist.
+        """
+        self.definition = pipeline_def
+        self.path = path
+        self.name = os.path.splitext(os.path.basename(path))[0] if path else pipeline_def.get("name", "pipeline")
+        self.event_def = pipeline_def.get("event", {})
+        self.steps = pipeline_def.get("pipeline", [])
+        self.params = {
+            step["id"]: {str(k): v for k, v in step.get("params", {}).items()}
+            for step in self.steps
+        }
+        self.outputs = self._read_outputs(pipeline_def.get("outputs"))
+        self.step_classes = {}
+        self.instances = InstancePool()
+        self.caches = {}
+        self.breakers = {}
+        self.owned = False
+        self._instrumentation = None
+        self._state_store = None
+        self._checkpoints = None
+        self._graph = None
+        self._order = None
+        self._consumers = None
+        self._lock = threading.Lock()
+
+    def _read_outputs(self, outputs):
+        """Normalize the `outputs` block of the pipeline.
+
+        Args:
+            outputs (str | list | None): Declared output step ids.
+
+        Returns:
+            frozenset | None: The output step ids, or None if not declared.
+
+        Raises:
+            ValueError: If an output is not a step of the pipeline.
+        """
+        if outputs is None:
+            return None
+        if isinstance(outputs, str):
+            outputs = [outputs]
+
+        step_ids = {step["id"] for step in self.steps}
+        for output in outputs:
+            if output not in step_ids:
+                raise ValueError(f"Output '{output}' is not a step of the pipeline.")
+        return frozenset(outputs)
+
+    def get_graph(self) -> dict:
+        """Return the dependency graph, with the event trigger treated as external.
+
+        Returns:
+            dict: Mapping of step id to the step ids it depends on.
+
+        Raises:
+            ValueError: If a dependency is missing or the graph has a cycle.
+        """
+        if self._graph is None:
+            trigger_type = self.event_def.get("type")
+            graph = build_graph(self.steps, external=[trigger_type] if trigger_type else [])
+            self._order = topological_order(graph)
+            self._graph = graph
+        return self._graph
+
+    def get_order(self) -> list:
+        """Return the step ids in topological order.
+
+        Returns:
+            list: Step ids, each one after all of its dependencies.
+
+        Raises:
+            ValueError: If a dependency is missing or the graph has a cycle.
+        """
+        self.get_graph()
+        return self._order
+
+    def get_consumers(self) -> dict:
+        """Return, for each step, the steps that consume its output.
+
+        Returns:
+            dict: Mapping of step id to consumer step ids.
+
+        Raises:
+            ValueError: If a dependency is missing or the graph has a cycle.
+        """
+        if self._consumers is None:
+            self._consumers = get_consumers(self.get_graph())
+        return self._consumers
+
+    def get_cache(self, step: dict):
+        """Return the result cache of a step, creating it on first use.
+
+        Args:
+            step (dict): The step definition.
+
+        Returns:
+            MemoryCache | DiskCache | None: The cache, or None if the step has no `cache` block.
+
+        Raises:
+            ValueError: If the cache backend is unknown.
+        """
+        config = step.get("cache")
+        if not config:
+            return None
+
+        cache = self.caches.get(step["id"])
+        if cache is None:
+            with self._lock:
+                cache = self.caches.get(step["id"])
+                if cache is None:
+                    cache = self.caches[step["id"]] = create_cache(config)
+        return cache
+
+    def get_circuit_breaker(self, step: dict):
+        """Return the circuit breaker of a step, creating it on first use.
+
+        Args:
+            step (dict): The step definition.
+
+        Returns:
+            CircuitBreaker | None: The breaker, or None if the step has no `circuit_breaker` block.
+        """
+        config = step.get("circuit_breaker")
+        if not config:
+            return None
+
+        breaker = self.breakers.get(step["id"])
+        if breaker is None:
+            with self._lock:
+                breaker = self.breakers.get(step["id"])
+                if breaker is None:
+                    breaker = self.breakers[step["id"]] = create_circuit_breaker(step["id"], config)
+        return breaker
+
+    def get_instrumentation(self):
+        """Return the instrumentation of the pipeline, creating it on first use.
+
+        Returns:
+            Instrumentation | None: The instrumentation, or None if the
+            pipeline has no `instrumentation` block.
+
+        Raises:
+            ValueError: If a metrics sink type is unknown.
+        """
+        config = self.definition.get("instrumentation")
+        if not config:
+            return None
+
+        if self._instrumentation is None:
+            with self._lock:
+                if self._instrumentation is None:
+                    self._instrumentation = Instrumentation.from_config(config)
+        return self._instrumentation
+
+    def get_state_store(self):
+        """Return the store of step state, creating it on first use.
+
+        Configured by the pipeline's `state` block; without one, state is
+        kept in memory.
+
+        Returns:
+            MemoryStateStore | SQLiteStateStore: The state store.
+
+        Raises:
+            ValueError: If the state backend is unknown.
+        """
+        if self._state_store is None:
+            with self._lock:
+                if self._state_store is None:
+                    self._state_store = create_state_store(self.definition.get("state"))
+        return self._state_store
+
+    def get_checkpoint_store(self):
+        """Return the checkpoint store of the pipeline, creating it on first use.
+
+        Returns:
+            CheckpointStore | None: The store, or None if the pipeline has no
+            `checkpoint` block.
+        """
+        config = self.definition.get("checkpoint")
+        if not config:
+            return None
+
+        if self._checkpoints is None:
+            with self._lock:
+                if self._checkpoints is None:
+                    self._checkpoints = create_checkpoint_store(config)
+        return self._checkpoints
+
+    def take_over(self, previous, reuse_instances: bool = True):
+        """Move the runtime state of the previous plan of the same pipeline to this one.
+
+        The state store is moved if the `state` block did not change, so
+        watermarks survive the change, and so are the circuit breakers of
+        steps whose `circuit_breaker` block did not change. With
+        `reuse_instances`, the step instances and the result caches of steps
+        whose `cache` block did not change are moved too. The previous plan
+        gets this plan's unused ones in exchange, so closing it only
+        releases what was not moved.
+
+        Args:
+            previous (PipelinePlan): The plan this one replaces.
+            reuse_instances (bool): Whether to move instances and caches.
+        """
+        previous_steps = {step["id"]: step for step in previous.steps}
+
+        def unchanged(step, key):
+            return step["id"] in previous_steps and previous_steps[step["id"]].get(key) == step.get(key)
+
+        with previous._lock, self._lock:
+            if previous.definition.get("state") == self.definition.get("state"):
+                self._state_store, previous._state_store = previous._state_store, self._state_store
+            for step in self.steps:
+                if step["id"] in previous.breakers and unchanged(step, "circuit_breaker"):
+                    self.breakers[step["id"]] = previous.breakers.pop(step["id"])
+                if reuse_instances and step["id"] in previous.caches and unchanged(step, "cache"):
+                    self.caches[step["id"]] = previous.caches.pop(step["id"])
+            if reuse_instances:
+                self.instances, previous.instances = previous.instances, self.instances
+
+    def close(self):
+        """Tear down the step instances of the plan and close its state store and metrics sinks.
+
+        They are created again if the plan runs afterwards.
+        """
+        self.instances.close()
+        with self._lock:
+            store, self._state_store = self._state_store, None
+            instrumentation, self._instrumentation = self._instrumentation, None
+        if store is not None:
+            store.close()
+        if instrumentation is not None:
+            instrumentation.close()
+
+def _read_plan(path: str, content: bytes, digest: str = None) -> PipelinePlan:
+    """Parse YAML content into a plan.
+
+    Args:
+        path (str): Path of the file the content was read from.
+        content (bytes): Raw file content.
+        digest (str, optional): SHA-256 hex digest of the content.
+
+    Returns:
+        PipelinePlan: The compiled plan.
+
+    Raises:
+        ValueError: If the content is not a dictionary.
+    """
+    config = parse_yaml(content, digest)
+
+    if not isinstance(config, dict):
+        raise ValueError(f"{path} must contain a valid dictionary with pipeline definition.")
+
+    return PipelinePlan(config, path=path)
+
+def get_plan(path: str) -> PipelinePlan:
+    """Return the compiled plan for a pipeline file, using the plan cache.
+
+    Plans are cached per absolute path. A cached plan is reused while the
+    file's modification time and size are unchanged. If they changed but the
+    content hash did not (e.g. the file was touched), the plan is kept too.
+    Otherwise the file is parsed and compiled again.
+
+    A replaced plan is not closed right away, since runs started from it
+    may still be going: it is closed when the file changes once more,
+    unless it is `owned`, or by `close_plans`.
+
+    Args:
+        path (str): Path to the YAML pipeline file.
+
+    Returns:
+        PipelinePlan: The compiled plan.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the YAML file does not contain a dictionary.
+    """
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _PLAN_CACHE_LOCK:
+        entry = _PLAN_CACHE.get(key)
+    if entry and entry[0] == signature:
+        return entry[2]
+
+    with open(key, "rb") as f:
+        content = f.read()
+    digest = hashlib.sha256(content).hexdigest()
+
+    if entry and entry[1] == digest:
+        plan = entry[2]
+    else:
+        plan = _read_plan(path, content, digest)
+
+    retired = None
+    with _PLAN_CACHE_LOCK:
+        current = _PLAN_CACHE.get(key)
+        _PLAN_CACHE[key] = (signature, digest, plan)
+        if current is not None and current[2] is not plan:
+            retired = _REPLACED_PLANS.get(key)
+            _REPLACED_PLANS[key] = current[2]
+    if retired is not None and not retired.owned:
+        retired.close()
+    return plan
+
+def invalidate_plan(path: str):
+    """Drop the cached plan of a pipeline file, if any.
+
+    Args:
+        path (str): Path to the YAML pipeline file.
+    """
+    with _PLAN_CACHE_LOCK:
+        _PLAN_CACHE.pop(os.path.abspath(path), None)
+
+def close_plans():
+    """Tear down the step instances of every cached plan, and of the plans they replaced."""
+    with _PLAN_CACHE_LOCK:
+        plans = [entry[2] for entry in _PLAN_CACHE.values()] + list(_REPLACED_PLANS.values())
+        _REPLACED_PLANS.clear()
+    for plan in plans:
+        plan.close()
+
+def clear_plan_cache():
+    """Drop every cached plan."""
+    with _PLAN_CACHE_LOCK:
+        _PLAN_CACHE.clear()
+        _REPLACED_PLANS.clear()
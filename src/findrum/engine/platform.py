@@ -1,14 +1,24 @@
 import os
+import glob
 import time
-import yaml
 import json
 import hashlib
 import logging
-from apscheduler.schedulers.blocking import BlockingScheduler
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from findrum.loader.load_extensions import load_extensions
+from findrum.loader.load_extensions import (
+    extension_modules, load_extensions, preload_pipeline, reload_extension_modules,
+)
 from findrum.engine.pipeline_runner import PipelineRunner
-from findrum.registry.registry import SCHEDULER_REGISTRY, get_trigger
+from findrum.engine.plan import close_plans, get_plan, invalidate_plan
+from findrum.engine.dispatcher import DEFAULT_DISPATCH, EventDispatcher
+from findrum.engine.batching import MicroBatcher
+from findrum.engine.process import shutdown_process_pool
+from findrum.engine.scheduling import DEFAULT_SCHEDULING, JobScheduler, create_scheduler, split_job_options
+from findrum.registry.registry import (
+    SCHEDULER_REGISTRY, close_resources, get_datasource, get_operator, get_scheduler, get_trigger, lookup,
+)
 
 logger = logging.getLogger("findrum")
 
@@ -18,24 +28,90 @@ class Platform:
     The Platform class loads user-defined extensions (operators, triggers,
     schedulers, datasources), registers pipelines defined in YAML configuration
     files, and runs them either as scheduled jobs or in response to events.
+
+    With a `broker`, the platform acts as a coordinator: schedules, events
+    and unscheduled pipelines publish their runs to the broker's queue,
+    and `findrum-run --worker` processes execute them.
+
+    With `watch`, changed pipeline files and extension modules are applied
+    to the running platform without restarting it.
     """
 
-    def __init__(self, extensions_config: str = "config.yaml", verbose: bool = False):
+    def __init__(self, extensions_config: str = "config.yaml", verbose: bool = False, dispatch: dict = None,
+                 lazy: bool = True, broker=None, scheduling: dict = None):
         """Initialize the platform, load extensions, and prepare the scheduler.
 
         Args:
             extensions_config (str): Path to the YAML file for custom extension classes.
             verbose (bool): Whether to enable verbose logging to the console.
+            dispatch (dict, optional): Default event dispatch settings (`workers`,
+                `queue_size`, `overflow`). A pipeline's `event.dispatch` block
+                takes precedence for the trigger it creates.
+            lazy (bool): Whether to import extension modules lazily. Only the
+                classes referenced by registered pipelines are then imported,
+                when the pipeline is registered.
+            broker (str | dict | SQLiteBroker, optional): Broker pipeline runs
+                are published to instead of running in-process: a broker, the
+                path of a SQLite queue file, or a broker config for `create_broker`.
+            scheduling (dict, optional): Scheduler settings (`backend`:
+                blocking, background or asyncio; `executor`: thread or
+                process; `max_workers`) for `create_scheduler`.
         """
         self.extensions_config = extensions_config
         self.verbose = verbose
-        self.scheduler = BlockingScheduler()
+        self._scheduler = None
+        self._event_loop = None
+        self.scheduling = {**DEFAULT_SCHEDULING, **(scheduling or {})}
+        self.dispatch = {**DEFAULT_DISPATCH, **(dispatch or {})}
+        self._owns_broker = isinstance(broker, (str, dict))
+        if self._owns_broker:
+            from findrum.engine.distributed import create_broker
+
+            broker = create_broker(broker)
+        self.broker = broker
 
         self.event_trigger_map = {}
         self.event_instances = {}
+        self.event_dispatchers = {}
+        self.event_batchers = {}
+        self.pipelines = {}
+
+        self._started = False
+        self._retired_plans = []
+        self._module_mtimes = {}
+        self._watcher = None
+        self._watch_stop = threading.Event()
+        self._reload_lock = threading.RLock()
 
         self._setup_logging()
-        load_extensions(self.extensions_config)
+        load_extensions(self.extensions_config, lazy=lazy)
+
+    @property
+    def scheduler(self):
+        """BaseScheduler: The APScheduler instance scheduled pipelines are
+        registered to, as configured by `scheduling`. Created on first use,
+        so platforms without scheduled pipelines never import APScheduler."""
+        if self._scheduler is None:
+            if self.scheduling["backend"] == "asyncio":
+                import asyncio
+
+                self._event_loop = asyncio.new_event_loop()
+            self._scheduler = create_scheduler(
+                **self.scheduling, event_loop=self._event_loop, extensions_config=self.extensions_config
+            )
+        return self._scheduler
+
+    @scheduler.setter
+    def scheduler(self, value):
+        self._scheduler = value
+
+    def has_jobs(self) -> bool:
+        """Return whether any job is scheduled, without creating the scheduler.
+
+        Returns:
+            bool: True if a registered pipeline scheduled jobs.
+        """
+        return self._scheduler is not None and bool(self._scheduler.get_jobs())
 
     def _setup_logging(self):
         """Configure logging if verbose mode is enabled."""
@@ -47,7 +123,7 @@ class Platform:
             logger.propagate = False
             logger.info("Verbose mode enabled.")
 
-    def register_pipeline(self, pipeline_path: str):
+    def register_pipeline(self, pipeline_path: str, resume: str = None):
         """Register a pipeline defined in a YAML file for execution.
 
         Depending on the config, the pipeline may be executed immediately,
@@ -55,52 +131,186 @@ class Platform:
 
         Args:
             pipeline_path (str): Path to the pipeline configuration file.
+            resume (str, optional): Id of a failed run of an unscheduled
+                pipeline to resume from its checkpoints.
 
         Raises:
             FileNotFoundError: If the pipeline file does not exist.
+            ValueError: If the pipeline file does not contain a dictionary,
+                or `resume` is given for a scheduled or event pipeline.
         """
-        if not os.path.exists(pipeline_path):
-            raise FileNotFoundError(f"Pipeline not found: {pipeline_path}")
+        plan = self._load_plan(pipeline_path)
+        runner = self._prepare_pipeline(pipeline_path, plan)
+        self._register_plan(pipeline_path, plan, runner, resume)
+
+    def register_pipelines(self, pipeline_paths, max_workers: int = None) -> list:
+        """Register many pipelines, validating all of them before registering any.
+
+        The files are read and parsed on a thread pool. Every pipeline is
+        then checked (execution settings validated, every operator,
+        datasource, trigger and scheduler it uses registered) and, only if
+        all of them are valid, registered in order: pipelines
+        on the same event share one trigger, and unscheduled pipelines run.
 
-        with open(pipeline_path, "r") as f:
-            config = yaml.safe_load(f)
+        Args:
+            pipeline_paths (Iterable[str]): Paths to the pipeline configuration files.
+            max_workers (int, optional): Size of the thread pool reading the files.
 
-        runner = PipelineRunner(config)
+        Returns:
+            list: The registered paths.
+
+        Raises:
+            ValueError: If any pipeline is missing or invalid. The message
+                lists every failing file.
+        """
+        pipeline_paths = list(pipeline_paths)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="findrum-load") as pool:
+            loaded = list(pool.map(_try(self._load_plan), pipeline_paths))
+
+        prepared, errors = [], []
+        for pipeline_path, (plan, error) in zip(pipeline_paths, loaded):
+            if error is None:
+                runner, error = _try(self._prepare_pipeline)(pipeline_path, plan)
+            if error is None:
+                _, error = _try(_check_extensions)(plan.definition)
+            if error is not None:
+                errors.append(f"{pipeline_path}: {error}")
+            else:
+                prepared.append((pipeline_path, plan, runner))
+        if errors:
+            raise ValueError(f"{len(errors)} of {len(pipeline_paths)} pipelines are invalid:\n" + "\n".join(errors))
+
+        for pipeline_path, plan, runner in prepared:
+            self._register_plan(pipeline_path, plan, runner)
+        logger.info(f"📚 Registered {len(prepared)} pipelines.")
+        return [pipeline_path for pipeline_path, _, _ in prepared]
+
+    def register_directory(self, pattern: str, max_workers: int = None) -> list:
+        """Register every pipeline file in a directory or matching a glob pattern.
+
+        Args:
+            pattern (str): A directory, whose `.yaml` and `.yml` files are
+                registered, or a glob pattern such as `pipelines/**/*.yaml`.
+            max_workers (int, optional): Size of the thread pool reading the files.
+
+        Returns:
+            list: The registered paths, in sorted order.
+
+        Raises:
+            ValueError: If any pipeline is invalid.
+        """
+        if os.path.isdir(pattern):
+            paths = [os.path.join(pattern, name) for name in os.listdir(pattern) if name.endswith((".yaml", ".yml"))]
+        else:
+            paths = glob.glob(pattern, recursive=True)
+        return self.register_pipelines(sorted(paths), max_workers=max_workers)
+
+    def _load_plan(self, pipeline_path: str):
+        """Return the compiled plan of a pipeline file.
+
+        Raises:
+            FileNotFoundError: If the pipeline file does not exist.
+            ValueError: If the pipeline file does not contain a dictionary.
+        """
+        try:
+            return get_plan(pipeline_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Pipeline not found: {pipeline_path}") from None
+
+    def _prepare_pipeline(self, pipeline_path: str, plan):
+        """Import the extensions a pipeline uses and create its runner.
+
+        Returns:
+            PipelineRunner | RemoteRunner: The runner of the pipeline.
+        """
+        preload_pipeline(plan.definition)
+        if self.broker is None:
+            return PipelineRunner(plan)
+
+        from findrum.engine.distributed import RemoteRunner
+
+        return RemoteRunner(pipeline_path, self.broker)
+
+    def _register_plan(self, pipeline_path: str, plan, runner, resume: str = None):
+        """Register a prepared pipeline to its trigger or scheduler, or run it.
+
+        Raises:
+            ValueError: If `resume` is given for a scheduled or event pipeline.
+        """
+        config = plan.definition
+        if resume is not None and ("event" in config or "scheduler" in config):
+            raise ValueError(f"Only unscheduled pipelines can be resumed: {pipeline_path}")
+
+        plan.owned = True
+        record = {"path": pipeline_path, "plan": plan, "runner": runner, "event_key": None, "jobs": []}
+        self.pipelines[os.path.abspath(pipeline_path)] = record
 
         if "event" in config:
+            record["event_key"] = self._get_event_key(config["event"])
             self._register_event_pipeline(config["event"], runner, pipeline_path)
             return
 
         if "scheduler" in config:
-            self._register_scheduler(config["scheduler"], pipeline_path)
+            record["jobs"] = self._register_scheduler(config["scheduler"], pipeline_path)
             return
 
-        logger.info(f"Running unscheduled pipeline: {pipeline_path}")
-        runner.run()
+        if self.broker is not None:
+            logger.info(f"📤 Publishing unscheduled pipeline: {pipeline_path}")
+        else:
+            logger.info(f"Running unscheduled pipeline: {pipeline_path}")
+        if resume is not None:
+            runner.run(resume=resume)
+        else:
+            runner.run()
 
     def _register_event_pipeline(self, event_def: dict, runner: PipelineRunner, pipeline_path: str):
         """Register a pipeline to be triggered by a specific event.
 
+        Events emitted by the trigger are queued in the event key's
+        dispatcher and processed by its worker pool, so a slow pipeline does
+        not block the trigger or the other pipelines on the same event.
+        Pipelines with a `batch` block receive their events in batches.
+
         Args:
             event_def (dict): Event configuration block from pipeline YAML.
-            runner (PipelineRunner): The pipeline runner instance.
+            runner (PipelineRunner | RemoteRunner): The pipeline runner instance.
             pipeline_path (str): Path to the pipeline file.
         """
         event_key = self._get_event_key(event_def)
-        self.event_trigger_map.setdefault(event_key, []).append(runner)
+        # Replaced rather than mutated, so emitting threads never see a list being changed.
+        self.event_trigger_map[event_key] = [*self.event_trigger_map.get(event_key, []), runner]
+
+        if "batch" in event_def:
+            self.event_batchers[runner] = MicroBatcher(
+                lambda batch, r=runner, key=event_key: self.event_dispatchers[key].submit([r], batch),
+                name=event_def["type"],
+                **event_def["batch"],
+            )
 
         if event_key not in self.event_instances:
             TriggerClass = get_trigger(event_def["type"])
             trigger_instance = TriggerClass(**event_def.get("config", {}))
 
+            dispatch = {**self.dispatch, **event_def.get("dispatch", {})}
+            dispatcher = EventDispatcher(event_def["type"], **dispatch)
+            self.event_dispatchers[event_key] = dispatcher
+
             def emit(data, key=event_key):
+                direct = []
                 for r in self.event_trigger_map[key]:
-                    r.run_with_data(data)
+                    batcher = self.event_batchers.get(r)
+                    if batcher:
+                        batcher.add(data)
+                    else:
+                        direct.append(r)
+                return dispatcher.submit(direct, data)
 
             trigger_instance.emit = emit
             self.event_instances[event_key] = trigger_instance
 
             logger.info(f"🔔 Created trigger: {event_def['type']}")
+            if self._started:
+                trigger_instance.start()
 
         logger.info(f"🔗 Pipeline '{pipeline_path}' registered to event trigger.")
 
@@ -122,23 +332,213 @@ class Platform:
     def _register_scheduler(self, scheduler_block: dict, pipeline_path: str):
         """Register a pipeline to a scheduler.
 
+        The job options `max_instances`, `coalesce` and `misfire_grace_time`
+        are taken out of the scheduler's config and applied to the jobs it adds.
+
         Args:
             scheduler_block (dict): Scheduler configuration block from pipeline YAML.
             pipeline_path (str): Path to the pipeline file.
 
+        Returns:
+            list: Ids of the jobs the scheduler added.
+
         Raises:
             ValueError: If the scheduler type is not registered.
         """
         scheduler_type = scheduler_block.get("type")
-        scheduler_config = scheduler_block.get("config", {})
+        scheduler_config, job_options = split_job_options(scheduler_block.get("config", {}))
 
-        SchedulerClass = SCHEDULER_REGISTRY.get(scheduler_type)
+        SchedulerClass = lookup(SCHEDULER_REGISTRY, scheduler_type)
         if not SchedulerClass:
             raise ValueError(f"Scheduler '{scheduler_type}' not registered")
 
         scheduler_instance = SchedulerClass(config=scheduler_config, pipeline_path=pipeline_path)
-        scheduler_instance.register(self.scheduler)
+        scheduler_instance.broker = self.broker
+        view = JobScheduler(self.scheduler, job_options)
+        scheduler_instance.register(view)
         logger.info(f"⏱️ Scheduler registered: {scheduler_type} → {pipeline_path}")
+        return view.job_ids
+
+    def _unregister_pipeline(self, record: dict):
+        """Detach a registered pipeline from its event trigger or scheduler.
+
+        The trigger keeps running, for the other pipelines registered to it.
+
+        Args:
+            record (dict): The pipeline's entry in `pipelines`.
+        """
+        runner = record["runner"]
+        if record["event_key"] is not None:
+            key = record["event_key"]
+            self.event_trigger_map[key] = [r for r in self.event_trigger_map.get(key, []) if r is not runner]
+            batcher = self.event_batchers.pop(runner, None)
+            if batcher:
+                batcher.close()
+        for job_id in record["jobs"]:
+            try:
+                self.scheduler.remove_job(job_id)
+            except LookupError:
+                pass
+        self.pipelines.pop(os.path.abspath(record["path"]), None)
+
+    def reload_pipeline(self, pipeline_path: str, reuse_instances: bool = True):
+        """Apply a changed pipeline file to the running platform.
+
+        The pipeline is detached from its trigger or scheduler and registered
+        again from the new definition: its runner is swapped in the event
+        trigger map and its jobs are rescheduled, without touching the other
+        pipelines. Events already dispatched finish on the previous runner.
+        Unscheduled pipelines are not run again. The new definition is
+        validated first: if it is invalid, the previous version keeps running
+        and the same file is not reloaded again until it changes.
+
+        Args:
+            pipeline_path (str): Path to the pipeline configuration file.
+            reuse_instances (bool): Whether the new plan keeps the operator and
+                datasource instances and result caches of the previous one, so
+                warm connections survive. Only done when no step changed its
+                operator or datasource, and instances are only reused for
+                unchanged parameters. Step state and circuit breakers are kept
+                either way, unless their configuration changed.
+
+        Raises:
+            FileNotFoundError: If the pipeline file does not exist.
+            ValueError: If the pipeline file does not contain a dictionary.
+        """
+        with self._reload_lock:
+            record = self.pipelines.get(os.path.abspath(pipeline_path))
+            if not reuse_instances:
+                invalidate_plan(pipeline_path)
+            plan = self._load_plan(pipeline_path)
+            if record is None:
+                self.register_pipeline(pipeline_path)
+                return
+
+            try:
+                runner = self._prepare_pipeline(pipeline_path, plan)
+                _check_extensions(plan.definition)
+            except Exception:
+                record["rejected"] = plan
+                raise
+
+            old_plan = record["plan"]
+            reused = reuse_instances and _step_types(plan.definition) == _step_types(old_plan.definition)
+            if plan is not old_plan:
+                plan.take_over(old_plan, reused)
+
+            self._unregister_pipeline(record)
+            config = plan.definition
+            if "event" in config or "scheduler" in config:
+                try:
+                    self._register_plan(pipeline_path, plan, runner)
+                except Exception:
+                    if plan is not old_plan:
+                        old_plan.take_over(plan, reused)
+                    self._restore_pipeline(record)
+                    record["rejected"] = plan
+                    raise
+            else:
+                plan.owned = True
+                self.pipelines[os.path.abspath(pipeline_path)] = {
+                    **record, "plan": plan, "runner": runner, "event_key": None, "jobs": []
+                }
+            if plan is not old_plan:
+                self._retired_plans.append(old_plan)
+            logger.info(f"♻️ Reloaded pipeline: {pipeline_path}")
+
+    def _restore_pipeline(self, record: dict):
+        """Register a detached pipeline again, as it was before a failed reload.
+
+        Args:
+            record (dict): The pipeline's previous entry in `pipelines`.
+        """
+        config = record["plan"].definition
+        if "event" in config or "scheduler" in config:
+            self._register_plan(record["path"], record["plan"], record["runner"])
+        else:
+            self.pipelines[os.path.abspath(record["path"])] = record
+
+    def reload_extensions(self, module_names) -> list:
+        """Re-import changed extension modules and reload the pipelines using them.
+
+        Pipelines referencing a replaced class are registered again with
+        fresh plans, so their steps are instantiated from the new classes.
+        Other pipelines, and triggers that already exist, are left as they are.
+
+        Args:
+            module_names (Iterable[str]): Names of the modules to reload.
+
+        Returns:
+            list: Paths of the reloaded pipelines.
+
+        Raises:
+            ImportError: If a module cannot be imported.
+        """
+        with self._reload_lock:
+            replaced = reload_extension_modules(module_names)
+            affected = [
+                record["path"] for record in list(self.pipelines.values())
+                if replaced & _referenced_extensions(record["plan"].definition)
+            ]
+            for pipeline_path in affected:
+                self.reload_pipeline(pipeline_path, reuse_instances=False)
+            logger.info(f"♻️ Reloaded extension modules: {', '.join(sorted(module_names))}")
+            return affected
+
+    def check_for_changes(self) -> list:
+        """Reload the pipeline files and extension modules that changed since the last check.
+
+        A pipeline or module that fails to load is logged and keeps running
+        in its previous version.
+
+        Returns:
+            list: Paths of the reloaded pipelines.
+        """
+        reloaded = []
+        changed_modules = []
+        for name, path in extension_modules().items():
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            if self._module_mtimes.setdefault(name, mtime) != mtime:
+                self._module_mtimes[name] = mtime
+                changed_modules.append(name)
+        if changed_modules:
+            try:
+                reloaded.extend(self.reload_extensions(changed_modules))
+            except Exception:
+                logger.exception(f"Failed to reload extension modules: {', '.join(changed_modules)}")
+
+        for record in list(self.pipelines.values()):
+            try:
+                plan = get_plan(record["path"])
+                if plan is not record["plan"] and plan is not record.get("rejected"):
+                    self.reload_pipeline(record["path"])
+                    reloaded.append(record["path"])
+            except Exception:
+                logger.exception(f"Failed to reload pipeline: {record['path']}")
+        return reloaded
+
+    def watch(self, interval: float = 1.0):
+        """Check for changed pipelines and extension modules every `interval`
+        seconds on a background thread, until the platform shuts down.
+
+        Args:
+            interval (float): Seconds between checks.
+        """
+        if self._watcher is not None:
+            return
+        self.check_for_changes()
+        self._watch_stop.clear()
+
+        def poll():
+            while not self._watch_stop.wait(interval):
+                self.check_for_changes()
+
+        self._watcher = threading.Thread(target=poll, name="findrum-watch", daemon=True)
+        self._watcher.start()
+        logger.info(f"👀 Watching {len(self.pipelines)} pipelines for changes.")
 
     def start(self):
         """Start the platform: run all registered triggers and schedulers.
@@ -147,22 +547,126 @@ class Platform:
         if jobs are registered. If only triggers exist, the process stays alive
         waiting for events.
         """
-        jobs = self.scheduler.get_jobs()
+        jobs = self._scheduler.get_jobs() if self._scheduler is not None else []
         logger.info(f"Scheduler jobs found: {len(jobs)}")
+        self._started = True
 
         for trigger in self.event_instances.values():
             logger.info(f"Starting trigger: {trigger.__class__.__name__}")
             trigger.start()
 
-        if jobs:
+        if jobs or self._watcher is not None:
             logger.info("🔁 Starting scheduler...")
-            self.scheduler.start()
+            self._run_scheduler()
         elif self.event_instances:
             logger.info("Event triggers detected. Keeping process alive...")
+            self._keep_alive()
+
+        logger.info("No active schedulers or triggers. Shutting down.")
+        self.shutdown()
+
+    def _run_scheduler(self):
+        """Start the scheduler and return once it is shut down or the process is interrupted.
+
+        The blocking backend runs the jobs itself; the background backend
+        runs them from its own thread while this one waits, and the asyncio
+        backend from the event loop run here.
+        """
+        backend = self.scheduling["backend"]
+        self.scheduler.start()
+        if backend == "asyncio":
             try:
-                while True:
-                    time.sleep(60)
+                self._event_loop.run_forever()
             except KeyboardInterrupt:
                 logger.info("Interrupt received. Exiting.")
+        elif backend == "background":
+            self._keep_alive()
+
+    def _keep_alive(self):
+        """Sleep until the process is interrupted."""
+        try:
+            while True:
+                time.sleep(60)
+        except KeyboardInterrupt:
+            logger.info("Interrupt received. Exiting.")
+
+    def shutdown(self, wait: bool = True):
+        """Flush pending event batches, stop the event dispatchers after
+        their queued events are processed, shut down the process pool of
+        `executor: process` steps, stop the watcher and the scheduler, tear
+        down the operator and datasource instances of the registered
+        pipelines and close the shared resources and the broker, if the
+        platform created it.
 
-        logger.info("No active schedulers or triggers. Shutting down.")
\ No newline at end of file
+        Args:
+            wait (bool): Whether to wait for in-flight events to finish.
+        """
+        if self._watcher is not None:
+            self._watch_stop.set()
+            self._watcher.join()
+            self._watcher = None
+
+        for batcher in self.event_batchers.values():
+            batcher.close()
+        self.event_batchers.clear()
+
+        for dispatcher in self.event_dispatchers.values():
+            dispatcher.shutdown(wait=wait)
+        self.event_dispatchers.clear()
+
+        if self._scheduler is not None and self._scheduler.running:
+            self._scheduler.shutdown(wait=wait)
+            if self._event_loop is not None and not self._event_loop.is_running():
+                import asyncio
+
+                # The asyncio scheduler shuts down from its event loop.
+                self._event_loop.run_until_complete(asyncio.sleep(0))
+
+        shutdown_process_pool(wait=wait)
+        close_plans()
+        for plan in self._retired_plans:
+            plan.close()
+        self._retired_plans.clear()
+        close_resources()
+
+        if self._owns_broker:
+            self.broker.close()
+
+def _try(func):
+    """Wrap a function to return `(result, None)`, or `(None, error)` if it raises."""
+    def call(*args):
+        try:
+            return func(*args), None
+        except Exception as e:
+            return None, e
+    return call
+
+def _check_extensions(pipeline_def: dict):
+    """Check that every extension a pipeline definition uses is registered.
+
+    Raises:
+        ValueError: If an extension is not registered.
+    """
+    for step in pipeline_def.get("pipeline", []):
+        if step.get("operator"):
+            get_operator(step["operator"])
+        if step.get("datasource"):
+            get_datasource(step["datasource"])
+    if "event" in pipeline_def:
+        get_trigger(pipeline_def["event"].get("type"))
+    if "scheduler" in pipeline_def:
+        get_scheduler(pipeline_def["scheduler"].get("type"))
+
+def _referenced_extensions(pipeline_def: dict) -> set:
+    """Return the names of the extensions a pipeline definition uses."""
+    names = set()
+    for step in pipeline_def.get("pipeline", []):
+        names.update(filter(None, (step.get("operator"), step.get("datasource"))))
+    for block in ("event", "scheduler"):
+        if block in pipeline_def:
+            names.add(pipeline_def[block].get("type"))
+    return names
+
+def _step_types(pipeline_def: dict) -> dict:
+    """Return the operator or datasource of each step of a pipeline definition."""
+    return {step.get("id"): step.get("operator") or step.get("datasource") for step in pipeline_def.get("pipeline", [])}
@@ -0,0 +1,185 @@
+import os
+import sys
+import pickle
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+MIN_SHARED_BYTES = 64 * 1024
+
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+class SharedPayload:
+    """Picklable handle to a value whose buffers live in shared memory.
+
+    The value is pickled with protocol 5. Its out-of-band buffers (the
+    memory of NumPy arrays and DataFrame blocks) are copied once into a
+    single shared memory segment instead of going through the pipe of the
+    process pool, and the receiver maps them without copying. Values with
+    less than `MIN_SHARED_BYTES` of buffers are sent inline.
+    """
+
+    def __init__(self, data: bytes, name: str = None, spans: list = None, buffers: list = None):
+        """
+        Args:
+            data (bytes): The pickled value.
+            name (str, optional): Name of the shared memory segment.
+            spans (list, optional): Offset and length of each buffer in the segment.
+            buffers (list, optional): Inline buffers, when there is no segment.
+        """
+        self.data = data
+        self.name = name
+        self.spans = spans or []
+        self.buffers = buffers or []
+
+def _create_segment(size: int):
+    """Create a shared memory segment that the receiving process will unlink."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(create=True, size=size, track=False)
+    segment = shared_memory.SharedMemory(create=True, size=size)
+    if os.name == "posix":
+        # Ownership passes to the receiver, which unlinks the segment.
+        resource_tracker.unregister(segment._name, "shared_memory")
+    return segment
+
+def _attach_segment(name: str) -> memoryview:
+    """Map a segment and unlink it, returning a view that keeps it mapped.
+
+    The mapping is detached from the `SharedMemory` wrapper so it is not
+    closed with the wrapper: it stays mapped for as long as the arrays
+    loaded from it are alive.
+    """
+    segment = shared_memory.SharedMemory(name=name)
+    view = segment.buf
+    segment._buf = None
+    segment._mmap = None
+    segment.unlink()
+    segment.close()
+    return view
+
+def share(value, min_size: int = MIN_SHARED_BYTES) -> SharedPayload:
+    """Pickle a value, moving its large buffers to shared memory.
+
+    Args:
+        value (Any): The value to send to another process.
+        min_size (int): Minimum total buffer size worth a shared memory segment.
+
+    Returns:
+        SharedPayload: A handle to pass to `load` in the receiving process.
+    """
+    buffers = []
+    data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+    views = [buffer.raw() for buffer in buffers]
+    total = sum(view.nbytes for view in views)
+    if not views or total == 0 or total < min_size:
+        return SharedPayload(data, buffers=[bytes(view) for view in views])
+
+    segment = _create_segment(total)
+    spans, offset = [], 0
+    try:
+        for view in views:
+            segment.buf[offset:offset + view.nbytes] = view
+            spans.append((offset, view.nbytes))
+            offset += view.nbytes
+    except BaseException:
+        segment.close()
+        segment.unlink()
+        raise
+    segment.close()
+    return SharedPayload(data, segment.name, spans)
+
+def load(payload: SharedPayload):
+    """Load a shared value without copying its buffers.
+
+    The shared memory segment is unlinked, so a payload can only be loaded once.
+
+    Args:
+        payload (SharedPayload): The handle returned by `share`.
+
+    Returns:
+        Any: The value.
+    """
+    if payload.name is None:
+        return pickle.loads(payload.data, buffers=payload.buffers)
+    view = _attach_segment(payload.name)
+    return pickle.loads(payload.data, buffers=[view[offset:offset + length] for offset, length in payload.spans])
+
+def discard(payload: SharedPayload):
+    """Free the shared memory of a payload that will not be loaded."""
+    if payload.name is None:
+        return
+    try:
+        segment = shared_memory.SharedMemory(name=payload.name)
+    except FileNotFoundError:
+        return
+    segment.close()
+    segment.unlink()
+
+def _call_shared(func, args: tuple, payload: SharedPayload) -> SharedPayload:
+    """Worker side of `submit_shared`: load the input, call `func` and share its output."""
+    return share(func(*args, load(payload)))
+
+def get_process_pool(max_workers: int = None) -> ProcessPoolExecutor:
+    """Return the process pool shared by every step with `executor: process`.
+
+    Args:
+        max_workers (int, optional): Pool size, used when the pool is first
+            created. Defaults to the number of CPUs.
+
+    Returns:
+        ProcessPoolExecutor: The pool.
+    """
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ProcessPoolExecutor(max_workers=max_workers)
+        return _POOL
+
+def shutdown_process_pool(wait: bool = True):
+    """Shut down the shared process pool. It is recreated on next use.
+
+    Args:
+        wait (bool): Whether to wait for running steps to finish.
+    """
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+def submit_shared(func, args: tuple, input_data, pool: ProcessPoolExecutor = None) -> Future:
+    """Call `func(*args, input_data)` in a worker process through shared memory.
+
+    Args:
+        func (Callable): A module-level function.
+        args (tuple): Leading arguments. Must be picklable, so classes
+            must be importable by the workers.
+        input_data (Any): The step input, sent through shared memory.
+        pool (ProcessPoolExecutor, optional): Defaults to the shared pool.
+
+    Returns:
+        Future: Resolves to the output of `func`, mapped from shared memory.
+    """
+    payload = share(input_data)
+    future = Future()
+
+    def done(execution):
+        try:
+            output = execution.result()
+        except BaseException as error:
+            discard(payload)
+            future.set_exception(error)
+            return
+        try:
+            future.set_result(load(output))
+        except BaseException as error:
+            future.set_exception(error)
+
+    try:
+        execution = (pool or get_process_pool()).submit(_call_shared, func, args, payload)
+    except BaseException:
+        discard(payload)
+        raise
+    execution.add_done_callback(done)
+    return future
@@ -0,0 +1,288 @@
+import time
+import random
+import logging
+import threading
+from concurrent.futures import Future
+
+logger = logging.getLogger("findrum")
+
+POLICY_KEYS = ("retry", "timeout", "circuit_breaker")
+
+class RetryPolicy:
+    """How many times a failing step is attempted, and how long to wait in between.
+
+    The wait before the n-th retry is `backoff * 2 ** (n - 1)` seconds, at
+    most `max_backoff`. With `jitter`, the wait is drawn uniformly between
+    zero and that value, so steps failing together do not retry in lockstep.
+    """
+
+    def __init__(self, max_attempts: int = 3, backoff: float = 1.0, max_backoff: float = 60.0, jitter: bool = True):
+        """
+        Args:
+            max_attempts (int): Attempts in total, including the first one.
+            backoff (float): Seconds to wait before the first retry.
+            max_backoff (float): Longest wait between two attempts.
+            jitter (bool): Whether to randomize the waits.
+
+        Raises:
+            ValueError: If `max_attempts` is lower than 1.
+        """
+        if max_attempts < 1:
+            raise ValueError(f"Retry max_attempts must be at least 1, got {max_attempts}.")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+
+    def delay(self, attempt: int) -> float:
+        """Return the seconds to wait after a failed attempt.
+
+        Args:
+            attempt (int): Number of the attempt that failed, starting at 1.
+
+        Returns:
+            float: The wait before the next attempt.
+        """
+        delay = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+        return random.uniform(0, delay) if self.jitter else delay
+
+def create_retry_policy(config) -> RetryPolicy:
+    """Create the retry policy of a step from its `retry` block.
+
+    Args:
+        config (int | bool | dict | None): Number of attempts, True for the
+            defaults, or `RetryPolicy` arguments.
+
+    Returns:
+        RetryPolicy | None: The policy, or None if the step is not retried.
+    """
+    if not config:
+        return None
+    if config is True:
+        return RetryPolicy()
+    if isinstance(config, int):
+        return RetryPolicy(max_attempts=config)
+    return RetryPolicy(**config)
+
+class CircuitBreaker:
+    """Fails a step fast once it keeps failing.
+
+    After `failures` consecutive failed attempts the circuit opens and the
+    step fails immediately, without running, for `cooldown` seconds. Then a
+    single attempt is let through: if it succeeds the circuit closes, if it
+    fails the circuit opens for another cooldown.
+
+    Breakers live on the pipeline plan, so they carry over between runs.
+    """
+
+    def __init__(self, name: str, failures: int = 5, cooldown: float = 60.0):
+        """
+        Args:
+            name (str): Id of the step, used in error messages.
+            failures (int): Consecutive failures that open the circuit.
+            cooldown (float): Seconds the circuit stays open.
+        """
+        self.name = name
+        self.failures = failures
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """str: "closed", "open", or "half-open" once the cooldown is over."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._trial or time.monotonic() - self._opened_at < self.cooldown:
+                return "open"
+            return "half-open"
+
+    def check(self):
+        """Allow an attempt, or fail it if the circuit is open.
+
+        Raises:
+            RuntimeError: If the circuit is open.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self.cooldown - (time.monotonic() - self._opened_at)
+            if remaining > 0 or self._trial:
+                raise RuntimeError(
+                    f"Circuit breaker of step '{self.name}' is open after {self._failures} consecutive failures; "
+                    f"next attempt allowed in {max(remaining, 0):.1f}s."
+                )
+            self._trial = True
+
+    def record_success(self):
+        """Close the circuit after a successful attempt."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        """Count a failed attempt, opening the circuit if there were too many."""
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.failures:
+                self._opened_at = time.monotonic()
+                self._trial = False
+
+def create_circuit_breaker(name: str, config) -> CircuitBreaker:
+    """Create the circuit breaker of a step from its `circuit_breaker` block.
+
+    Args:
+        name (str): Id of the step.
+        config (bool | dict | None): True for the defaults, or
+            `CircuitBreaker` arguments (`failures`, `cooldown`).
+
+    Returns:
+        CircuitBreaker | None: The breaker, or None if the step has none.
+    """
+    if not config:
+        return None
+    return CircuitBreaker(name, **({} if config is True else config))
+
+def _timeout_error(name: str, timeout: float) -> TimeoutError:
+    return TimeoutError(f"Step '{name}' timed out after {timeout}s.")
+
+def run_with_timeout(name: str, timeout: float, func, *args):
+    """Call a function on a separate thread and stop waiting for it after `timeout` seconds.
+
+    Threads cannot be interrupted: a call that times out keeps running in
+    the background until it returns, but the caller is released.
+
+    Args:
+        name (str): Id of the step, used in the error message.
+        timeout (float): Seconds to wait.
+        func (Callable): The function to call.
+        *args: Its arguments.
+
+    Returns:
+        Any: What the function returned.
+
+    Raises:
+        TimeoutError: If the call did not finish in time.
+    """
+    return wait_future(name, timeout, run_in_thread(name, func, *args))
+
+def run_in_thread(name: str, func, *args) -> Future:
+    """Call a function on a new daemon thread.
+
+    Args:
+        name (str): Id of the step, used in the thread name.
+        func (Callable): The function to call.
+        *args: Its arguments.
+
+    Returns:
+        Future: Resolves to what the function returned.
+    """
+    future = Future()
+
+    def target():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args))
+        except BaseException as error:
+            future.set_exception(error)
+
+    threading.Thread(target=target, name=f"findrum-step-{name}", daemon=True).start()
+    return future
+
+def wait_future(name: str, timeout: float, future: Future):
+    """Wait for the result of a step execution future.
+
+    Raises:
+        TimeoutError: If the future is not done after `timeout` seconds.
+    """
+    try:
+        return future.result(timeout)
+    except TimeoutError:
+        if future.done():
+            raise
+        raise _timeout_error(name, timeout) from None
+
+def call_with_policies(name: str, func, retry: RetryPolicy = None, breaker: CircuitBreaker = None):
+    """Call a step execution under its retry policy and circuit breaker.
+
+    Args:
+        name (str): Id of the step.
+        func (Callable): Executes the step once, enforcing its timeout.
+        retry (RetryPolicy, optional): Retries failed attempts.
+        breaker (CircuitBreaker, optional): Fails attempts fast while open.
+
+    Returns:
+        Any: What the first successful attempt returned.
+
+    Raises:
+        Exception: The error of the last attempt, or a RuntimeError if the
+            circuit is open.
+    """
+    attempts = retry.max_attempts if retry else 1
+    for attempt in range(1, attempts + 1):
+        if breaker:
+            breaker.check()
+        try:
+            result = func()
+        except Exception as error:
+            if breaker:
+                breaker.record_failure()
+            if attempt == attempts:
+                raise
+            delay = retry.delay(attempt)
+            logger.warning(f"Step '{name}' failed (attempt {attempt}/{attempts}): {error}. Retrying in {delay:.1f}s.")
+            time.sleep(delay)
+        else:
+            if breaker:
+                breaker.record_success()
+            return result
+
+async def acall_with_policies(name: str, func, timeout: float = None, retry: RetryPolicy = None,
+                              breaker: CircuitBreaker = None):
+    """Async version of `call_with_policies`, waiting between attempts without blocking the loop.
+
+    Args:
+        name (str): Id of the step.
+        func (Callable): Returns an awaitable executing the step once.
+        timeout (float, optional): Seconds each attempt may take.
+        retry (RetryPolicy, optional): Retries failed attempts.
+        breaker (CircuitBreaker, optional): Fails attempts fast while open.
+
+    Returns:
+        Any: What the first successful attempt returned.
+
+    Raises:
+        Exception: The error of the last attempt, a TimeoutError if it timed
+            out, or a RuntimeError if the circuit is open.
+    """
+    import asyncio
+
+    attempts = retry.max_attempts if retry else 1
+    for attempt in range(1, attempts + 1):
+        if breaker:
+            breaker.check()
+        try:
+            if timeout is None:
+                result = await func()
+            else:
+                try:
+                    result = await asyncio.wait_for(func(), timeout)
+                except TimeoutError:
+                    raise _timeout_error(name, timeout) from None
+        except Exception as error:
+            if breaker:
+                breaker.record_failure()
+            if attempt == attempts:
+                raise
+            delay = retry.delay(attempt)
+            logger.warning(f"Step '{name}' failed (attempt {attempt}/{attempts}): {error}. Retrying in {delay:.1f}s.")
+            await asyncio.sleep(delay)
+        else:
+            if breaker:
+                breaker.record_success()
+            return result
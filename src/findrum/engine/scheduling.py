@@ -0,0 +1,120 @@
+import os
+import logging
+
+logger = logging.getLogger("findrum")
+
+SCHEDULER_BACKENDS = ("blocking", "background", "asyncio")
+SCHEDULER_EXECUTORS = ("thread", "process")
+JOB_OPTIONS = ("max_instances", "coalesce", "misfire_grace_time")
+DEFAULT_SCHEDULING = {"backend": "blocking", "executor": "thread", "max_workers": 10}
+
+def _init_process_worker(extensions_config: str):
+    """Load the extensions in a process of the scheduler's pool.
+
+    The pool starts its processes with `spawn`, so their registries are
+    empty until the extensions config is loaded again.
+    """
+    from findrum.loader.load_extensions import load_extensions
+
+    load_extensions(extensions_config, lazy=True)
+
+def create_scheduler(backend: str = "blocking", executor: str = "thread", max_workers: int = 10, event_loop=None,
+                     extensions_config: str = None):
+    """Create the APScheduler instance that runs scheduled pipelines.
+
+    APScheduler is imported here, so platforms without scheduled pipelines
+    never import it.
+
+    Args:
+        backend (str): "blocking" runs the jobs from `start` until shutdown,
+            "background" runs them from a daemon thread and "asyncio" from
+            an event loop.
+        executor (str): "thread" or "process" pool the jobs run on, so a
+            slow pipeline does not block the other jobs.
+        max_workers (int): Size of the pool.
+        event_loop (AbstractEventLoop, optional): Loop of the asyncio backend.
+        extensions_config (str, optional): Path to the extensions config
+            YAML, loaded in every process of the "process" pool.
+
+    Returns:
+        BaseScheduler: The scheduler, not started.
+
+    Raises:
+        ValueError: If the backend or executor is unknown.
+    """
+    if backend not in SCHEDULER_BACKENDS:
+        raise ValueError(f"Unknown scheduler backend '{backend}'. Expected one of {SCHEDULER_BACKENDS}.")
+    if executor not in SCHEDULER_EXECUTORS:
+        raise ValueError(f"Unknown scheduler executor '{executor}'. Expected one of {SCHEDULER_EXECUTORS}.")
+
+    if executor == "process":
+        from apscheduler.executors.pool import ProcessPoolExecutor
+
+        pool_kwargs = {}
+        if extensions_config is not None:
+            pool_kwargs = {"initializer": _init_process_worker, "initargs": (os.path.abspath(extensions_config),)}
+        executors = {"default": ProcessPoolExecutor(max_workers, pool_kwargs=pool_kwargs)}
+    else:
+        from apscheduler.executors.pool import ThreadPoolExecutor
+
+        executors = {"default": ThreadPoolExecutor(max_workers)}
+
+    if backend == "background":
+        from apscheduler.schedulers.background import BackgroundScheduler
+
+        return BackgroundScheduler(executors=executors)
+    if backend == "asyncio":
+        from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+        return AsyncIOScheduler(executors=executors, event_loop=event_loop)
+
+    from apscheduler.schedulers.blocking import BlockingScheduler
+
+    return BlockingScheduler(executors=executors)
+
+def split_job_options(config: dict) -> tuple:
+    """Separate the job options from the rest of a `scheduler.config` block.
+
+    Args:
+        config (dict): The `config` of the pipeline's scheduler block.
+
+    Returns:
+        tuple: The config without job options, and the job options
+        (`max_instances`, `coalesce`, `misfire_grace_time`).
+    """
+    options = {key: config[key] for key in JOB_OPTIONS if key in config}
+    return {key: value for key, value in config.items() if key not in JOB_OPTIONS}, options
+
+class JobScheduler:
+    """View of the APScheduler instance handed to a `Scheduler.register`.
+
+    Applies the pipeline's job options to every job the scheduler adds,
+    unless the job sets them itself, and records the ids of the added jobs.
+    Everything else is delegated to the APScheduler instance.
+    """
+
+    def __init__(self, scheduler, options: dict):
+        """
+        Args:
+            scheduler (BaseScheduler): The APScheduler instance.
+            options (dict): Job options from the pipeline's `scheduler.config`.
+        """
+        self._scheduler = scheduler
+        self._options = options
+        self.job_ids = []
+
+    def add_job(self, func, *args, **kwargs):
+        """Add a job with the pipeline's job options as defaults."""
+        job = self._scheduler.add_job(func, *args, **{**self._options, **kwargs})
+        self.job_ids.append(job.id)
+        return job
+
+    def scheduled_job(self, *args, **kwargs):
+        """Decorator form of `add_job`, with the same defaults."""
+        def inner(func):
+            self.add_job(func, *args, **kwargs)
+            return func
+        return inner
+
+    def __getattr__(self, name):
+        return getattr(self._scheduler, name)
@@ -0,0 +1,213 @@
+import time
+import pickle
+import sqlite3
+import threading
+
+STATE_BACKENDS = ("memory", "sqlite")
+
+class MemoryStateStore:
+    """Step state kept in memory.
+
+    State survives between runs of the same process (e.g. scheduler ticks)
+    but not restarts.
+    """
+
+    def __init__(self):
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> dict:
+        """Return a copy of the values stored for a step.
+
+        Args:
+            key (str): The state key of the step.
+
+        Returns:
+            dict: The values, empty if nothing was stored yet.
+        """
+        with self._lock:
+            return dict(self._values.get(key, {}))
+
+    def save(self, key: str, values: dict):
+        """Replace the values stored for a step.
+
+        Args:
+            key (str): The state key of the step.
+            values (dict): The new values.
+        """
+        with self._lock:
+            self._values[key] = dict(values)
+
+    def close(self):
+        """Nothing to release."""
+
+class SQLiteStateStore:
+    """Step state persisted in a SQLite file.
+
+    Values are pickled, so watermarks may be any picklable value such as
+    timestamps. Several processes can share the file.
+
+    Args:
+        path (str): Path of the SQLite file.
+        timeout (float): Seconds to wait for the file lock held by another process.
+    """
+
+    def __init__(self, path: str = "findrum-state.db", timeout: float = 30.0):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        with self._lock:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value BLOB NOT NULL, updated REAL NOT NULL)"
+            )
+
+    def load(self, key: str) -> dict:
+        """Return the values stored for a step.
+
+        Args:
+            key (str): The state key of the step.
+
+        Returns:
+            dict: The values, empty if nothing was stored yet.
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+        return pickle.loads(row[0]) if row else {}
+
+    def save(self, key: str, values: dict):
+        """Replace the values stored for a step.
+
+        Args:
+            key (str): The state key of the step.
+            values (dict): The new values.
+        """
+        value = pickle.dumps(dict(values), protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO state (key, value, updated) VALUES (?, ?, ?)", (key, value, time.time())
+            )
+
+    def close(self):
+        """Close the connection to the SQLite file."""
+        with self._lock:
+            self._connection.close()
+
+def create_state_store(config):
+    """Create a state store from a pipeline's `state` block.
+
+    Args:
+        config (dict | None): The `state` block. Defaults to the memory store.
+
+    Returns:
+        MemoryStateStore | SQLiteStateStore: The state store.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    config = dict(config) if isinstance(config, dict) else {}
+    backend = config.pop("backend", "memory")
+    if backend not in STATE_BACKENDS:
+        raise ValueError(f"Unknown state backend '{backend}'. Expected one of {STATE_BACKENDS}.")
+    if backend == "sqlite":
+        return SQLiteStateStore(**config)
+    return MemoryStateStore()
+
+class StepState:
+    """State of one step, handed to its `fetch` (or `run`) as `state`.
+
+    Values set during a run are staged and only saved when the whole run
+    succeeds, so a failed run is retried from the previous watermark.
+
+        def fetch(self, state):
+            rows = self.client.get_prices(since=state.watermark)
+            if rows:
+                state.watermark = rows[-1]["timestamp"]
+            return rows
+    """
+
+    def __init__(self, store, key: str):
+        """Load the committed values of a step.
+
+        Args:
+            store (MemoryStateStore | SQLiteStateStore): Where the state is kept.
+            key (str): The state key of the step.
+        """
+        self.store = store
+        self.key = key
+        self._values = store.load(key)
+        self._changes = {}
+
+    def __repr__(self) -> str:
+        return f"StepState({self.key!r})"
+
+    def get(self, name: str, default=None):
+        """Return a value, including changes staged in this run."""
+        if name in self._changes:
+            return self._changes[name]
+        return self._values.get(name, default)
+
+    def set(self, name: str, value):
+        """Stage a value, saved when the run succeeds."""
+        self._changes[name] = value
+
+    @property
+    def changes(self) -> dict:
+        """dict: Values staged in this run and not saved yet."""
+        return dict(self._changes)
+
+    def fork(self) -> "StepState":
+        """Return a copy that sees the values staged so far but stages its own changes.
+
+        Each attempt of a retried step runs with a fork, and only the
+        changes of the attempt that succeeds are staged with `stage`.
+        """
+        fork = StepState.__new__(StepState)
+        fork.store = self.store
+        fork.key = self.key
+        fork._values = {**self._values, **self._changes}
+        fork._changes = {}
+        return fork
+
+    def stage(self, values: dict):
+        """Stage several values at once, e.g. the changes of a checkpointed step."""
+        self._changes.update(values)
+
+    @property
+    def watermark(self):
+        """Any: High-water mark of the data already processed, None on the first run."""
+        return self.get("watermark")
+
+    @watermark.setter
+    def watermark(self, value):
+        self.set("watermark", value)
+
+    def commit(self):
+        """Save the staged values."""
+        if not self._changes:
+            return
+        self._values = {**self._values, **self._changes}
+        self._changes = {}
+        self.store.save(self.key, self._values)
+
+def filter_delta(data, column: str, watermark):
+    """Keep the rows of a step input that are newer than a watermark.
+
+    Args:
+        data (DataFrame | list): A DataFrame, or a list of mappings.
+        column (str): The column holding the row timestamp or sequence number.
+        watermark (Any): The largest value of `column` already processed, or None.
+
+    Returns:
+        tuple: The rows with `column` greater than the watermark, and the new
+        watermark (the largest value of `column` seen so far).
+
+    Raises:
+        TypeError: If the input is neither a DataFrame nor a list.
+    """
+    if hasattr(data, "columns"):
+        delta = data if watermark is None else data[data[column] > watermark]
+        return delta, delta[column].max() if len(delta) else watermark
+    if isinstance(data, list):
+        delta = data if watermark is None else [row for row in data if row[column] > watermark]
+        return delta, max((row[column] for row in delta), default=watermark)
+    raise TypeError(f"Cannot take the delta of {type(data).__name__}; expected a DataFrame or a list of rows.")
@@ -0,0 +1,127 @@
+import queue
+import inspect
+import threading
+
+_END = object()
+_POLL_INTERVAL = 0.05
+
+def is_stream_source(datasource_class) -> bool:
+    """Check whether a datasource yields its data in chunks.
+
+    Args:
+        datasource_class (type): The datasource class.
+
+    Returns:
+        bool: True if `fetch` is a generator function.
+    """
+    return inspect.isgeneratorfunction(getattr(datasource_class, "fetch", None))
+
+def supports_chunks(operator_class) -> bool:
+    """Check whether an operator declares that it processes chunks.
+
+    Args:
+        operator_class (type): The operator class.
+
+    Returns:
+        bool: True if the class sets `chunked = True`.
+    """
+    return getattr(operator_class, "chunked", False) is True
+
+def combine_chunks(chunks: list):
+    """Materialize the chunks produced at the end of a stream.
+
+    Args:
+        chunks (list): Chunks in the order they were produced.
+
+    Returns:
+        Any: A single DataFrame if every chunk is a DataFrame, otherwise the list of chunks.
+    """
+    import pandas as pd
+
+    if chunks and all(isinstance(chunk, pd.DataFrame) for chunk in chunks):
+        return pd.concat(chunks)
+    return chunks
+
+def _put(q, item, stop: threading.Event) -> bool:
+    """Put an item in a bounded queue, giving up if the stream was stopped.
+
+    Returns:
+        bool: False if the stream was stopped before the item could be queued.
+    """
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def _drain(q, stop: threading.Event):
+    """Yield items from a queue until the end marker or a stop."""
+    while True:
+        try:
+            item = q.get(timeout=_POLL_INTERVAL)
+        except queue.Empty:
+            if stop.is_set():
+                return
+            continue
+        if item is _END:
+            return
+        yield item
+
+def run_stream(source, stages: list, queue_size: int = 8) -> list:
+    """Pipe chunks from a source through a chain of chunk-aware stages.
+
+    The source and every stage run on their own thread, connected by bounded
+    queues. A full queue blocks its producer, so a fast source cannot run
+    ahead of slow stages by more than `queue_size` chunks per stage. Stages
+    returning None for a chunk drop it.
+
+    Args:
+        source (Iterable): Iterable producing the chunks (e.g. a generator from `fetch`).
+        stages (list[Callable]): Functions applied to each chunk, in order.
+        queue_size (int): Maximum number of chunks buffered between two stages.
+
+    Returns:
+        list: Chunks produced by the last stage.
+
+    Raises:
+        Exception: The first error raised by the source or a stage.
+    """
+    stop = threading.Event()
+    errors = []
+    queues = [queue.Queue(maxsize=queue_size) for _ in range(len(stages) + 1)]
+
+    def pump(items, out_queue):
+        try:
+            for item in items:
+                if item is not None and not _put(out_queue, item, stop):
+                    return
+            _put(out_queue, _END, stop)
+        except BaseException as exc:
+            errors.append(exc)
+            stop.set()
+
+    def transform(stage, in_queue):
+        return (stage(chunk) for chunk in _drain(in_queue, stop))
+
+    threads = [threading.Thread(target=pump, args=(iter(source), queues[0]), name="findrum-stream-source", daemon=True)]
+    for i, stage in enumerate(stages):
+        threads.append(threading.Thread(
+            target=pump,
+            args=(transform(stage, queues[i]), queues[i + 1]),
+            name=f"findrum-stream-stage-{i}",
+            daemon=True,
+        ))
+
+    for thread in threads:
+        thread.start()
+
+    chunks = list(_drain(queues[-1], stop))
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    return chunks
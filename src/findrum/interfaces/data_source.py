@@ -7,7 +7,14 @@ class DataSource(ABC):
     that is expected to implement a `fetch` method for retrieving data.
 
     Subclasses should override the `fetch` method to provide their
-    specific logic for data retrieval.
+    specific logic for data retrieval. `fetch` may also be declared as
+    `async def`; the pipeline runner detects this and awaits it. In
+    streaming pipelines, `fetch` can be a generator that yields the data in
+    chunks (e.g. DataFrame batches).
+
+    A data source is instantiated once per step and reused by every run, so
+    connections can be opened in `setup` and closed in `teardown` instead
+    of on each scheduler tick or event.
     """
 
     def __init__(self, **kwargs):
@@ -19,6 +26,14 @@ class DataSource(ABC):
         """
         pass
 
+    def setup(self):
+        """Acquire the resources of the data source before its first run."""
+        pass
+
+    def teardown(self):
+        """Release the resources acquired in `setup`."""
+        pass
+
     @abstractmethod
     def fetch(self):
         """Retrieve data from the source.
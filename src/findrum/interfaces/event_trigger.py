@@ -1,7 +1,6 @@
 from abc import ABC, abstractmethod
 import logging
 logger = logging.getLogger("findrum")
-from findrum.engine.pipeline_runner import PipelineRunner
 
 class EventTrigger(ABC):
     """Abstract base class for event-driven pipeline triggers.
@@ -41,6 +40,8 @@ class EventTrigger(ABC):
         Args:
             overrides (dict, optional): Parameters to override in the pipeline.
         """
+        from findrum.engine.pipeline_runner import PipelineRunner
+
         logger.info(f"📡 Executing pipeline from {self.pipeline_path}")
 
         runner = PipelineRunner.from_yaml(self.pipeline_path)
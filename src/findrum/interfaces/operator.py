@@ -5,8 +5,20 @@ class Operator(ABC):
 
     This interface defines a common structure for all operators
     that process input data and potentially produce transformed output.
+    `run` may also be declared as `async def`; the pipeline runner detects
+    this and awaits it.
+
+    Operators that can process their input one chunk at a time set
+    `chunked = True`. In streaming pipelines they then receive each chunk
+    yielded by the upstream datasource as it is produced.
+
+    Each step keeps a single operator instance across runs. Load models or
+    lookup tables in `setup`, which runs once before the first `run`, and
+    free them in `teardown`, which runs on Platform shutdown.
     """
 
+    chunked = False
+
     def __init__(self, **params):
         """Initialize the operator with optional parameters.
 
@@ -15,6 +27,14 @@ class Operator(ABC):
         """
         self.params = params
 
+    def setup(self):
+        """Acquire the resources of the operator before its first run."""
+        pass
+
+    def teardown(self):
+        """Release the resources acquired in `setup`."""
+        pass
+
     @abstractmethod
     def run(self, input_data):
         """Execute the operator's logic on the given input data.
@@ -1,7 +1,6 @@
 from abc import ABC, abstractmethod
 import logging
 logger = logging.getLogger("findrum")
-from findrum.engine.pipeline_runner import PipelineRunner
 
 
 class Scheduler(ABC):
@@ -9,8 +8,14 @@ class Scheduler(ABC):
 
     This class provides a template for schedulers that register
     pipelines to be executed at scheduled intervals or times.
+
+    When the Platform coordinates workers, it sets `broker` and scheduled
+    runs are published to the broker's queue instead of running in the
+    scheduler's process.
     """
 
+    broker = None
+
     def __init__(self, config, pipeline_path):
         """Initialize the scheduler with configuration and pipeline path.
 
@@ -40,7 +45,16 @@ class Scheduler(ABC):
         """Execute the pipeline associated with this scheduler.
 
         This method initializes and runs the pipeline defined in `pipeline_path`.
+        The compiled pipeline plan is cached, so the file is only parsed again
+        when it changes.
         """
+        if self.broker is not None:
+            logger.info(f"📤 Publishing pipeline run from {self.pipeline_path}")
+            self.broker.publish(self.pipeline_path)
+            return
+
+        from findrum.engine.pipeline_runner import PipelineRunner
+
         logger.info(f"🕒 Executing pipeline from {self.pipeline_path}")
         runner = PipelineRunner.from_yaml(self.pipeline_path)
         runner.run()
@@ -1,7 +1,9 @@
-import yaml
+import sys
 import importlib
 
 from findrum.registry import registry
+from findrum.registry.resources import ResourcePool
+from findrum.loader.yaml_loader import load_yaml
 
 CATEGORY_REGISTRY_MAP = {
     "operators": registry.OPERATOR_REGISTRY,
@@ -10,13 +12,18 @@ CATEGORY_REGISTRY_MAP = {
     "datasources": registry.DATASOURCE_REGISTRY,
 }
 
-def load_extensions(config_path: str):
+def load_extensions(config_path: str, lazy: bool = False, preload: list = None):
     """Dynamically load and register external classes from a YAML config file.
 
     This function reads a configuration file that lists full class paths for different
     extension categories (e.g., operators, schedulers, triggers, datasources), dynamically
     imports each class, and registers it in the appropriate registry.
 
+    With `lazy=True`, classes are registered as `LazyExtension` references
+    and their modules are only imported the first time they are looked up,
+    so a process only pays for the extensions it uses. `preload` lists
+    pipeline files whose classes are imported right away.
+
     The expected YAML structure is:
         operators:
           - mypackage.my_operator.CustomOperator
@@ -26,21 +33,121 @@ def load_extensions(config_path: str):
           - mypackage.my_trigger.CustomTrigger
         datasources:
           - mypackage.my_datasource.CustomDataSource
+        resources:
+          prices_db:
+            class: mypackage.db.connect
+            max_size: 10
+            config:
+              dsn: postgresql://prices
+
+    Each resource is registered as a `ResourcePool` under its name. A
+    resource loaded again replaces the previous pool, which is closed.
 
     Args:
         config_path (str): Path to the YAML configuration file containing class paths.
+        lazy (bool): Whether to defer imports until first use.
+        preload (list, optional): Pipeline files whose classes are imported immediately.
 
     Raises:
         ImportError: If a module or class cannot be imported.
         AttributeError: If the specified class does not exist in the module.
     """
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+    config = load_yaml(config_path)
 
     for category, registry_dict in CATEGORY_REGISTRY_MAP.items():
         for full_class_path in config.get(category, []):
             module_path, class_name = full_class_path.rsplit(".", 1)
+            if lazy:
+                registry_dict[class_name] = registry.LazyExtension(full_class_path)
+                continue
             module = importlib.import_module(module_path)
             cls = getattr(module, class_name)
             registry_dict[class_name] = cls
 
+    for name, definition in config.get("resources", {}).items():
+        definition = dict(definition)
+        factory = registry.LazyExtension(definition.pop("class"))
+        if not lazy:
+            factory = factory.load()
+        previous = registry.RESOURCE_REGISTRY.get(name)
+        registry.RESOURCE_REGISTRY[name] = ResourcePool(name, factory, **definition)
+        if previous is not None:
+            previous.close()
+
+    for pipeline_path in preload or []:
+        preload_pipeline(load_yaml(pipeline_path))
+
+def preload_pipeline(pipeline_def: dict):
+    """Import the registered extensions a pipeline definition references.
+
+    Covers step operators and datasources, the factories of their
+    resources, the event trigger and the scheduler. Names that are not
+    registered are skipped; they fail when the pipeline runs.
+
+    Args:
+        pipeline_def (dict): Parsed pipeline definition.
+
+    Raises:
+        ImportError: If a module or class cannot be imported.
+        AttributeError: If the specified class does not exist in the module.
+    """
+    for step in pipeline_def.get("pipeline", []):
+        if step.get("operator"):
+            registry.lookup(registry.OPERATOR_REGISTRY, step["operator"])
+        if step.get("datasource"):
+            registry.lookup(registry.DATASOURCE_REGISTRY, step["datasource"])
+        for resource in step.get("resources", {}).values():
+            pool = registry.RESOURCE_REGISTRY.get(resource)
+            if pool is not None and isinstance(pool.factory, registry.LazyExtension):
+                pool.factory.load()
+
+    if "event" in pipeline_def:
+        registry.lookup(registry.EVENT_TRIGGER_REGISTRY, pipeline_def["event"].get("type"))
+    if "scheduler" in pipeline_def:
+        registry.lookup(registry.SCHEDULER_REGISTRY, pipeline_def["scheduler"].get("type"))
+
+def extension_modules() -> dict:
+    """Return the source files of the modules defining the imported extensions.
+
+    Extensions registered lazily and not imported yet are skipped: they
+    are imported from the current source when first used.
+
+    Returns:
+        dict: Mapping of module name to the path of its source file.
+    """
+    modules = {}
+    for registry_dict in CATEGORY_REGISTRY_MAP.values():
+        for cls in list(registry_dict.values()):
+            if isinstance(cls, registry.LazyExtension):
+                continue
+            module = sys.modules.get(getattr(cls, "__module__", None))
+            path = getattr(module, "__file__", None)
+            if path:
+                modules[module.__name__] = path
+    return modules
+
+def reload_extension_modules(module_names) -> set:
+    """Re-import extension modules and point the registries at the new classes.
+
+    Args:
+        module_names (Iterable[str]): Names of the modules to reload.
+
+    Returns:
+        set: Names of the registered extensions whose class was replaced.
+
+    Raises:
+        ImportError: If a module cannot be imported.
+        AttributeError: If a registered class no longer exists in its module.
+    """
+    module_names = set(module_names)
+    for name in module_names:
+        importlib.reload(sys.modules[name])
+
+    replaced = set()
+    for registry_dict in CATEGORY_REGISTRY_MAP.values():
+        for extension_name, cls in list(registry_dict.items()):
+            if isinstance(cls, registry.LazyExtension) or getattr(cls, "__module__", None) not in module_names:
+                continue
+            registry_dict[extension_name] = getattr(sys.modules[cls.__module__], cls.__name__)
+            replaced.add(extension_name)
+    return replaced
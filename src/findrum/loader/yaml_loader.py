@@ -0,0 +1,145 @@
+import os
+import time
+import pickle
+import hashlib
+import logging
+
+import yaml
+
+logger = logging.getLogger("findrum")
+
+# libyaml's C loader when PyYAML was built with it, the pure-Python one otherwise.
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+CACHE_ENV = "FINDRUM_CONFIG_CACHE"
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "findrum", "config"
+)
+MAX_CACHE_ENTRIES = 256
+MAX_CACHE_AGE = 30 * 24 * 3600
+
+# Part of every cache key, so entries written by an incompatible version are never read.
+_CACHE_VERSION = b"findrum-config-1:"
+
+def cache_dir() -> str:
+    """Return the directory parsed configs are cached in.
+
+    Taken from the `FINDRUM_CONFIG_CACHE` environment variable, and
+    `findrum/config` in the user's cache directory (`$XDG_CACHE_HOME` or
+    `~/.cache`) by default. An empty value or `off` disables the cache.
+
+    Returns:
+        str | None: The directory, or None if the cache is disabled.
+    """
+    path = os.environ.get(CACHE_ENV, DEFAULT_CACHE_DIR)
+    return None if path in ("", "off") else path
+
+_UNSAFE_DIRS = set()
+
+def _open_cache_dir(directory: str) -> bool:
+    """Create the cache directory, readable by its owner only, and check it is safe to load pickles from.
+
+    Returns:
+        bool: False if the directory cannot be created, or is owned by
+        another user or writable by others.
+    """
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        stat = os.stat(directory)
+    except OSError:
+        return False
+    if hasattr(os, "getuid") and (stat.st_uid != os.getuid() or stat.st_mode & 0o022):
+        if directory not in _UNSAFE_DIRS:
+            _UNSAFE_DIRS.add(directory)
+            logger.warning(f"Not using config cache {directory}: it is owned by another user or writable by others.")
+        return False
+    return True
+
+def _prune_cache(directory: str):
+    """Delete entries unused for `MAX_CACHE_AGE` seconds, and the least recently used beyond `MAX_CACHE_ENTRIES`."""
+    entries = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith((".pickle", ".tmp")):
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    pass
+    entries.sort(reverse=True)
+    cutoff = time.time() - MAX_CACHE_AGE
+    for index, (mtime, path) in enumerate(entries):
+        if index >= MAX_CACHE_ENTRIES or mtime < cutoff:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def parse_yaml(content: bytes, digest: str = None):
+    """Parse YAML content, reusing the cached result of identical content.
+
+    Parsed configs are pickled in `cache_dir()` under the SHA-256 of their
+    content, so a file parsed once (by any process sharing the directory)
+    is not parsed again until it changes. Entries unused for
+    `MAX_CACHE_AGE` seconds, and the least recently used beyond
+    `MAX_CACHE_ENTRIES`, are deleted whenever a new one is written. The
+    cache is only an optimization: entries that cannot be read or written
+    are ignored, and a directory other users can write to is not used.
+
+    Args:
+        content (bytes): Raw YAML content.
+        digest (str, optional): SHA-256 hex digest of `content`, if the
+            caller already computed it.
+
+    Returns:
+        Any: The parsed document.
+
+    Raises:
+        yaml.YAMLError: If the content is not valid YAML.
+    """
+    directory = cache_dir()
+    if directory is None or not _open_cache_dir(directory):
+        return yaml.load(content, Loader=SafeLoader)
+
+    key = hashlib.sha256(_CACHE_VERSION + (digest or hashlib.sha256(content).hexdigest()).encode()).hexdigest()
+    path = os.path.join(directory, f"{key}.pickle")
+    try:
+        with open(path, "rb") as f:
+            config = pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        logger.warning(f"Ignoring unreadable config cache entry: {path}")
+    else:
+        try:
+            # Marks the entry as recently used, for pruning.
+            os.utime(path)
+        except OSError:
+            pass
+        return config
+
+    config = yaml.load(content, Loader=SafeLoader)
+    try:
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        _prune_cache(directory)
+    except OSError:
+        pass
+    return config
+
+def load_yaml(path: str):
+    """Read and parse a YAML file with `parse_yaml`.
+
+    Args:
+        path (str): Path to the YAML file.
+
+    Returns:
+        Any: The parsed document.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        yaml.YAMLError: If the file is not valid YAML.
+    """
+    with open(path, "rb") as f:
+        return parse_yaml(f.read())
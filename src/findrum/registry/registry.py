@@ -1,7 +1,67 @@
+import importlib
+import threading
+
 OPERATOR_REGISTRY = {}
 SCHEDULER_REGISTRY = {}
 EVENT_TRIGGER_REGISTRY = {}
 DATASOURCE_REGISTRY = {}
+RESOURCE_REGISTRY = {}
+
+class LazyExtension:
+    """Reference to an extension class that is imported on first use.
+
+    Registered by `load_extensions(..., lazy=True)`, so that modules of
+    extensions a process never uses are never imported. Calling the
+    reference imports the class and calls it.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Full import path of the class, e.g. "mypackage.ops.MyOperator".
+        """
+        self.path = path
+        self._target = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"LazyExtension({self.path!r})"
+
+    def load(self):
+        """Import the referenced class.
+
+        Returns:
+            Type: The class.
+
+        Raises:
+            ImportError: If the module cannot be imported.
+            AttributeError: If the class does not exist in the module.
+        """
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    module_path, class_name = self.path.rsplit(".", 1)
+                    self._target = getattr(importlib.import_module(module_path), class_name)
+        return self._target
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+def lookup(registry: dict, name: str):
+    """Return a registered extension, importing it if it was registered lazily.
+
+    Args:
+        registry (dict): One of the extension registries.
+        name (str): Name of the extension.
+
+    Returns:
+        Type | None: The class, or None if it is not registered.
+    """
+    entry = registry.get(name)
+    if isinstance(entry, LazyExtension):
+        entry = entry.load()
+        registry[name] = entry
+    return entry
 
 def get_datasource(name):
     """Retrieve a datasource class from the registry by name.
@@ -17,7 +77,7 @@ def get_datasource(name):
     """
     if name not in DATASOURCE_REGISTRY:
         raise ValueError(f"Datasource '{name}' not found in registry.")
-    return DATASOURCE_REGISTRY[name]
+    return lookup(DATASOURCE_REGISTRY, name)
 
 def get_operator(name: str):
     """Retrieve an operator class from the registry by name.
@@ -31,7 +91,7 @@ def get_operator(name: str):
     Raises:
         ValueError: If the operator is not found in the registry.
     """
-    cls = OPERATOR_REGISTRY.get(name)
+    cls = lookup(OPERATOR_REGISTRY, name)
     if cls is None:
         raise ValueError(f"Operator '{name}' not found in registry.")
     return cls
@@ -48,7 +108,7 @@ def get_trigger(name: str):
     Raises:
         ValueError: If the trigger is not found in the registry.
     """
-    cls = EVENT_TRIGGER_REGISTRY.get(name)
+    cls = lookup(EVENT_TRIGGER_REGISTRY, name)
     if cls is None:
         raise ValueError(f"Trigger '{name}' not found in registry.")
     return cls
@@ -65,8 +125,31 @@ def get_scheduler(name: str):
     Raises:
         ValueError: If the scheduler is not found in the registry.
     """
-    cls = SCHEDULER_REGISTRY.get(name)
+    cls = lookup(SCHEDULER_REGISTRY, name)
     if cls is None:
         raise ValueError(f"Scheduler '{name}' not found in registry.")
     return cls
 
+def get_resource(name: str):
+    """Retrieve a shared resource pool from the registry by name.
+
+    Args:
+        name (str): Name of the resource, as declared in the extensions config.
+
+    Returns:
+        ResourcePool: The resource pool.
+
+    Raises:
+        ValueError: If the resource is not found in the registry.
+    """
+    pool = RESOURCE_REGISTRY.get(name)
+    if pool is None:
+        raise ValueError(f"Resource '{name}' not found in registry.")
+    return pool
+
+def close_resources():
+    """Close every registered resource pool and empty the resource registry."""
+    pools = list(RESOURCE_REGISTRY.values())
+    RESOURCE_REGISTRY.clear()
+    for pool in pools:
+        pool.close()
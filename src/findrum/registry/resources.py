@@ -0,0 +1,173 @@
+import time
+import logging
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger("findrum")
+
+class ResourcePool:
+    """Named pool of shared resources such as database connections or HTTP sessions.
+
+    Resources are created on demand by calling `factory(**config)`, up to
+    `max_size` at a time, and handed out with `acquire`. Released
+    resources are kept idle and reused by the next `acquire`. When every
+    resource is in use, `acquire` waits up to `timeout` seconds.
+
+    Resources that are thread-safe and pool internally (e.g. an SQLAlchemy
+    engine) can be declared `shared`: a single instance is then created and
+    handed to every caller without checkout.
+
+    Defined in the `resources` section of the extensions config:
+
+        resources:
+          prices_db:
+            class: mypackage.db.connect
+            max_size: 10
+            timeout: 30
+            config:
+              dsn: postgresql://prices
+    """
+
+    def __init__(self, name: str, factory, config: dict = None, max_size: int = 10, timeout: float = 30.0,
+                 shared: bool = False, close_method: str = "close"):
+        """Create an empty pool. No resource is created until the first `acquire`.
+
+        Args:
+            name (str): Name of the resource.
+            factory (Callable): Class or function creating a resource.
+            config (dict, optional): Keyword arguments passed to the factory.
+            max_size (int): Maximum number of resources alive at once.
+            timeout (float): Seconds `acquire` waits for a free resource.
+            shared (bool): Whether a single resource is shared by all callers.
+            close_method (str): Method called on each resource when the pool is closed.
+
+        Raises:
+            ValueError: If `max_size` is less than 1.
+        """
+        if max_size < 1:
+            raise ValueError(f"Resource '{name}' max_size must be at least 1.")
+
+        self.name = name
+        self.factory = factory
+        self.config = dict(config or {})
+        self.max_size = max_size
+        self.timeout = timeout
+        self.shared = shared
+        self.close_method = close_method
+
+        self._idle = []
+        self._resources = []
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def __repr__(self) -> str:
+        return f"ResourcePool({self.name!r})"
+
+    @property
+    def size(self) -> int:
+        """int: Number of resources currently alive."""
+        return len(self._resources)
+
+    @property
+    def in_use(self) -> int:
+        """int: Number of resources currently acquired."""
+        return 0 if self.shared else len(self._resources) - len(self._idle)
+
+    @contextmanager
+    def acquire(self, timeout: float = None):
+        """Check out a resource for the duration of a `with` block.
+
+        Args:
+            timeout (float, optional): Overrides the pool's timeout.
+
+        Yields:
+            Any: The resource.
+
+        Raises:
+            TimeoutError: If no resource becomes free in time.
+            RuntimeError: If the pool has been closed.
+        """
+        if self.shared:
+            yield self._get_shared()
+            return
+
+        resource = self._checkout(self.timeout if timeout is None else timeout)
+        try:
+            yield resource
+        finally:
+            self._checkin(resource)
+
+    def _get_shared(self):
+        """Return the shared resource, creating it on first use."""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError(f"Resource '{self.name}' is closed.")
+            if not self._resources:
+                self._resources.append(self.factory(**self.config))
+            return self._resources[0]
+
+    def _checkout(self, timeout: float):
+        """Take an idle resource, create one, or wait for one to be released."""
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError(f"Resource '{self.name}' is closed.")
+                if self._idle:
+                    return self._idle.pop()
+                if len(self._resources) < self.max_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Timed out waiting for resource '{self.name}' ({self.max_size} in use).")
+                self._condition.wait(remaining)
+            self._resources.append(None)
+
+        try:
+            resource = self.factory(**self.config)
+        except BaseException:
+            with self._condition:
+                self._resources.remove(None)
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._resources[self._resources.index(None)] = resource
+        return resource
+
+    def _checkin(self, resource):
+        """Return a resource to the pool, closing it if the pool was closed meanwhile."""
+        with self._condition:
+            if not self._closed:
+                self._idle.append(resource)
+                self._condition.notify()
+                return
+            self._resources.remove(resource)
+        self._close_resource(resource)
+
+    def close(self):
+        """Close idle resources and refuse new checkouts.
+
+        Resources still in use are closed when they are released.
+        """
+        with self._condition:
+            self._closed = True
+            if self.shared:
+                to_close, self._resources = self._resources, []
+            else:
+                to_close, self._idle = self._idle, []
+                for resource in to_close:
+                    self._resources.remove(resource)
+            self._condition.notify_all()
+        for resource in to_close:
+            self._close_resource(resource)
+
+    def _close_resource(self, resource):
+        """Call the close method of a resource, logging its errors."""
+        close = getattr(resource, self.close_method, None)
+        if not callable(close):
+            return
+        try:
+            close()
+        except Exception:
+            logger.exception(f"Failed to close resource '{self.name}'.")
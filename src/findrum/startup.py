@@ -0,0 +1,71 @@
+import sys
+import subprocess
+
+# Startup of `findrum-run` up to the point where the pipeline would run:
+# create the Platform (loading the extensions), import the classes the
+# pipeline uses, create the scheduler if the pipeline is scheduled and
+# check for jobs, as the CLI does before starting.
+_STARTUP_SCRIPT = """
+import sys
+from findrum.engine.platform import Platform
+from findrum.loader.load_extensions import preload_pipeline
+from findrum.loader.yaml_loader import load_yaml
+
+platform = Platform(sys.argv[2])
+pipeline_def = load_yaml(sys.argv[1])
+preload_pipeline(pipeline_def)
+if "scheduler" in pipeline_def:
+    platform.scheduler
+platform.has_jobs()
+"""
+
+def profile_startup(pipeline_path: str, config_path: str = "config.yaml") -> list:
+    """Measure the import cost of starting a pipeline with `findrum-run`.
+
+    Startup is replayed in a fresh interpreter with `-X importtime`, so
+    modules already imported by the caller are measured too.
+
+    Args:
+        pipeline_path (str): Path to the pipeline YAML file.
+        config_path (str): Path to the extensions config YAML file.
+
+    Returns:
+        list: Tuples of module name, self time and cumulative time in
+        microseconds, in import order.
+
+    Raises:
+        RuntimeError: If the startup fails.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _STARTUP_SCRIPT, pipeline_path, config_path],
+        capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Startup failed:\n{completed.stderr}")
+
+    modules = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+def format_profile(modules: list, top: int = 25) -> str:
+    """Render a startup profile as a table of the most expensive imports.
+
+    Args:
+        modules (list): Output of `profile_startup`.
+        top (int): Number of modules to show.
+
+    Returns:
+        str: The report.
+    """
+    total = sum(self_us for _, self_us, _ in modules)
+    lines = [
+        f"Startup imports: {len(modules)} modules, {total / 1000:.1f} ms",
+        f"{'cumulative ms':>14} {'self ms':>9}  module",
+    ]
+    for name, self_us, cumulative_us in sorted(modules, key=lambda m: m[2], reverse=True)[:top]:
+        lines.append(f"{cumulative_us / 1000:14.1f} {self_us / 1000:9.1f}  {name}")
+    return "\n".join(lines)
@@ -0,0 +1,61 @@
+import json
+import pytest
+from findrum.bench.__main__ import main
+from findrum.bench.suite import bench_from_yaml, bench_load_extensions, compare, measure, run_benchmarks
+from findrum.registry import registry
+
+
+def test_measure_reports_statistics():
+    calls = []
+    stats = measure(lambda: calls.append(1), repeat=3, number=2, warmup=1)
+    assert len(calls) == 7
+    assert stats["repeat"] == 3 and stats["number"] == 2
+    assert stats["min"] <= stats["median"] <= stats["max"]
+
+
+def test_run_benchmarks_restores_registries():
+    before = dict(registry.OPERATOR_REGISTRY)
+    report = run_benchmarks(["step_overhead", "event_throughput"], repeat=2, quick=True)
+
+    assert registry.OPERATOR_REGISTRY == before
+    cases = {(r["benchmark"], r["case"]) for r in report["results"]}
+    assert ("step_overhead", "dag-100") in cases
+    assert ("event_throughput", "run_with_data-5") in cases
+    assert report["environment"]["python"]
+
+
+def test_unknown_benchmark():
+    with pytest.raises(ValueError, match="Unknown benchmark"):
+        run_benchmarks(["nope"])
+
+
+def test_compare():
+    def report(median):
+        return {"results": [{"benchmark": "b", "case": "c", "stats": {"median": median}}]}
+
+    assert compare(report(3.0), report(2.0)) == [("b", "c", 2.0, 3.0, 1.5)]
+
+
+def test_cli_writes_json(tmp_path, capsys):
+    output = tmp_path / "bench.json"
+    main(["--only", "from_yaml", "load_extensions", "--repeat", "2", "--quick", "--output", str(output)])
+    main(["--only", "from_yaml", "--repeat", "2", "--quick", "--output", str(output), "--compare", str(output)])
+
+    report = json.loads(output.read_text())
+    assert {r["benchmark"] for r in report["results"]} == {"from_yaml"}
+    assert "Compared to" in capsys.readouterr().out
+
+
+def test_cold_cases_parse_the_yaml(config_cache_dir):
+    import yaml
+    from unittest.mock import patch
+
+    with patch("yaml.load", wraps=yaml.load) as load:
+        results = bench_from_yaml(repeat=2, quick=True)
+        assert load.call_count == 3 + 1
+        load.reset_mock()
+        bench_load_extensions(repeat=2, quick=True)
+        assert load.call_count == 3
+
+    assert [r["case"] for r in results] == ["cold-100", "config-cached-100", "cached-100"]
+    assert not config_cache_dir.exists()
@@ -49,4 +49,10 @@ def register_dummy_operators():
     registry.OPERATOR_REGISTRY["Const"] = ConstOperator
     registry.OPERATOR_REGISTRY["Adder"] = AddOperator
     yield
-    registry.OPERATOR_REGISTRY.clear()
\ No newline at end of file
+    registry.OPERATOR_REGISTRY.clear()
+
+@pytest.fixture(autouse=True)
+def config_cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "config-cache"
+    monkeypatch.setenv("FINDRUM_CONFIG_CACHE", str(cache_dir))
+    return cache_dir
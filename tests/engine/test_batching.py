@@ -0,0 +1,94 @@
+import time
+import threading
+import pandas as pd
+import pytest
+from findrum.engine.batching import MicroBatcher
+from findrum.engine.pipeline_runner import PipelineRunner
+
+
+def test_flushes_when_batch_is_full():
+    batches = []
+    batcher = MicroBatcher(batches.append, max_size=3, max_wait=60)
+
+    for i in range(7):
+        batcher.add(i)
+    assert batches == [[0, 1, 2], [3, 4, 5]]
+
+    batcher.close()
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_flushes_after_max_wait():
+    flushed = threading.Event()
+    batches = []
+
+    def flush(batch):
+        batches.append(batch)
+        flushed.set()
+
+    batcher = MicroBatcher(flush, max_size=100, max_wait=0.05)
+    started = time.monotonic()
+    batcher.add("a")
+    batcher.add("b")
+
+    assert flushed.wait(timeout=5)
+    assert time.monotonic() - started >= 0.05
+    assert batches == [["a", "b"]]
+    batcher.close()
+
+
+def test_dataframe_format():
+    batches = []
+    batcher = MicroBatcher(batches.append, max_size=2, max_wait=60, format="dataframe")
+
+    batcher.add({"symbol": "A", "price": 1.0})
+    batcher.add({"symbol": "B", "price": 2.0})
+    batcher.add(pd.DataFrame({"x": [1]}))
+    batcher.add(pd.DataFrame({"x": [2, 3]}))
+    batcher.close()
+
+    assert batches[0].to_dict("list") == {"symbol": ["A", "B"], "price": [1.0, 2.0]}
+    assert batches[1]["x"].tolist() == [1, 2, 3]
+
+
+def test_closed_batcher_rejects_events():
+    batcher = MicroBatcher(lambda batch: None)
+    batcher.close()
+    with pytest.raises(RuntimeError, match="is closed"):
+        batcher.add(1)
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError, match="Unknown batch format"):
+        MicroBatcher(lambda batch: None, format="arrow")
+    with pytest.raises(ValueError, match="max_size"):
+        MicroBatcher(lambda batch: None, max_size=0)
+    with pytest.raises(ValueError, match="max_wait"):
+        MicroBatcher(lambda batch: None, max_wait=0)
+
+
+def test_runner_event_trigger_runs_once_per_batch(monkeypatch):
+    runs = []
+
+    class BurstTrigger:
+        def __init__(self, **kwargs): self.emit = None
+        def start(self):
+            for i in range(4):
+                self.emit(i)
+
+    class Collect:
+        def __init__(self, **kwargs): pass
+        def run(self, input_data):
+            runs.append(input_data)
+            return len(input_data)
+
+    monkeypatch.setattr("findrum.engine.pipeline_runner.get_trigger", lambda name: BurstTrigger)
+    monkeypatch.setattr("findrum.engine.pipeline_runner.get_operator", lambda name: Collect)
+
+    runner = PipelineRunner({
+        "event": {"type": "burst", "batch": {"max_size": 2, "max_wait": 60}},
+        "pipeline": [{"id": "collect", "operator": "collect", "depends_on": "burst"}],
+    })
+    runner.run()
+
+    assert runs == [[0, 1], [2, 3]]
@@ -0,0 +1,139 @@
+import time
+import pandas as pd
+import pytest
+from findrum.engine.cache import DiskCache, MemoryCache, create_cache, fingerprint, make_cache_key
+from findrum.engine.pipeline_runner import PipelineRunner
+from findrum.registry.registry import DATASOURCE_REGISTRY, OPERATOR_REGISTRY
+
+
+def test_fingerprint_is_content_based():
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    assert fingerprint(df) == fingerprint(df.copy())
+    assert fingerprint(df) != fingerprint(df.assign(a=[1, 3]))
+    assert fingerprint([1, {"k": df}]) == fingerprint([1, {"k": df.copy()}])
+    assert fingerprint(1) != fingerprint("1")
+    assert fingerprint(lambda: None) is None
+
+
+def test_make_cache_key_depends_on_params():
+    assert make_cache_key("Op", {"a": 1}, "fp") == make_cache_key("Op", {"a": 1}, "fp")
+    assert make_cache_key("Op", {"a": 1}, "fp") != make_cache_key("Op", {"a": 2}, "fp")
+
+
+def test_memory_cache_lru_eviction():
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.get("c") == (True, 3)
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_memory_cache_size_eviction():
+    big = pd.DataFrame({"a": range(1000)})
+    cache = MemoryCache(max_bytes=int(big.memory_usage(deep=True).sum() * 1.5))
+    cache.set("first", big)
+    cache.set("second", big.copy())
+
+    assert cache.get("first") == (False, None)
+    assert cache.get("second")[0]
+
+
+def test_memory_cache_ttl():
+    cache = MemoryCache(ttl=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+    assert cache.get("a") == (False, None)
+
+
+def test_disk_cache_roundtrip_and_eviction(tmp_path):
+    cache = DiskCache(path=str(tmp_path), max_bytes=1)
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    cache.set("a", df)
+
+    assert cache.get("a") == (False, None)
+
+    cache = DiskCache(path=str(tmp_path))
+    cache.set("a", df)
+    hit, value = DiskCache(path=str(tmp_path)).get("a")
+    assert hit
+    pd.testing.assert_frame_equal(value, df)
+
+
+def test_create_cache():
+    assert isinstance(create_cache(True), MemoryCache)
+    assert create_cache({"ttl": 5, "max_entries": 3}).max_entries == 3
+    with pytest.raises(ValueError, match="Unknown cache backend"):
+        create_cache({"backend": "redis"})
+
+
+def test_cached_steps_skip_execution(monkeypatch):
+    calls = []
+
+    class Reference:
+        def __init__(self, **kwargs): pass
+        def fetch(self):
+            calls.append("fetch")
+            return pd.DataFrame({"a": [1, 2]})
+
+    class Total:
+        def __init__(self, **kwargs): pass
+        def run(self, input_data):
+            calls.append("run")
+            return int(input_data["a"].sum())
+
+    monkeypatch.setitem(DATASOURCE_REGISTRY, "Reference", Reference)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Total", Total)
+
+    runner = PipelineRunner({
+        "pipeline": [
+            {"id": "ref", "datasource": "Reference", "cache": {"ttl": 60}},
+            {"id": "total", "operator": "Total", "depends_on": "ref", "cache": True},
+        ]
+    })
+
+    assert runner.run()["total"] == 3
+    assert runner.run()["total"] == 3
+    assert calls == ["fetch", "run"]
+    assert runner.cache_stats == {"ref": {"hits": 1, "misses": 1}, "total": {"hits": 1, "misses": 1}}
+
+
+@pytest.mark.parametrize("backend", ["memory", "disk"])
+def test_mutating_a_cached_result_does_not_change_the_cache(monkeypatch, tmp_path, backend):
+    class Ref:
+        def __init__(self, **kwargs): pass
+        def fetch(self):
+            return pd.DataFrame({"px": [1, 2]})
+
+    class Scale:
+        def __init__(self, **kwargs): pass
+        def run(self, input_data):
+            input_data["px"] *= 100
+            return input_data["px"].tolist()
+
+    monkeypatch.setitem(DATASOURCE_REGISTRY, "Ref", Ref)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Scale", Scale)
+    cache = {"backend": backend, **({"path": str(tmp_path)} if backend == "disk" else {})}
+
+    runner = PipelineRunner({
+        "pipeline": [
+            {"id": "ref", "datasource": "Ref", "cache": cache},
+            {"id": "scaled", "operator": "Scale", "depends_on": "ref"},
+        ]
+    })
+    assert [runner.run()["scaled"] for _ in range(3)] == [[100, 200]] * 3
+
+
+def test_memory_cache_copies_values():
+    cache = MemoryCache()
+    value = {"rows": [1, 2]}
+    cache.set("k", value)
+    value["rows"].append(3)
+
+    _, hit = cache.get("k")
+    hit["rows"].append(4)
+    assert cache.get("k") == (True, {"rows": [1, 2]})
@@ -0,0 +1,202 @@
+import os
+import sys
+import pytest
+import pandas as pd
+from unittest.mock import patch
+
+import findrum.__main__ as main_module
+from findrum.engine.checkpoint import CheckpointStore, create_checkpoint_store
+from findrum.engine.pipeline_runner import PipelineRunner
+from findrum.engine.plan import clear_plan_cache
+from findrum.registry.registry import DATASOURCE_REGISTRY, OPERATOR_REGISTRY
+
+CALLS = []
+
+
+class Slow:
+    def __init__(self, value):
+        self.value = value
+
+    def fetch(self):
+        CALLS.append("fetch")
+        return pd.DataFrame({"value": [self.value]})
+
+
+class Flaky:
+    failing = True
+
+    def __init__(self, name):
+        self.name = name
+
+    def run(self, input_data):
+        CALLS.append(self.name)
+        if Flaky.failing:
+            raise RuntimeError("step 9 failed")
+        return input_data
+
+
+class Double:
+    def __init__(self, name):
+        self.name = name
+
+    def run(self, input_data):
+        CALLS.append(self.name)
+        return input_data * 2
+
+
+class Rows:
+    available = 10
+
+    def __init__(self): pass
+
+    def fetch(self, state):
+        start = state.watermark + 1 if state.watermark is not None else 0
+        rows = list(range(start, Rows.available))
+        if rows:
+            state.watermark = rows[-1]
+        return rows
+
+
+@pytest.fixture(autouse=True)
+def steps(monkeypatch):
+    CALLS.clear()
+    Flaky.failing = True
+    Rows.available = 10
+    monkeypatch.setitem(DATASOURCE_REGISTRY, "Slow", Slow)
+    monkeypatch.setitem(DATASOURCE_REGISTRY, "Rows", Rows)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Flaky", Flaky)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Double", Double)
+    yield
+    clear_plan_cache()
+
+
+def pipeline(tmp_path, **execution):
+    return {
+        "checkpoint": {"path": str(tmp_path / "checkpoints")},
+        "execution": execution,
+        "pipeline": [
+            {"id": "fetch", "datasource": "Slow", "params": {"value": 2}},
+            {"id": "double", "operator": "Double", "depends_on": "fetch", "params": {"name": "double"}},
+            {"id": "flaky", "operator": "Flaky", "depends_on": "double", "params": {"name": "flaky"}},
+            {"id": "last", "operator": "Double", "depends_on": "flaky", "params": {"name": "last"}},
+        ],
+    }
+
+
+def run_and_fail(runner, tmp_path):
+    """Run until the flaky step fails and return the id of the failed run."""
+    with pytest.raises(RuntimeError, match="step 9 failed") as error:
+        runner.run()
+    [run_id] = os.listdir(tmp_path / "checkpoints")
+    assert f"run id {run_id}" in "".join(error.value.__notes__)
+    return run_id
+
+
+def test_store_round_trip(tmp_path):
+    store = CheckpointStore(str(tmp_path))
+    assert store.completed("run") == set()
+
+    store.save("run", "a", {"x": 1})
+    store.save("run", "b", pd.DataFrame({"x": [1, 2]}))
+    assert store.completed("run") == {"a", "b"}
+    assert store.load("run", "a") == {"x": 1}
+    pd.testing.assert_frame_equal(store.load("run", "b"), pd.DataFrame({"x": [1, 2]}))
+
+    with pytest.raises(KeyError):
+        store.load("run", "missing")
+
+    store.clear("run")
+    assert store.completed("run") == set()
+
+
+def test_dataframes_are_written_as_parquet_with_pyarrow(tmp_path):
+    pytest.importorskip("pyarrow")
+    store = CheckpointStore(str(tmp_path))
+    store.save("run", "frame", pd.DataFrame({"x": [1.5]}))
+    assert (tmp_path / "run" / "frame.parquet").exists()
+    assert store.load("run", "frame")["x"].tolist() == [1.5]
+
+
+def test_create_checkpoint_store():
+    assert create_checkpoint_store(True).path == ".findrum/checkpoints"
+    store = create_checkpoint_store({"path": "cp", "keep": True})
+    assert (store.path, store.keep) == ("cp", True)
+
+
+@pytest.mark.parametrize("execution", [{}, {"mode": "dag"}])
+def test_resume_skips_completed_steps(tmp_path, execution):
+    runner = PipelineRunner(pipeline(tmp_path, **execution))
+    run_id = run_and_fail(runner, tmp_path)
+    assert CALLS == ["fetch", "double", "flaky"]
+    assert CheckpointStore(str(tmp_path / "checkpoints")).completed(run_id) == {"fetch", "double"}
+
+    CALLS.clear()
+    Flaky.failing = False
+    results = runner.run(resume=run_id)
+
+    assert CALLS == ["flaky", "last"]
+    assert results["last"]["value"].tolist() == [8]
+    assert runner.context.run_id == run_id
+    assert CheckpointStore(str(tmp_path / "checkpoints")).completed(run_id) == set()
+
+
+def test_async_resume(tmp_path):
+    import asyncio
+
+    runner = PipelineRunner(pipeline(tmp_path))
+    run_id = run_and_fail(runner, tmp_path)
+    CALLS.clear()
+    Flaky.failing = False
+
+    results = asyncio.run(runner.arun(resume=run_id))
+    assert CALLS == ["flaky", "last"]
+    assert results["last"]["value"].tolist() == [8]
+
+
+def test_keep_checkpoints_of_successful_runs(tmp_path):
+    definition = pipeline(tmp_path)
+    definition["checkpoint"]["keep"] = True
+    Flaky.failing = False
+
+    runner = PipelineRunner(definition)
+    runner.run()
+    assert CheckpointStore(str(tmp_path / "checkpoints")).completed(runner.context.run_id) == {
+        "fetch", "double", "flaky", "last"
+    }
+
+
+def test_resume_errors(tmp_path):
+    definition = pipeline(tmp_path)
+    with pytest.raises(ValueError, match="no checkpoints to resume"):
+        PipelineRunner(definition).run(resume="unknown")
+
+    del definition["checkpoint"]
+    with pytest.raises(ValueError, match="cannot be resumed"):
+        PipelineRunner(definition).run(resume="unknown")
+
+
+def test_cli_resume():
+    with patch.object(sys, "argv", ["prog", "pipeline.yaml", "--resume", "abc123"]), \
+            patch("findrum.engine.platform.Platform") as platform_class:
+        main_module.main()
+
+    platform_class.return_value.register_pipeline.assert_called_once_with("pipeline.yaml", resume="abc123")
+
+
+@pytest.mark.parametrize("execution", [{}, {"mode": "dag"}])
+def test_resume_commits_the_state_of_restored_steps(tmp_path, execution):
+    runner = PipelineRunner({
+        "checkpoint": {"path": str(tmp_path / "checkpoints")},
+        "execution": execution,
+        "pipeline": [
+            {"id": "rows", "datasource": "Rows", "state": True},
+            {"id": "flaky", "operator": "Flaky", "depends_on": "rows", "params": {"name": "flaky"}},
+        ],
+    })
+    run_id = run_and_fail(runner, tmp_path)
+
+    Flaky.failing = False
+    assert runner.run(resume=run_id)["flaky"] == list(range(10))
+
+    Rows.available = 12
+    assert runner.run()["flaky"] == [10, 11]
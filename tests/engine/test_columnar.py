@@ -0,0 +1,121 @@
+import importlib.util
+import numpy as np
+import pandas as pd
+import pytest
+
+from findrum.engine.columnar import prepare_input, project, to_columnar, to_view
+from findrum.engine.pipeline_runner import PipelineRunner
+from findrum.registry.registry import DATASOURCE_REGISTRY, OPERATOR_REGISTRY
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+requires_pyarrow = pytest.mark.skipif(not HAS_PYARROW, reason="pyarrow is not installed")
+
+SEEN = []
+
+
+def wide_frame():
+    return pd.DataFrame({f"c{i}": np.arange(4, dtype="float64") * i for i in range(20)})
+
+
+class Wide:
+    def __init__(self): pass
+    def fetch(self): return wide_frame()
+
+
+class Record:
+    def __init__(self): pass
+
+    def run(self, input_data):
+        SEEN.append(input_data)
+        return input_data
+
+
+class NeedsTwoColumns(Record):
+    input_columns = ["c1", "c2"]
+
+
+@pytest.fixture(autouse=True)
+def steps(monkeypatch):
+    SEEN.clear()
+    monkeypatch.setitem(DATASOURCE_REGISTRY, "Wide", Wide)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Record", Record)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "NeedsTwoColumns", NeedsTwoColumns)
+
+
+def pipeline(consumer: dict, **execution):
+    return {
+        "execution": execution,
+        "pipeline": [
+            {"id": "wide", "datasource": "Wide"},
+            {"id": "consumer", "depends_on": "wide", **consumer},
+        ],
+    }
+
+
+def test_project_and_view_dataframes():
+    frame = wide_frame()
+    assert list(project(frame, ["c3", "c1"]).columns) == ["c3", "c1"]
+    assert project([1, 2], ["c1"]) == [1, 2]
+
+    arrays = to_view(frame[["c1"]], "numpy")
+    np.testing.assert_array_equal(arrays["c1"], frame["c1"].to_numpy())
+    assert to_view(frame, "pandas") is frame
+
+
+def test_prepare_input_handles_multiple_inputs():
+    frames = prepare_input([wide_frame(), wide_frame()], ["c1"])
+    assert [list(frame.columns) for frame in frames] == [["c1"], ["c1"]]
+
+
+def test_object_transport_projects_columns():
+    PipelineRunner(pipeline({"operator": "Record", "input_columns": ["c5"]})).run()
+    PipelineRunner(pipeline({"operator": "NeedsTwoColumns"})).run()
+
+    assert list(SEEN[0].columns) == ["c5"]
+    assert list(SEEN[1].columns) == ["c1", "c2"]
+
+
+def test_numpy_input_format():
+    PipelineRunner(pipeline({"operator": "Record", "input_columns": ["c2"], "input_format": "numpy"})).run()
+    np.testing.assert_array_equal(SEEN[0]["c2"], [0.0, 2.0, 4.0, 6.0])
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError, match="Unknown transport 'feather'"):
+        PipelineRunner(pipeline({"operator": "Record"}, transport="feather"))
+    with pytest.raises(ValueError, match="Unknown input format 'polars'"):
+        PipelineRunner(pipeline({"operator": "Record", "input_format": "polars"}))
+
+
+@pytest.mark.skipif(HAS_PYARROW, reason="pyarrow is installed")
+def test_arrow_transport_requires_pyarrow():
+    with pytest.raises(ImportError, match="findrum-platform\\[arrow\\]"):
+        PipelineRunner(pipeline({"operator": "Record"}, transport="arrow"))
+
+
+@requires_pyarrow
+def test_arrow_transport_holds_tables_and_hands_out_views():
+    import pyarrow as pa
+
+    runner = PipelineRunner(pipeline({"operator": "NeedsTwoColumns"}, transport="arrow"))
+    results = runner.run()
+
+    assert isinstance(results["wide"], pa.Table)
+    assert list(SEEN[0].columns) == ["c1", "c2"]
+    assert isinstance(results["consumer"], pa.Table)
+
+
+@requires_pyarrow
+def test_arrow_views():
+    import pyarrow as pa
+
+    table = to_columnar(wide_frame())
+    assert isinstance(table, pa.Table)
+    assert project(table, ["c1"]).column_names == ["c1"]
+    assert to_view(table, "arrow") is table
+    np.testing.assert_array_equal(to_view(project(table, ["c3"]), "numpy")["c3"], [0.0, 3.0, 6.0, 9.0])
+    with pytest.raises(KeyError):
+        project(table, ["missing"])
+
+    batch = pa.RecordBatch.from_pandas(wide_frame())
+    assert isinstance(to_columnar(batch), pa.Table)
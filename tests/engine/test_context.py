@@ -0,0 +1,55 @@
+import threading
+from findrum.engine.context import RunContext
+from findrum.engine.pipeline_runner import PipelineRunner
+from findrum.registry.registry import OPERATOR_REGISTRY
+
+
+def test_run_context_copies_overrides():
+    overrides = {"step": {"value": 1}}
+    context = RunContext(overrides)
+    overrides["step"]["value"] = 2
+
+    assert context.param_overrides == {"step": {"value": 1}}
+    assert context.results == {}
+    assert context.run_id != RunContext().run_id
+
+
+def test_concurrent_runs_do_not_share_results(monkeypatch):
+    barrier = threading.Barrier(2, timeout=5)
+
+    class Echo:
+        def __init__(self, **kwargs): pass
+        def run(self, input_data):
+            barrier.wait()
+            return input_data
+
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Echo", Echo)
+    runner = PipelineRunner({
+        "event": {"type": "MyTrigger"},
+        "pipeline": [
+            {"id": "echo", "operator": "Echo", "depends_on": "MyTrigger"},
+            {"id": "after", "operator": "Echo", "depends_on": "echo"},
+        ]
+    })
+
+    outputs = {}
+
+    def process(event):
+        outputs[event] = runner.run_with_data(event)
+
+    threads = [threading.Thread(target=process, args=(event,)) for event in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert outputs["a"] == {"echo": "a", "after": "a"}
+    assert outputs["b"] == {"echo": "b", "after": "b"}
+    assert runner.results in (outputs["a"], outputs["b"])
+
+
+def test_run_records_step_timings(dummy_pipeline_yaml):
+    runner = PipelineRunner.from_yaml(dummy_pipeline_yaml)
+    runner.run()
+    assert set(runner.context.timings) == {"step1", "step2", "final"}
+    assert all(t >= 0 for t in runner.context.timings.values())
@@ -0,0 +1,55 @@
+import pytest
+from findrum.engine.dag import build_graph, find_cycle, get_consumers, get_dependencies, topological_order
+
+
+def test_get_dependencies_normalizes_string_and_list():
+    assert get_dependencies({"id": "a"}) == []
+    assert get_dependencies({"id": "b", "depends_on": "a"}) == ["a"]
+    assert get_dependencies({"id": "c", "depends_on": ["a", "b"]}) == ["a", "b"]
+
+
+def test_build_graph_ignores_external_dependencies():
+    steps = [
+        {"id": "a", "depends_on": "MyTrigger"},
+        {"id": "b", "depends_on": ["a", "MyTrigger"]},
+    ]
+    assert build_graph(steps, external=["MyTrigger"]) == {"a": [], "b": ["a"]}
+
+
+def test_build_graph_missing_dependency():
+    with pytest.raises(ValueError, match="depends on unknown step 'missing'"):
+        build_graph([{"id": "a", "depends_on": "missing"}])
+
+
+def test_build_graph_duplicate_id():
+    with pytest.raises(ValueError, match="Duplicate step id 'a'"):
+        build_graph([{"id": "a"}, {"id": "a"}])
+
+
+def test_get_consumers():
+    graph = {"a": [], "b": ["a"], "c": ["a", "b"]}
+    assert get_consumers(graph) == {"a": ["b", "c"], "b": ["c"], "c": []}
+
+
+def test_find_cycle():
+    assert find_cycle({"a": [], "b": ["a"]}) is None
+    assert find_cycle({"a": ["c"], "b": ["a"], "c": ["b"]}) == ["a", "c", "b", "a"]
+
+
+def test_topological_order_prefers_pipeline_order():
+    assert topological_order({"a": [], "b": [], "c": ["a"]}) == ["a", "b", "c"]
+    assert topological_order({"c": ["a"], "a": [], "b": []}) == ["a", "c", "b"]
+
+
+def test_topological_order_raises_on_cycle():
+    with pytest.raises(ValueError, match="dependency cycle: a -> b -> a"):
+        topological_order({"a": ["b"], "b": ["a"]})
+
+
+def test_long_chains_do_not_recurse():
+    steps = [{"id": f"s{i}", "operator": "Const", **({"depends_on": f"s{i - 1}"} if i else {})} for i in range(1500)]
+    graph = build_graph(list(reversed(steps)))
+    assert topological_order(graph) == [f"s{i}" for i in range(1500)]
+
+    graph["s0"] = ["s1499"]
+    assert len(find_cycle(graph)) == 1501
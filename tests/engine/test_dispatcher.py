@@ -0,0 +1,99 @@
+import threading
+import pytest
+from findrum.engine.dispatcher import EventDispatcher
+
+
+class RecordingRunner:
+    def __init__(self, gate=None):
+        self.events = []
+        self.gate = gate
+
+    def run_with_data(self, data):
+        if self.gate:
+            self.gate.wait(timeout=5)
+        self.events.append(data)
+
+
+def test_dispatcher_delivers_to_every_runner():
+    runners = [RecordingRunner(), RecordingRunner()]
+    dispatcher = EventDispatcher("test", workers=2)
+
+    for i in range(5):
+        assert dispatcher.submit(runners, i) == 2
+    dispatcher.join()
+    dispatcher.shutdown()
+
+    assert runners[0].events == [0, 1, 2, 3, 4]
+    assert runners[1].events == [0, 1, 2, 3, 4]
+
+
+def test_dispatcher_fans_out_in_parallel():
+    barrier = threading.Barrier(2, timeout=5)
+
+    class BarrierRunner:
+        def __init__(self): self.passed = False
+        def run_with_data(self, data):
+            barrier.wait()
+            self.passed = True
+
+    runners = [BarrierRunner(), BarrierRunner()]
+    dispatcher = EventDispatcher("test", workers=2)
+    dispatcher.submit(runners, "event")
+    dispatcher.join()
+    dispatcher.shutdown()
+
+    assert all(runner.passed for runner in runners)
+
+
+def test_dispatcher_reject_policy():
+    gate = threading.Event()
+    runner = RecordingRunner(gate)
+    dispatcher = EventDispatcher("test", workers=1, queue_size=1, overflow="reject")
+
+    dispatcher.submit([runner], "in-flight")
+    while not dispatcher.queue.empty():
+        pass
+    assert dispatcher.submit([runner], "queued") == 1
+    assert dispatcher.submit([runner], "rejected") == 0
+
+    gate.set()
+    dispatcher.join()
+    dispatcher.shutdown()
+    assert runner.events == ["in-flight", "queued"]
+    assert dispatcher.dropped == 1
+
+
+def test_dispatcher_drop_oldest_policy():
+    gate = threading.Event()
+    runner = RecordingRunner(gate)
+    dispatcher = EventDispatcher("test", workers=1, queue_size=1, overflow="drop_oldest")
+
+    dispatcher.submit([runner], "in-flight")
+    while not dispatcher.queue.empty():
+        pass
+    dispatcher.submit([runner], "oldest")
+    dispatcher.submit([runner], "newest")
+
+    gate.set()
+    dispatcher.join()
+    dispatcher.shutdown()
+    assert runner.events == ["in-flight", "newest"]
+
+
+def test_dispatcher_survives_pipeline_errors():
+    class FailingRunner:
+        def run_with_data(self, data): raise RuntimeError("boom")
+
+    runner = RecordingRunner()
+    dispatcher = EventDispatcher("test", workers=1)
+    dispatcher.submit([FailingRunner(), runner], "event")
+    dispatcher.join()
+    dispatcher.shutdown()
+    assert runner.events == ["event"]
+
+
+def test_dispatcher_invalid_settings():
+    with pytest.raises(ValueError, match="Unknown overflow policy"):
+        EventDispatcher("test", overflow="spill")
+    with pytest.raises(ValueError, match="at least one worker"):
+        EventDispatcher("test", workers=0)
@@ -0,0 +1,291 @@
+import sys
+import threading
+import pytest
+import yaml
+from unittest.mock import patch
+
+import findrum.__main__ as main_module
+from findrum.engine.distributed import RemoteRunner, SQLiteBroker, Worker, create_broker
+from findrum.engine.plan import clear_plan_cache
+from findrum.engine.platform import Platform
+from findrum.interfaces.scheduler import Scheduler
+from findrum.registry.registry import DATASOURCE_REGISTRY, OPERATOR_REGISTRY, SCHEDULER_REGISTRY
+
+
+class Numbers:
+    def __init__(self, count=3):
+        self.count = count
+
+    def fetch(self):
+        return list(range(self.count))
+
+
+class Total:
+    def __init__(self): pass
+
+    def run(self, input_data):
+        return sum(input_data)
+
+
+class Broken:
+    def __init__(self): pass
+
+    def run(self, input_data):
+        raise RuntimeError("boom")
+
+
+class RecordingScheduler(Scheduler):
+    instances = []
+
+    def register(self, scheduler):
+        RecordingScheduler.instances.append(self)
+
+
+@pytest.fixture(autouse=True)
+def steps(monkeypatch):
+    monkeypatch.setitem(DATASOURCE_REGISTRY, "Numbers", Numbers)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Total", Total)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Broken", Broken)
+    monkeypatch.setitem(SCHEDULER_REGISTRY, "Recording", RecordingScheduler)
+    RecordingScheduler.instances.clear()
+    yield
+    clear_plan_cache()
+
+
+@pytest.fixture
+def broker(tmp_path):
+    broker = SQLiteBroker(str(tmp_path / "queue.db"))
+    yield broker
+    broker.close()
+
+
+def write_pipeline(tmp_path, definition, name="pipeline.yaml"):
+    path = tmp_path / name
+    path.write_text(yaml.dump(definition))
+    return str(path)
+
+
+BATCH = {
+    "pipeline": [
+        {"id": "numbers", "datasource": "Numbers", "params": {"count": 4}},
+        {"id": "total", "operator": "Total", "depends_on": "numbers"},
+    ]
+}
+
+
+def test_publish_claim_complete(broker):
+    job_id = broker.publish("pipeline.yaml", params={"numbers": {"count": 2}})
+    assert broker.status(job_id) == "queued"
+
+    job = broker.claim("worker-1")
+    assert job.id == job_id
+    assert job.pipeline == "pipeline.yaml"
+    assert job.payload == {"params": {"numbers": {"count": 2}}}
+    assert job.attempts == 1
+    assert broker.status(job_id) == "running"
+    assert broker.claim("worker-2") is None
+
+    broker.complete(job_id, {"total": 1})
+    assert broker.result(job_id) == {"total": 1}
+
+
+def test_event_data_is_published_even_when_none(broker):
+    broker.publish("pipeline.yaml", data=None)
+    assert broker.claim("worker").payload == {"params": {}, "data": None}
+
+
+def test_jobs_are_claimed_oldest_first_and_once(tmp_path, broker):
+    job_ids = [broker.publish("pipeline.yaml") for _ in range(20)]
+    other = SQLiteBroker(str(tmp_path / "queue.db"))
+    claimed = []
+
+    def claim(b):
+        while (job := b.claim("worker")) is not None:
+            claimed.append(job.id)
+
+    threads = [threading.Thread(target=claim, args=(b,)) for b in (broker, other, broker, other)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    other.close()
+
+    assert sorted(claimed) == sorted(job_ids)
+
+
+def test_failed_job_raises_on_result(broker):
+    job_id = broker.publish("pipeline.yaml")
+    broker.claim("worker")
+    broker.fail(job_id, "RuntimeError: boom")
+
+    assert broker.status(job_id) == "failed"
+    with pytest.raises(RuntimeError, match="boom"):
+        broker.result(job_id)
+
+
+def test_result_timeout_and_unknown_job(broker):
+    job_id = broker.publish("pipeline.yaml")
+    with pytest.raises(TimeoutError):
+        broker.result(job_id, timeout=0.05, poll_interval=0.01)
+    with pytest.raises(KeyError):
+        broker.status("missing")
+
+
+def test_lease_requeues_lost_jobs(tmp_path):
+    broker = SQLiteBroker(str(tmp_path / "queue.db"), lease=0)
+    job_id = broker.publish("pipeline.yaml")
+    assert broker.claim("crashed").id == job_id
+
+    job = broker.claim("worker")
+    assert job.id == job_id
+    assert job.attempts == 2
+    broker.close()
+
+
+def test_create_broker(tmp_path):
+    broker = create_broker(str(tmp_path / "a.db"))
+    assert isinstance(broker, SQLiteBroker)
+    broker.close()
+
+    broker = create_broker({"type": "sqlite", "path": str(tmp_path / "b.db"), "lease": 60})
+    assert broker.lease == 60
+    broker.close()
+
+    with pytest.raises(ValueError, match="Unknown broker 'redis'"):
+        create_broker({"type": "redis"})
+
+
+def test_worker_executes_jobs(tmp_path, broker):
+    path = write_pipeline(tmp_path, BATCH)
+    batch_job = broker.publish(path, keep_results=True)
+    override_job = broker.publish(path, params={"numbers": {"count": 3}}, keep_results=True)
+    event_job = broker.publish(path, data=[10, 20], keep_results=True)
+
+    worker = Worker(broker, poll_interval=0.01)
+    worker.run(max_jobs=3)
+
+    assert broker.result(batch_job)["total"] == 6
+    assert broker.result(override_job)["total"] == 3
+    assert broker.result(event_job)["total"] == 6
+    assert not worker.run_once()
+
+
+def test_worker_only_stores_kept_results(tmp_path, broker):
+    job_id = broker.publish(write_pipeline(tmp_path, BATCH))
+
+    assert Worker(broker).run_once()
+    assert broker.status(job_id) == "done"
+    assert broker.result(job_id) is None
+
+
+def test_platform_runs_keep_results_when_the_broker_does(tmp_path):
+    config = tmp_path / "config.yaml"
+    config.write_text("{}\n")
+    queue = str(tmp_path / "queue.db")
+
+    platform = Platform(str(config), broker={"path": queue, "keep_results": True})
+    platform.register_pipeline(write_pipeline(tmp_path, BATCH))
+    broker = SQLiteBroker(queue)
+    assert Worker(broker).run_once()
+    platform.shutdown()
+
+    [(job_id,)] = broker._connection.execute("SELECT id FROM jobs").fetchall()
+    assert broker.result(job_id)["total"] == 6
+    assert broker.claim("worker") is None
+    broker.close()
+
+
+def test_cli_keep_results(tmp_path):
+    with patch.object(sys, "argv", ["prog", "pipeline.yaml", "--broker=queue.db", "--keep-results"]), \
+            patch("findrum.engine.platform.Platform") as platform_class:
+        main_module.main()
+    platform_class.assert_called_once_with("config.yaml", broker={"path": "queue.db", "keep_results": True})
+
+
+def test_finished_jobs_are_purged(tmp_path):
+    broker = SQLiteBroker(str(tmp_path / "queue.db"), retention=None)
+    done, failed, queued = (broker.publish("pipeline.yaml") for _ in range(3))
+    broker.complete(done, {"total": 1})
+    broker.fail(failed, "RuntimeError: boom")
+
+    assert broker.purge(older_than=60) == 0
+    assert broker.purge() == 2
+    assert broker.status(queued) == "queued"
+    with pytest.raises(KeyError):
+        broker.result(done)
+    broker.close()
+
+    broker = SQLiteBroker(str(tmp_path / "retained.db"), retention=0)
+    job_id = broker.publish("pipeline.yaml")
+    broker.complete(job_id)
+    with pytest.raises(KeyError):
+        broker.status(job_id)
+    broker.close()
+
+
+def test_worker_records_failures(tmp_path, broker):
+    path = write_pipeline(tmp_path, {"pipeline": [{"id": "broken", "operator": "Broken"}]})
+    job_id = broker.publish(path)
+
+    assert Worker(broker).run_once()
+    with pytest.raises(RuntimeError, match="RuntimeError: boom"):
+        broker.result(job_id)
+
+
+def test_worker_stop(broker):
+    worker = Worker(broker, poll_interval=0.01)
+    thread = threading.Thread(target=worker.run)
+    thread.start()
+    worker.stop()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_remote_runner_publishes_runs(broker):
+    runner = RemoteRunner("pipeline.yaml", broker)
+    runner.override_params({"numbers": {"count": 1}})
+
+    runner.run()
+    runner.run_with_data({"price": 1})
+
+    assert broker.claim("worker").payload == {"params": {"numbers": {"count": 1}}}
+    assert broker.claim("worker").payload == {"params": {"numbers": {"count": 1}}, "data": {"price": 1}}
+
+
+def test_platform_publishes_instead_of_running(tmp_path):
+    config = tmp_path / "config.yaml"
+    config.write_text("{}\n")
+    path = write_pipeline(tmp_path, BATCH)
+    scheduled = write_pipeline(tmp_path, {**BATCH, "scheduler": {"type": "Recording"}}, "scheduled.yaml")
+    queue = str(tmp_path / "queue.db")
+
+    platform = Platform(str(config), broker=queue)
+    with patch("findrum.engine.pipeline_runner.PipelineRunner.run") as mock_run:
+        platform.register_pipeline(path)
+        platform.register_pipeline(scheduled)
+        RecordingScheduler.instances[0]._run_pipeline()
+    mock_run.assert_not_called()
+
+    broker = SQLiteBroker(queue)
+    Worker(broker).run(max_jobs=2)
+    platform.shutdown()
+
+    assert broker.claim("worker") is None
+    broker.close()
+
+
+def test_cli_worker(tmp_path, broker):
+    config = tmp_path / "config.yaml"
+    config.write_text("{}\n")
+    job_id = broker.publish(write_pipeline(tmp_path, BATCH), keep_results=True)
+
+    with patch.object(sys, "argv", ["prog", "--worker", f"--broker={broker.path}", f"--config={config}"]), \
+            patch.object(Worker, "run", lambda self: self.run_once()):
+        main_module.main()
+
+    assert broker.result(job_id, timeout=1)["total"] == 6
+
+
+def test_cli_worker_requires_broker():
+    with patch.object(sys, "argv", ["prog", "--worker"]), pytest.raises(SystemExit):
+        main_module.main()
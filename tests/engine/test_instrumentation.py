@@ -0,0 +1,153 @@
+import json
+import logging
+import pandas as pd
+import pytest
+from unittest.mock import patch
+from findrum.engine.instrumentation import (
+    Instrumentation, MemorySink, PrometheusSink, create_sink, output_size
+)
+from findrum.engine.pipeline_runner import PipelineRunner
+from findrum.registry.registry import DATASOURCE_REGISTRY, OPERATOR_REGISTRY
+
+
+class Frame:
+    def __init__(self, **kwargs): pass
+    def fetch(self):
+        return pd.DataFrame({"a": range(10)})
+
+
+class Head:
+    def __init__(self, n=3): self.n = n
+    def run(self, input_data):
+        return input_data.head(self.n)
+
+
+class Boom:
+    def __init__(self, **kwargs): pass
+    def run(self, input_data):
+        raise RuntimeError("boom")
+
+
+@pytest.fixture(autouse=True)
+def steps(monkeypatch):
+    monkeypatch.setitem(DATASOURCE_REGISTRY, "Frame", Frame)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Head", Head)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Boom", Boom)
+
+
+PIPELINE = {
+    "pipeline": [
+        {"id": "frame", "datasource": "Frame"},
+        {"id": "head", "operator": "Head", "depends_on": "frame", "params": {"n": 3}},
+    ]
+}
+
+
+def test_output_size():
+    df = pd.DataFrame({"a": [1, 2]})
+    assert output_size(df) == (2, int(df.memory_usage(deep=True).sum()))
+    assert output_size([1, 2, 3]) == (3, None)
+    assert output_size(42) == (None, None)
+
+
+def test_step_and_run_records_with_hooks():
+    sink = MemorySink()
+    started, ended = [], []
+    instrumentation = Instrumentation(
+        sinks=[sink], trace_memory=True,
+        on_step_start=lambda step_id, context: started.append(step_id),
+        on_step_end=lambda record: ended.append(record["step"]),
+    )
+
+    runner = PipelineRunner(PIPELINE, instrumentation=instrumentation)
+    runner.run()
+
+    assert started == ended == ["frame", "head"]
+    step, _, run = sink.records
+    assert step["type"] == "step" and step["step"] == "frame"
+    assert step["rows"] == 10 and step["bytes"] > 0
+    assert step["wall_time"] >= 0 and step["cpu_time"] >= 0
+    assert step["memory_delta"] >= 0
+    assert run["type"] == "run" and run["steps"] == 2 and run["error"] is None
+    assert runner.context.metrics["head"]["rows"] == 3
+
+
+@pytest.mark.parametrize("mode, executor", [("dag", "thread"), ("dag", "process")])
+def test_dag_steps_are_measured(mode, executor):
+    sink = MemorySink()
+    runner = PipelineRunner(PIPELINE, mode=mode, executor=executor, instrumentation=Instrumentation(sinks=[sink]))
+    runner.run()
+
+    assert {record["step"]: record["rows"] for record in sink.records if record["type"] == "step"} == {
+        "frame": 10, "head": 3,
+    }
+    assert all(record["cpu_time"] is not None for record in sink.records)
+
+
+def test_failed_step_is_recorded():
+    sink = MemorySink()
+    runner = PipelineRunner({
+        "pipeline": [
+            {"id": "frame", "datasource": "Frame"},
+            {"id": "boom", "operator": "Boom", "depends_on": "frame"},
+        ]
+    }, instrumentation=Instrumentation(sinks=[sink]))
+
+    with pytest.raises(RuntimeError):
+        runner.run()
+
+    assert "boom" in sink.records[1]["error"]
+    assert sink.records[2]["type"] == "run" and "boom" in sink.records[2]["error"]
+
+
+def test_hook_errors_do_not_fail_the_pipeline():
+    runner = PipelineRunner(PIPELINE, instrumentation=Instrumentation(on_step_end=lambda record: 1 / 0))
+    assert runner.run()["head"].shape == (3, 1)
+
+
+def test_instrumentation_from_pipeline_block(tmp_path):
+    jsonl = tmp_path / "steps.jsonl"
+    prom = tmp_path / "findrum.prom"
+    runner = PipelineRunner({
+        **PIPELINE,
+        "instrumentation": {
+            "sinks": [{"type": "jsonl", "path": str(jsonl)}, {"type": "prometheus", "path": str(prom)}],
+        },
+    })
+    runner.run()
+    runner.run()
+
+    records = [json.loads(line) for line in jsonl.read_text().splitlines()]
+    assert [record["type"] for record in records] == ["step", "step", "run"] * 2
+
+    text = prom.read_text()
+    assert 'findrum_step_runs_total{pipeline="pipeline",step="head"} 2' in text
+    assert 'findrum_step_output_rows{pipeline="pipeline",step="frame"} 10' in text
+    assert 'findrum_pipeline_runs_total{pipeline="pipeline"} 2' in text
+
+
+def test_closing_the_runner_closes_its_sinks(tmp_path):
+    sinks = [{"type": "jsonl", "path": str(tmp_path / "steps.jsonl")}]
+    runner = PipelineRunner({**PIPELINE, "instrumentation": {"sinks": sinks}})
+    runner.run()
+    [sink] = runner.plan.get_instrumentation().sinks
+
+    runner.close()
+    assert sink._file.closed
+    runner.run()
+    assert runner.plan.get_instrumentation().sinks[0] is not sink
+
+
+def test_prometheus_push_failure_is_logged(caplog):
+    sink = PrometheusSink(url="http://127.0.0.1:9/metrics/job/findrum", timeout=0.1)
+    with patch("urllib.request.urlopen", side_effect=OSError("refused")), caplog.at_level(logging.WARNING):
+        sink.emit({"type": "run", "pipeline": "p", "wall_time": 1.0, "cpu_time": 0.5, "peak_rss": 1, "error": None})
+    assert "Failed to push metrics" in caplog.text
+
+
+def test_create_sink():
+    assert isinstance(create_sink({"type": "memory"}), MemorySink)
+    with pytest.raises(ValueError, match="Unknown metrics sink"):
+        create_sink({"type": "statsd"})
+    with pytest.raises(ValueError, match="'path' or a 'url'"):
+        create_sink({"type": "prometheus"})
@@ -0,0 +1,144 @@
+import pytest
+import yaml
+from findrum.engine.lifecycle import InstancePool, params_key
+from findrum.engine.pipeline_runner import PipelineRunner
+from findrum.engine.plan import clear_plan_cache, close_plans
+from findrum.engine.platform import Platform
+from findrum.registry.registry import DATASOURCE_REGISTRY, OPERATOR_REGISTRY
+
+EVENTS = []
+
+
+class Connection:
+    def __init__(self, dsn="db"):
+        self.dsn = dsn
+        EVENTS.append(("init", dsn))
+
+    def setup(self):
+        EVENTS.append(("setup", self.dsn))
+
+    def teardown(self):
+        EVENTS.append(("teardown", self.dsn))
+
+    def fetch(self):
+        return self.dsn
+
+
+class Plain:
+    def __init__(self): pass
+    def run(self, input_data): return input_data
+
+
+@pytest.fixture(autouse=True)
+def steps(monkeypatch):
+    EVENTS.clear()
+    monkeypatch.setitem(DATASOURCE_REGISTRY, "Connection", Connection)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Plain", Plain)
+    yield
+    clear_plan_cache()
+
+
+PIPELINE = {
+    "pipeline": [
+        {"id": "db", "datasource": "Connection", "params": {"dsn": "prices"}},
+        {"id": "plain", "operator": "Plain", "depends_on": "db"},
+    ]
+}
+
+
+def test_params_key_is_order_independent():
+    assert params_key({"a": 1, "b": [2]}) == params_key({"b": [2], "a": 1})
+
+
+def test_pool_sets_up_once_and_tears_down():
+    pool = InstancePool()
+    first = pool.get("db", Connection, {"dsn": "a"})
+
+    assert pool.get("db", Connection, {"dsn": "a"}) is first
+    assert pool.get("db", Connection, {"dsn": "b"}) is not first
+    pool.close()
+
+    assert EVENTS == [
+        ("init", "a"), ("setup", "a"), ("init", "b"), ("setup", "b"), ("teardown", "a"), ("teardown", "b"),
+    ]
+    assert len(pool) == 0
+
+
+def test_pool_tears_down_least_recently_used_variants():
+    pool = InstancePool(max_variants=2)
+    first = pool.get("db", Connection, {"dsn": "a"})
+    pool.get("db", Connection, {"dsn": "b"})
+    pool.get("db", Connection, {"dsn": "a"})
+    pool.get("db", Connection, {"dsn": "c"})
+    pool.get("other", Connection, {"dsn": "d"})
+
+    assert ("teardown", "b") in EVENTS
+    assert pool.get("db", Connection, {"dsn": "a"}) is first
+    assert len(pool) == 3
+
+
+def test_teardown_errors_are_logged(caplog):
+    class Broken(Connection):
+        def teardown(self):
+            raise RuntimeError("boom")
+
+    pool = InstancePool()
+    pool.get("db", Broken, {})
+    pool.close()
+    assert "Teardown of Broken failed" in caplog.text
+
+
+@pytest.mark.parametrize("mode", ["sequential", "dag"])
+def test_runner_reuses_instances_across_runs(mode):
+    runner = PipelineRunner(PIPELINE, mode=mode)
+    runner.run()
+    runner.run()
+    assert EVENTS == [("init", "prices"), ("setup", "prices")]
+
+    runner.close()
+    assert EVENTS[-1] == ("teardown", "prices")
+
+    runner.run()
+    assert EVENTS[-1] == ("setup", "prices")
+
+
+def test_overridden_params_get_their_own_instance():
+    runner = PipelineRunner(PIPELINE)
+    runner.run()
+    runner.override_params({"db": {"dsn": "volumes"}})
+
+    assert runner.run()["plain"] == "volumes"
+    assert ("setup", "volumes") in EVENTS
+
+
+def test_platform_shutdown_tears_down_instances(tmp_path):
+    path = tmp_path / "pipeline.yaml"
+    path.write_text(yaml.dump(PIPELINE))
+    config = tmp_path / "config.yaml"
+    config.write_text("{}")
+
+    platform = Platform(str(config))
+    platform.register_pipeline(str(path))
+    platform.shutdown()
+
+    assert EVENTS == [("init", "prices"), ("setup", "prices"), ("teardown", "prices")]
+
+
+def test_replaced_plans_are_torn_down(tmp_path):
+    path = tmp_path / "pipeline.yaml"
+
+    def run(dsn):
+        definition = {"pipeline": [{"id": "db", "datasource": "Connection", "params": {"dsn": dsn}}]}
+        path.write_text(yaml.dump(definition))
+        PipelineRunner.from_yaml(str(path)).run()
+
+    run("a")
+    run("bb")
+    run("ccc")
+    assert ("teardown", "a") in EVENTS
+    assert ("teardown", "bb") not in EVENTS
+
+    close_plans()
+    setups = [event for event in EVENTS if event[0] == "setup"]
+    teardowns = [event for event in EVENTS if event[0] == "teardown"]
+    assert len(setups) == len(teardowns) == 3
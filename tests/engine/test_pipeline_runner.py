@@ -2,6 +2,7 @@ import pytest
 import tempfile
 from unittest.mock import MagicMock, patch
 from findrum.engine.pipeline_runner import PipelineRunner
+from findrum.engine.process import get_process_pool, shutdown_process_pool
 
 
 def test_pipeline_runner_from_yaml_and_run(dummy_pipeline_yaml):
@@ -126,3 +127,224 @@ def test_resolve_input_with_no_dependencies(monkeypatch):
     runner = PipelineRunner(pipeline_def)
     runner.run()
     assert runner.results["alone"] == "no input"
+
+
+def test_dag_mode_runs_independent_steps_concurrently(monkeypatch):
+    import threading
+    barrier = threading.Barrier(2, timeout=5)
+
+    class WaitingSource:
+        def __init__(self, value): self.value = value
+        def fetch(self):
+            barrier.wait()
+            return self.value
+
+    monkeypatch.setattr("findrum.engine.pipeline_runner.get_datasource", lambda name: WaitingSource)
+
+    pipeline_def = {
+        "execution": {"mode": "dag", "max_workers": 2},
+        "pipeline": [
+            {"id": "a", "datasource": "wait", "params": {"value": 1}},
+            {"id": "b", "datasource": "wait", "params": {"value": 2}},
+            {"id": "total", "operator": "Adder", "depends_on": ["a", "b"]},
+        ]
+    }
+
+    results = PipelineRunner(pipeline_def).run()
+    assert results == {"a": 1, "b": 2, "total": 3}
+
+
+def test_dag_mode_process_executor(dummy_pipeline_yaml):
+    runner = PipelineRunner.from_yaml(dummy_pipeline_yaml)
+    runner.mode, runner.executor, runner.max_workers = "dag", "process", 2
+
+    results = runner.run()
+    assert results == {"step1": 2, "step2": 3, "final": 5}
+
+
+def test_dag_mode_process_executor_uses_the_shared_pool(dummy_pipeline_yaml):
+    runner = PipelineRunner.from_yaml(dummy_pipeline_yaml)
+    runner.mode, runner.executor = "dag", "process"
+    try:
+        pool = get_process_pool()
+        with patch("findrum.engine.pipeline_runner.get_process_pool", wraps=get_process_pool) as get_pool:
+            runner.run()
+            assert runner.run() == {"step1": 2, "step2": 3, "final": 5}
+        assert get_pool.call_count == 2
+        assert get_process_pool() is pool
+    finally:
+        shutdown_process_pool()
+
+
+def test_dag_mode_validates_graph_up_front():
+    with pytest.raises(ValueError, match="unknown step 'missing'"):
+        PipelineRunner({"pipeline": [{"id": "a", "operator": "Const", "depends_on": "missing"}]}, mode="dag")
+
+    with pytest.raises(ValueError, match="dependency cycle"):
+        PipelineRunner({"pipeline": [
+            {"id": "a", "operator": "Const", "depends_on": "b"},
+            {"id": "b", "operator": "Const", "depends_on": "a"},
+        ]}, mode="dag")
+
+
+def test_invalid_execution_settings():
+    with pytest.raises(ValueError, match="Unknown execution mode"):
+        PipelineRunner({"pipeline": []}, mode="parallel")
+    with pytest.raises(ValueError, match="Unknown executor"):
+        PipelineRunner({"pipeline": []}, executor="gpu")
+
+
+def test_dag_mode_with_event_data():
+    pipeline_def = {
+        "event": {"type": "MyTrigger"},
+        "execution": {"mode": "dag"},
+        "pipeline": [
+            {"id": "double", "operator": "Adder", "depends_on": "MyTrigger"},
+            {"id": "const", "operator": "Const", "params": {"value": 4}},
+            {"id": "total", "operator": "Adder", "depends_on": ["double", "const"]},
+        ]
+    }
+
+    results = PipelineRunner(pipeline_def).run_with_data([1, 2])
+    assert results == {"double": 3, "const": 4, "total": 7}
+
+
+def test_dag_mode_propagates_step_failure(monkeypatch):
+    class FailingOperator:
+        def __init__(self, **kwargs): pass
+        def run(self, input_data): raise RuntimeError("boom")
+
+    monkeypatch.setattr("findrum.engine.pipeline_runner.get_operator", lambda name: FailingOperator)
+
+    runner = PipelineRunner({"pipeline": [{"id": "a", "operator": "fail"}]}, mode="dag")
+    with pytest.raises(RuntimeError, match="boom"):
+        runner.run()
+
+
+def test_arun_runs_async_steps_concurrently(monkeypatch):
+    import asyncio
+    running = []
+
+    class AsyncSource:
+        def __init__(self, value): self.value = value
+        async def fetch(self):
+            running.append(self.value)
+            while len(running) < 2:
+                await asyncio.sleep(0.001)
+            return self.value
+
+    monkeypatch.setattr("findrum.engine.pipeline_runner.get_datasource", lambda name: AsyncSource)
+
+    pipeline_def = {
+        "pipeline": [
+            {"id": "a", "datasource": "async", "params": {"value": 1}},
+            {"id": "b", "datasource": "async", "params": {"value": 2}},
+            {"id": "total", "operator": "Adder", "depends_on": ["a", "b"]},
+        ]
+    }
+
+    results = asyncio.run(asyncio.wait_for(PipelineRunner(pipeline_def).arun(), timeout=5))
+    assert results == {"a": 1, "b": 2, "total": 3}
+
+
+def test_arun_with_data_mixes_sync_and_async_operators(monkeypatch):
+    import asyncio
+    from findrum.registry.registry import OPERATOR_REGISTRY
+
+    class AsyncDouble:
+        def __init__(self, **kwargs): pass
+        async def run(self, input_data): return input_data * 2
+
+    monkeypatch.setitem(OPERATOR_REGISTRY, "AsyncDouble", AsyncDouble)
+
+    pipeline_def = {
+        "event": {"type": "MyTrigger"},
+        "pipeline": [
+            {"id": "double", "operator": "AsyncDouble", "depends_on": "MyTrigger"},
+            {"id": "const", "operator": "Const", "params": {"value": 7}},
+        ]
+    }
+
+    results = asyncio.run(PipelineRunner(pipeline_def).arun_with_data(21))
+    assert results == {"double": 42, "const": 7}
+
+
+def test_sync_run_awaits_async_steps(monkeypatch):
+    class AsyncSource:
+        def __init__(self, **kwargs): pass
+        async def fetch(self): return "async_data"
+
+    monkeypatch.setattr("findrum.engine.pipeline_runner.get_datasource", lambda name: AsyncSource)
+
+    results = PipelineRunner({"pipeline": [{"id": "a", "datasource": "async"}]}).run()
+    assert results["a"] == "async_data"
+
+
+def test_arun_propagates_step_failure(monkeypatch):
+    import asyncio
+
+    class FailingSource:
+        def __init__(self, **kwargs): pass
+        async def fetch(self): raise RuntimeError("boom")
+
+    monkeypatch.setattr("findrum.engine.pipeline_runner.get_datasource", lambda name: FailingSource)
+
+    runner = PipelineRunner({"pipeline": [{"id": "a", "datasource": "fail"}]})
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(runner.arun())
+
+
+def _retention_pipeline(mode):
+    return {
+        "execution": {"mode": mode},
+        "outputs": ["final"],
+        "pipeline": [
+            {"id": "step1", "operator": "Const", "params": {"value": 2}},
+            {"id": "step2", "operator": "Const", "params": {"value": 3}},
+            {"id": "final", "operator": "Adder", "depends_on": ["step1", "step2"]},
+            {"id": "unused", "operator": "Const", "params": {"value": 4}},
+        ]
+    }
+
+
+@pytest.mark.parametrize("mode", ["sequential", "dag"])
+def test_declared_outputs_free_intermediate_results(mode):
+    results = PipelineRunner(_retention_pipeline(mode)).run()
+    assert results == {"final": 5}
+
+
+def test_declared_outputs_free_results_in_arun():
+    import asyncio
+    results = asyncio.run(PipelineRunner(_retention_pipeline("sequential")).arun())
+    assert results == {"final": 5}
+
+
+def test_intermediate_result_kept_until_last_consumer_runs(monkeypatch):
+    from findrum.registry.registry import OPERATOR_REGISTRY
+    seen = []
+
+    class Recorder:
+        def __init__(self, **kwargs): pass
+        def run(self, input_data):
+            seen.append(sorted(context.results))
+            return input_data
+
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Recorder", Recorder)
+    runner = PipelineRunner({
+        "outputs": "last",
+        "pipeline": [
+            {"id": "source", "operator": "Const", "params": {"value": 1}},
+            {"id": "first", "operator": "Recorder", "depends_on": "source"},
+            {"id": "last", "operator": "Recorder", "depends_on": ["source", "first"]},
+        ]
+    })
+
+    context = runner._new_context()
+    runner._execute_pipeline_with_data(None, context)
+    assert seen == [["source"], ["first", "source"]]
+    assert context.results == {"last": [1, 1]}
+
+
+def test_unknown_output_is_rejected():
+    with pytest.raises(ValueError, match="Output 'missing' is not a step"):
+        PipelineRunner({"outputs": ["missing"], "pipeline": [{"id": "a", "operator": "Const"}]})
@@ -0,0 +1,69 @@
+import os
+import pytest
+import yaml
+from findrum.engine.plan import PipelinePlan, clear_plan_cache, get_plan, invalidate_plan
+from findrum.engine.pipeline_runner import PipelineRunner
+
+
+@pytest.fixture(autouse=True)
+def empty_plan_cache():
+    clear_plan_cache()
+    yield
+    clear_plan_cache()
+
+
+def test_plan_normalizes_params_and_orders_steps():
+    plan = PipelinePlan({
+        "pipeline": [
+            {"id": "b", "operator": "Adder", "depends_on": ["a"]},
+            {"id": "a", "operator": "Const", "params": {"value": 1}},
+        ]
+    })
+    assert plan.params == {"b": {}, "a": {"value": 1}}
+    assert plan.get_order() == ["a", "b"]
+
+
+def test_get_plan_is_cached_until_file_changes(dummy_pipeline_yaml):
+    plan = get_plan(dummy_pipeline_yaml)
+    assert get_plan(dummy_pipeline_yaml) is plan
+
+    with open(dummy_pipeline_yaml, "w") as f:
+        yaml.dump({"pipeline": [{"id": "only", "operator": "Const", "params": {"value": 9}}]}, f)
+
+    new_plan = get_plan(dummy_pipeline_yaml)
+    assert new_plan is not plan
+    assert new_plan.params == {"only": {"value": 9}}
+
+
+def test_get_plan_keeps_plan_when_content_is_unchanged(dummy_pipeline_yaml):
+    plan = get_plan(dummy_pipeline_yaml)
+    stat = os.stat(dummy_pipeline_yaml)
+    os.utime(dummy_pipeline_yaml, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert get_plan(dummy_pipeline_yaml) is plan
+
+
+def test_invalidate_plan(dummy_pipeline_yaml):
+    plan = get_plan(dummy_pipeline_yaml)
+    invalidate_plan(dummy_pipeline_yaml)
+    assert get_plan(dummy_pipeline_yaml) is not plan
+
+
+def test_runners_share_plan_and_resolved_classes(dummy_pipeline_yaml, monkeypatch):
+    PipelineRunner.from_yaml(dummy_pipeline_yaml).run()
+
+    def fail(name):
+        raise AssertionError("registry lookup should be cached")
+
+    monkeypatch.setattr("findrum.engine.pipeline_runner.get_operator", fail)
+    runner = PipelineRunner.from_yaml(dummy_pipeline_yaml)
+    assert runner.plan is get_plan(dummy_pipeline_yaml)
+    assert runner.run()["final"] == 5
+
+
+def test_override_params_does_not_change_plan(dummy_pipeline_yaml):
+    runner = PipelineRunner.from_yaml(dummy_pipeline_yaml)
+    runner.override_params({"step1": {"value": 10}})
+
+    assert runner.run()["final"] == 13
+    assert PipelineRunner.from_yaml(dummy_pipeline_yaml).run()["final"] == 5
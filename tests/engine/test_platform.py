@@ -138,4 +138,103 @@ def test_register_event_pipeline_creates_and_assigns_trigger(temp_event_pipeline
 def test_setup_logging_verbose_mode(_):
     platform = Platform("dummy.yaml", verbose=True)
     logger = logging.getLogger("findrum")
-    assert logger.level == logging.INFO
\ No newline at end of file
+    assert logger.level == logging.INFO
+
+def test_event_emit_is_dispatched_to_runners(temp_event_pipeline_file):
+    EVENT_TRIGGER_REGISTRY["dummy"] = DummyTrigger
+
+    with open(temp_event_pipeline_file, "w") as f:
+        yaml.dump({"event": {"type": "dummy", "dispatch": {"workers": 2}}}, f)
+
+    platform = Platform(extensions_config=temp_event_pipeline_file)
+    platform.register_pipeline(temp_event_pipeline_file)
+
+    runner = MagicMock()
+    event_key = next(iter(platform.event_instances))
+    platform.event_trigger_map[event_key] = [runner]
+
+    assert platform.event_instances[event_key].emit("payload") == 1
+    platform.shutdown()
+    runner.run_with_data.assert_called_once_with("payload")
+
+
+def test_event_pipeline_with_batch_receives_batches(temp_event_pipeline_file):
+    EVENT_TRIGGER_REGISTRY["dummy"] = DummyTrigger
+
+    with open(temp_event_pipeline_file, "w") as f:
+        yaml.dump({"event": {"type": "dummy", "batch": {"max_size": 2, "max_wait": 60}}}, f)
+
+    platform = Platform(extensions_config=temp_event_pipeline_file)
+    platform.register_pipeline(temp_event_pipeline_file)
+
+    runner = next(iter(platform.event_batchers))
+    runner.run_with_data = MagicMock()
+    trigger = next(iter(platform.event_instances.values()))
+
+    for i in range(3):
+        trigger.emit(i)
+    platform.shutdown()
+
+    assert [c.args[0] for c in runner.run_with_data.call_args_list] == [[0, 1], [2]]
+
+
+class CountingScheduler:
+    def __init__(self, config, pipeline_path):
+        self.config = config
+
+    def register(self, scheduler):
+        scheduler.add_job(print, "interval", **self.config)
+
+
+def write_pipelines(directory, count, event_type="dummy"):
+    for i in range(count):
+        definition = {"event": {"type": event_type, "config": {"topic": "prices"}}} if i % 2 else \
+            {"scheduler": {"type": "counting", "config": {"minutes": i + 1}}}
+        (directory / f"pipeline_{i:02}.yaml").write_text(yaml.dump(definition))
+
+
+def test_register_directory(tmp_path):
+    EVENT_TRIGGER_REGISTRY["dummy"] = DummyTrigger
+    SCHEDULER_REGISTRY["counting"] = CountingScheduler
+    write_pipelines(tmp_path, 6)
+    (tmp_path / "notes.txt").write_text("not a pipeline")
+
+    platform = Platform(extensions_config=str(tmp_path / "pipeline_00.yaml"))
+    registered = platform.register_directory(str(tmp_path), max_workers=3)
+
+    assert [os.path.basename(path) for path in registered] == [f"pipeline_0{i}.yaml" for i in range(6)]
+    assert len(platform.scheduler.get_jobs()) == 3
+    assert len(platform.event_instances) == 1
+    assert [len(runners) for runners in platform.event_trigger_map.values()] == [3]
+    assert platform.register_directory(str(tmp_path / "pipeline_0[01].yaml")) == [
+        str(tmp_path / "pipeline_00.yaml"), str(tmp_path / "pipeline_01.yaml")
+    ]
+
+
+def test_register_pipelines_validates_all_before_registering(tmp_path):
+    EVENT_TRIGGER_REGISTRY["dummy"] = DummyTrigger
+    SCHEDULER_REGISTRY["counting"] = CountingScheduler
+    write_pipelines(tmp_path, 2)
+    (tmp_path / "broken.yaml").write_text("- not a dictionary\n")
+    (tmp_path / "unknown.yaml").write_text(yaml.dump({"event": {"type": "missing"}}))
+    paths = [str(tmp_path / name) for name in ("pipeline_00.yaml", "broken.yaml", "unknown.yaml", "absent.yaml")]
+
+    platform = Platform(extensions_config=paths[0])
+    with pytest.raises(ValueError, match="3 of 4 pipelines are invalid") as error:
+        platform.register_pipelines(paths)
+
+    message = str(error.value)
+    assert "broken.yaml must contain a valid dictionary" in message
+    assert "Trigger 'missing' not found" in message
+    assert "Pipeline not found" in message
+    assert platform.pipelines == {}
+    assert platform.scheduler.get_jobs() == []
+
+
+def test_cli_registers_directories(tmp_path):
+    with patch("sys.argv", ["prog", str(tmp_path)]), patch("findrum.engine.platform.Platform") as platform_class:
+        from findrum.__main__ import main
+
+        main()
+
+    platform_class.return_value.register_directory.assert_called_once_with(str(tmp_path))
@@ -0,0 +1,109 @@
+import os
+import asyncio
+import numpy as np
+import pandas as pd
+import pytest
+from findrum.engine.pipeline_runner import PipelineRunner
+from findrum.engine.process import discard, load, share, shutdown_process_pool, submit_shared
+from findrum.registry.registry import DATASOURCE_REGISTRY, OPERATOR_REGISTRY
+
+
+class Frame:
+    def __init__(self, rows=20000): self.rows = rows
+    def fetch(self):
+        return pd.DataFrame(np.arange(self.rows * 4, dtype="float64").reshape(self.rows, 4), columns=list("abcd"))
+
+
+class Pid:
+    def __init__(self): pass
+    def run(self, input_data):
+        return input_data.assign(pid=os.getpid(), total=input_data.sum(axis=1))
+
+
+def scale(factor, frame):
+    return frame * factor
+
+
+@pytest.fixture(autouse=True)
+def pool():
+    yield
+    shutdown_process_pool()
+
+
+@pytest.fixture
+def steps(monkeypatch):
+    monkeypatch.setitem(DATASOURCE_REGISTRY, "Frame", Frame)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Pid", Pid)
+
+
+def shm_segments():
+    return set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+
+
+def test_share_roundtrip_uses_shared_memory():
+    before = shm_segments()
+    frame = Frame().fetch()
+    payload = share(frame)
+
+    assert payload.name is not None and payload.spans
+    pd.testing.assert_frame_equal(load(payload), frame)
+    assert shm_segments() == before
+
+
+def test_small_values_are_sent_inline():
+    payload = share({"a": 1, "b": np.arange(3)})
+    assert payload.name is None
+    assert load(payload)["a"] == 1
+
+
+def test_discard_frees_the_segment():
+    before = shm_segments()
+    discard(share(Frame().fetch()))
+    assert shm_segments() == before
+
+
+def test_submit_shared():
+    frame = Frame().fetch()
+    pd.testing.assert_frame_equal(submit_shared(scale, (2,), frame).result(), frame * 2)
+
+
+def test_process_step_runs_in_worker(steps):
+    runner = PipelineRunner({
+        "pipeline": [
+            {"id": "frame", "datasource": "Frame"},
+            {"id": "pid", "operator": "Pid", "depends_on": "frame", "executor": "process"},
+        ]
+    })
+
+    result = runner.run()["pid"]
+
+    assert (result["pid"] != os.getpid()).all()
+    assert result["total"].iloc[1] == 4 + 5 + 6 + 7
+
+
+def test_process_step_in_async_run(steps):
+    runner = PipelineRunner({
+        "pipeline": [
+            {"id": "frame", "datasource": "Frame", "params": {"rows": 10}},
+            {"id": "pid", "operator": "Pid", "depends_on": "frame", "executor": "process"},
+        ]
+    })
+
+    assert (asyncio.run(runner.arun())["pid"]["pid"] != os.getpid()).all()
+
+
+def test_process_step_requires_importable_class(monkeypatch):
+    class Local:
+        def __init__(self): pass
+        def run(self, input_data): return input_data
+
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Local", Local)
+    runner = PipelineRunner({"pipeline": [{"id": "local", "operator": "Local", "executor": "process"}]})
+
+    with pytest.raises(ValueError, match="cannot be imported by the workers"):
+        runner.run()
+
+
+def test_unknown_step_executor():
+    with pytest.raises(ValueError, match="Unknown executor 'gpu' for step 'x'"):
+        PipelineRunner({"pipeline": [{"id": "x", "operator": "Op", "executor": "gpu"}]})
@@ -0,0 +1,291 @@
+import os
+import sys
+import pytest
+import yaml
+from unittest.mock import patch
+
+import findrum.__main__ as main_module
+from findrum.engine.plan import clear_plan_cache
+from findrum.engine.platform import Platform
+from findrum.interfaces.scheduler import Scheduler
+from findrum.registry.registry import EVENT_TRIGGER_REGISTRY, OPERATOR_REGISTRY, SCHEDULER_REGISTRY
+
+RESULTS = []
+
+
+class Trigger:
+    def __init__(self, **kwargs):
+        self.emit = None
+        self.started = False
+
+    def start(self):
+        self.started = True
+
+
+class Scale:
+    instances = 0
+
+    def __init__(self, factor):
+        Scale.instances += 1
+        self.factor = factor
+
+    def run(self, input_data):
+        RESULTS.append(input_data * self.factor)
+        return input_data * self.factor
+
+
+class Shift(Scale):
+    pass
+
+
+class IntervalScheduler(Scheduler):
+    def register(self, scheduler):
+        scheduler.add_job(self._run_pipeline, "interval", **self.config)
+
+    def _run_pipeline(self):
+        pass
+
+
+class Count:
+    def __init__(self, step=1):
+        self.step = step
+
+    def run(self, input_data, state):
+        state.watermark = (state.watermark or 0) + self.step
+        return state.watermark
+
+
+@pytest.fixture(autouse=True)
+def extensions(monkeypatch):
+    RESULTS.clear()
+    Scale.instances = 0
+    monkeypatch.setitem(EVENT_TRIGGER_REGISTRY, "Trigger", Trigger)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Scale", Scale)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Shift", Shift)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Count", Count)
+    monkeypatch.setitem(SCHEDULER_REGISTRY, "Interval", IntervalScheduler)
+    yield
+    clear_plan_cache()
+
+
+@pytest.fixture
+def platform(tmp_path):
+    config = tmp_path / "config.yaml"
+    config.write_text("{}\n")
+    platform = Platform(str(config))
+    yield platform
+    platform.shutdown()
+
+
+def event_pipeline(path, factor, operator="Scale", **extra):
+    path.write_text(yaml.dump({
+        "event": {"type": "Trigger", "config": {"topic": "prices"}},
+        "pipeline": [{"id": "scale", "operator": operator, "depends_on": "Trigger", "params": {"factor": factor}}],
+        **extra,
+    }))
+    return str(path)
+
+
+def scheduled_pipeline(path, minutes):
+    path.write_text(yaml.dump({"scheduler": {"type": "Interval", "config": {"minutes": minutes}}, "pipeline": []}))
+    return str(path)
+
+
+def emit(platform, data):
+    [trigger] = platform.event_instances.values()
+    trigger.emit(data)
+    [dispatcher] = platform.event_dispatchers.values()
+    dispatcher.queue.join()
+
+
+def test_reload_swaps_the_event_runner(tmp_path, platform):
+    path = event_pipeline(tmp_path / "event.yaml", 2)
+    platform.register_pipeline(path)
+    [key] = platform.event_trigger_map
+    [old_runner] = platform.event_trigger_map[key]
+    emit(platform, 5)
+
+    event_pipeline(tmp_path / "event.yaml", 30)
+    assert platform.check_for_changes() == [path]
+
+    [runner] = platform.event_trigger_map[key]
+    assert runner is not old_runner
+    assert len(platform.event_instances) == 1
+    emit(platform, 5)
+    assert RESULTS == [10, 150]
+
+
+def test_reload_keeps_instances_of_unchanged_steps(tmp_path, platform):
+    path = event_pipeline(tmp_path / "event.yaml", 2)
+    platform.register_pipeline(path)
+    emit(platform, 1)
+    pool = platform.pipelines[path]["plan"].instances
+
+    event_pipeline(tmp_path / "event.yaml", 2, outputs=["scale"])
+    platform.reload_pipeline(path)
+    emit(platform, 1)
+
+    assert platform.pipelines[path]["plan"].instances is pool
+    assert Scale.instances == 1
+
+
+def test_reload_does_not_reuse_instances_of_replaced_operators(tmp_path, platform):
+    path = event_pipeline(tmp_path / "event.yaml", 2)
+    platform.register_pipeline(path)
+    pool = platform.pipelines[path]["plan"].instances
+
+    event_pipeline(tmp_path / "event.yaml", 2, operator="Shift")
+    platform.reload_pipeline(path)
+
+    assert platform.pipelines[path]["plan"].instances is not pool
+
+
+def counting_pipeline(path, step, **extra):
+    path.write_text(yaml.dump({
+        "event": {"type": "Trigger", "config": {"topic": "prices"}},
+        "pipeline": [{
+            "id": "count", "operator": "Count", "depends_on": "Trigger", "params": {"step": step}, "state": True,
+            "circuit_breaker": {"failures": 3},
+        }],
+        **extra,
+    }))
+    return str(path)
+
+
+@pytest.mark.parametrize("reuse_instances", [True, False])
+def test_reload_keeps_state_and_breakers(tmp_path, platform, reuse_instances):
+    path = counting_pipeline(tmp_path / "event.yaml", 1)
+    platform.register_pipeline(path)
+    for _ in range(3):
+        emit(platform, None)
+    old_plan = platform.pipelines[path]["plan"]
+    breaker = old_plan.breakers["count"]
+
+    counting_pipeline(tmp_path / "event.yaml", 10)
+    platform.reload_pipeline(path, reuse_instances=reuse_instances)
+    runner = platform.pipelines[path]["runner"]
+
+    assert runner.run_with_data(None)["count"] == 13
+    assert runner.plan.breakers["count"] is breaker
+
+
+def test_replaced_plans_are_closed_on_shutdown(tmp_path, platform):
+    sinks = {"sinks": [{"type": "jsonl", "path": str(tmp_path / "metrics.jsonl")}]}
+    path = event_pipeline(tmp_path / "event.yaml", 2, instrumentation=sinks)
+    platform.register_pipeline(path)
+    emit(platform, 1)
+    [sink] = platform.pipelines[path]["plan"].get_instrumentation().sinks
+    pool = platform.pipelines[path]["plan"].instances
+
+    event_pipeline(tmp_path / "event.yaml", 2, instrumentation=sinks, outputs=["scale"])
+    platform.reload_pipeline(path)
+    assert platform.pipelines[path]["plan"].instances is pool
+
+    platform.shutdown()
+    assert sink._file.closed
+    assert len(pool) == 0
+
+
+def test_reload_reschedules_jobs(tmp_path, platform):
+    path = scheduled_pipeline(tmp_path / "scheduled.yaml", 5)
+    other = scheduled_pipeline(tmp_path / "other.yaml", 1)
+    platform.register_pipeline(path)
+    platform.register_pipeline(other)
+
+    scheduled_pipeline(tmp_path / "scheduled.yaml", 15)
+    platform.reload_pipeline(path)
+
+    intervals = sorted(job.trigger.interval.total_seconds() for job in platform.scheduler.get_jobs())
+    assert intervals == [60, 900]
+    assert platform.pipelines[path]["jobs"] != []
+
+
+def test_has_jobs_does_not_create_the_scheduler(tmp_path, platform):
+    platform.register_pipeline(event_pipeline(tmp_path / "event.yaml", 2))
+    assert not platform.has_jobs()
+    assert platform._scheduler is None
+
+    platform.register_pipeline(scheduled_pipeline(tmp_path / "scheduled.yaml", 5))
+    assert platform.has_jobs()
+
+
+def test_invalid_change_keeps_the_running_pipeline(tmp_path, platform):
+    path = event_pipeline(tmp_path / "event.yaml", 2)
+    platform.register_pipeline(path)
+    [runner] = next(iter(platform.event_trigger_map.values()))
+
+    (tmp_path / "event.yaml").write_text("- not a pipeline\n")
+    assert platform.check_for_changes() == []
+    assert next(iter(platform.event_trigger_map.values())) == [runner]
+
+
+def test_reload_extension_modules(tmp_path, platform, monkeypatch):
+    module = tmp_path / "reloadable_ops.py"
+    module.write_text("class Offset:\n    def __init__(self, factor):\n        self.factor = factor\n"
+                      "    def run(self, input_data):\n        return input_data + 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    monkeypatch.delitem(sys.modules, "reloadable_ops", raising=False)
+    import reloadable_ops
+
+    old_class = reloadable_ops.Offset
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Offset", old_class)
+
+    path = event_pipeline(tmp_path / "event.yaml", 2, operator="Offset")
+    untouched = event_pipeline(tmp_path / "untouched.yaml", 2)
+    platform.register_pipeline(path)
+    platform.register_pipeline(untouched)
+    platform.check_for_changes()
+    untouched_runner = platform.pipelines[untouched]["runner"]
+
+    module.write_text(module.read_text().replace("input_data + 1", "input_data + 100  # changed"))
+    stat = os.stat(module)
+    os.utime(module, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert platform.check_for_changes() == [path]
+    assert OPERATOR_REGISTRY["Offset"] is reloadable_ops.Offset is not old_class
+    assert platform.pipelines[path]["runner"].run_with_data(1)["scale"] == 101
+    assert platform.pipelines[untouched]["runner"] is untouched_runner
+
+
+def test_watch_stops_on_shutdown(tmp_path, platform):
+    path = event_pipeline(tmp_path / "event.yaml", 2)
+    platform.register_pipeline(path)
+    platform.watch(interval=0.01)
+    watcher = platform._watcher
+    assert watcher.is_alive()
+
+    platform.shutdown()
+    assert not watcher.is_alive()
+    assert platform._watcher is None
+
+
+def test_cli_watch():
+    with patch.object(sys, "argv", ["prog", "pipeline.yaml", "--watch"]), \
+            patch("findrum.engine.platform.Platform") as platform_class:
+        main_module.main()
+
+    platform = platform_class.return_value
+    platform.watch.assert_called_once_with()
+    platform.start.assert_called_once_with()
+
+
+def test_invalid_definition_keeps_the_running_pipeline(tmp_path, platform):
+    path = event_pipeline(tmp_path / "event.yaml", 2)
+    platform.register_pipeline(path)
+    [key] = platform.event_trigger_map
+    [runner] = platform.event_trigger_map[key]
+
+    event_pipeline(tmp_path / "event.yaml", 3, execution={"mode": "bogus"})
+    assert platform.check_for_changes() == []
+    assert platform.check_for_changes() == []
+
+    assert platform.event_trigger_map[key] == [runner]
+    assert platform.pipelines[path]["runner"] is runner
+    emit(platform, 5)
+    assert RESULTS == [10]
+
+    event_pipeline(tmp_path / "event.yaml", 3)
+    assert platform.check_for_changes() == [path]
+    emit(platform, 5)
+    assert RESULTS == [10, 15]
@@ -0,0 +1,258 @@
+import time
+import asyncio
+import threading
+import pytest
+
+from findrum.engine import resilience
+from findrum.engine.pipeline_runner import PipelineRunner
+from findrum.engine.process import shutdown_process_pool
+from findrum.engine.resilience import CircuitBreaker, RetryPolicy, create_circuit_breaker, create_retry_policy
+from findrum.registry.registry import DATASOURCE_REGISTRY, OPERATOR_REGISTRY
+
+RELEASE = threading.Event()
+
+
+class Flaky:
+    calls = 0
+
+    def __init__(self, failures=2):
+        self.failures = failures
+
+    def fetch(self):
+        Flaky.calls += 1
+        if Flaky.calls <= self.failures:
+            raise ConnectionError("upstream unavailable")
+        return [1, 2, 3]
+
+
+class Hang:
+    def __init__(self): pass
+
+    def run(self, input_data):
+        RELEASE.wait(5)
+        return input_data
+
+
+class Sleep:
+    def __init__(self, seconds): self.seconds = seconds
+
+    def run(self, input_data):
+        time.sleep(self.seconds)
+        return input_data
+
+
+class AsyncHang:
+    def __init__(self): pass
+
+    async def run(self, input_data):
+        await asyncio.sleep(5)
+        return input_data
+
+
+class AsyncFlaky:
+    calls = 0
+
+    def __init__(self): pass
+
+    async def run(self, input_data):
+        AsyncFlaky.calls += 1
+        if AsyncFlaky.calls == 1:
+            raise ConnectionError("upstream unavailable")
+        return sum(input_data)
+
+
+class Watermarked:
+    calls = 0
+
+    def __init__(self, delay=0):
+        self.delay = delay
+
+    def fetch(self, state):
+        Watermarked.calls += 1
+        start = state.watermark + 1 if state.watermark is not None else 0
+        rows = list(range(start, 5))
+        state.watermark = rows[-1] if rows else state.watermark
+        if Watermarked.calls == 1:
+            time.sleep(self.delay)
+            if not self.delay:
+                raise ConnectionError("lost the connection after reading")
+        return rows
+
+
+@pytest.fixture(autouse=True)
+def steps(monkeypatch):
+    Flaky.calls = AsyncFlaky.calls = Watermarked.calls = 0
+    RELEASE.clear()
+    monkeypatch.setitem(DATASOURCE_REGISTRY, "Flaky", Flaky)
+    monkeypatch.setitem(DATASOURCE_REGISTRY, "Watermarked", Watermarked)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Hang", Hang)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Sleep", Sleep)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "AsyncFlaky", AsyncFlaky)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "AsyncHang", AsyncHang)
+    yield
+    RELEASE.set()
+    shutdown_process_pool()
+
+
+def pipeline(*steps, **execution):
+    return {"execution": execution, "pipeline": list(steps)}
+
+
+def flaky(failures=2, **policies):
+    return {"id": "fetch", "datasource": "Flaky", "params": {"failures": failures}, **policies}
+
+
+def test_retry_delays():
+    policy = RetryPolicy(max_attempts=5, backoff=1.0, max_backoff=3.0, jitter=False)
+    assert [policy.delay(attempt) for attempt in range(1, 5)] == [1.0, 2.0, 3.0, 3.0]
+    assert 0 <= RetryPolicy(backoff=2.0).delay(3) <= 8.0
+
+
+def test_create_policies():
+    assert create_retry_policy(None) is None
+    assert create_retry_policy(4).max_attempts == 4
+    assert create_retry_policy(True).max_attempts == 3
+    assert create_retry_policy({"max_attempts": 2, "backoff": 0.5}).backoff == 0.5
+    with pytest.raises(ValueError, match="at least 1"):
+        create_retry_policy({"max_attempts": 0})
+
+    assert create_circuit_breaker("step", None) is None
+    assert create_circuit_breaker("step", {"failures": 2}).failures == 2
+
+
+def test_circuit_breaker_opens_and_recovers(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker("fetch", failures=2, cooldown=10)
+
+    breaker.record_failure()
+    breaker.check()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(RuntimeError, match="Circuit breaker of step 'fetch' is open"):
+        breaker.check()
+
+    now[0] = 11
+    assert breaker.state == "half-open"
+    breaker.check()
+    with pytest.raises(RuntimeError):
+        breaker.check()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    now[0] = 22
+    breaker.check()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+@pytest.mark.parametrize("execution", [{}, {"mode": "dag"}])
+def test_retry_recovers_flaky_steps(execution):
+    runner = PipelineRunner(pipeline(flaky(retry={"max_attempts": 3, "backoff": 0}), **execution))
+    assert runner.run()["fetch"] == [1, 2, 3]
+    assert Flaky.calls == 3
+
+
+def test_retry_gives_up_after_max_attempts():
+    runner = PipelineRunner(pipeline(flaky(failures=5, retry={"max_attempts": 2, "backoff": 0})))
+    with pytest.raises(ConnectionError):
+        runner.run()
+    assert Flaky.calls == 2
+
+
+def test_async_retry():
+    runner = PipelineRunner(pipeline(
+        flaky(failures=0),
+        {"id": "total", "operator": "AsyncFlaky", "depends_on": "fetch", "retry": {"backoff": 0}},
+    ))
+    assert asyncio.run(runner.arun())["total"] == 6
+    assert AsyncFlaky.calls == 2
+
+
+@pytest.mark.parametrize("policies", [
+    {"retry": {"max_attempts": 3, "backoff": 0}},
+    {"retry": {"max_attempts": 3, "backoff": 0}, "timeout": 0.2},
+])
+def test_failed_attempts_do_not_stage_state(policies):
+    runner = PipelineRunner(pipeline({"id": "f", "datasource": "Watermarked", "state": True, **policies}))
+    assert runner.run()["f"] == [0, 1, 2, 3, 4]
+    assert Watermarked.calls == 2
+
+
+def test_timed_out_attempts_do_not_stage_state():
+    runner = PipelineRunner(pipeline({
+        "id": "f", "datasource": "Watermarked", "params": {"delay": 0.5}, "state": True,
+        "retry": {"max_attempts": 2, "backoff": 0}, "timeout": 0.2,
+    }))
+    assert runner.run()["f"] == [0, 1, 2, 3, 4]
+    time.sleep(0.5)
+    assert runner.run()["f"] == []
+    assert Watermarked.calls == 3
+
+
+def test_async_failed_attempts_do_not_stage_state():
+    runner = PipelineRunner(pipeline({"id": "f", "datasource": "Watermarked", "state": True, "retry": {"backoff": 0}}))
+    assert asyncio.run(runner.arun())["f"] == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("execution", [{}, {"mode": "dag"}])
+def test_timeout_releases_the_run(execution):
+    runner = PipelineRunner(pipeline(
+        flaky(failures=0),
+        {"id": "hang", "operator": "Hang", "depends_on": "fetch", "timeout": 0.1},
+        **execution,
+    ))
+    started = time.perf_counter()
+    with pytest.raises(TimeoutError, match="Step 'hang' timed out after 0.1s"):
+        runner.run()
+    assert time.perf_counter() - started < 2
+
+
+@pytest.mark.parametrize("execution, step", [({}, {"executor": "process"}), ({"mode": "dag", "executor": "process"}, {})])
+def test_timeout_of_process_steps(execution, step):
+    runner = PipelineRunner(pipeline(
+        flaky(failures=0),
+        {"id": "sleep", "operator": "Sleep", "depends_on": "fetch", "params": {"seconds": 1.5}, "timeout": 0.2, **step},
+        **execution,
+    ))
+    started = time.perf_counter()
+    with pytest.raises(TimeoutError, match="Step 'sleep' timed out"):
+        runner.run()
+    assert time.perf_counter() - started < 1.2
+
+
+def test_async_timeout():
+    runner = PipelineRunner(pipeline(
+        flaky(failures=0),
+        {"id": "hang", "operator": "AsyncHang", "depends_on": "fetch", "timeout": 0.1},
+    ))
+    started = time.perf_counter()
+    with pytest.raises(TimeoutError, match="Step 'hang' timed out"):
+        asyncio.run(runner.arun())
+    assert time.perf_counter() - started < 2
+
+
+def test_circuit_breaker_fails_fast_across_runs():
+    runner = PipelineRunner(pipeline(flaky(failures=10, circuit_breaker={"failures": 2, "cooldown": 60})))
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            runner.run()
+
+    with pytest.raises(RuntimeError, match="Circuit breaker of step 'fetch' is open"):
+        runner.run()
+    assert Flaky.calls == 2
+
+
+def test_open_circuit_stops_retries():
+    runner = PipelineRunner(pipeline(flaky(
+        failures=10, retry={"max_attempts": 5, "backoff": 0}, circuit_breaker={"failures": 2, "cooldown": 60},
+    )))
+    with pytest.raises(RuntimeError, match="is open"):
+        runner.run()
+    assert Flaky.calls == 2
+
+
+@pytest.mark.parametrize("timeout", [0, -1, "10s", True])
+def test_invalid_timeout(timeout):
+    with pytest.raises(ValueError, match="Timeout of step 'fetch' must be a positive number"):
+        PipelineRunner(pipeline(flaky(timeout=timeout)))
@@ -0,0 +1,180 @@
+import threading
+import pytest
+import yaml
+from unittest.mock import patch
+from apscheduler.executors.pool import ProcessPoolExecutor, ThreadPoolExecutor
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.blocking import BlockingScheduler
+
+from findrum.engine.platform import Platform
+from findrum.engine.scheduling import JobScheduler, create_scheduler, split_job_options
+from findrum.interfaces.scheduler import Scheduler
+from findrum.registry.registry import SCHEDULER_REGISTRY
+
+
+class IntervalScheduler(Scheduler):
+    configs = []
+
+    def register(self, scheduler):
+        IntervalScheduler.configs.append(self.config)
+        scheduler.add_job(self._run_pipeline, "interval", id=self.pipeline_path, **self.config)
+
+    def _run_pipeline(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def scheduler_type(monkeypatch):
+    IntervalScheduler.configs.clear()
+    monkeypatch.setitem(SCHEDULER_REGISTRY, "Interval", IntervalScheduler)
+
+
+@pytest.fixture
+def config(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("{}\n")
+    return str(path)
+
+
+def scheduled_pipeline(tmp_path, **config):
+    path = tmp_path / "scheduled.yaml"
+    path.write_text(yaml.dump({"scheduler": {"type": "Interval", "config": config}, "pipeline": []}))
+    return str(path)
+
+
+@pytest.mark.parametrize("backend, scheduler_class", [
+    ("blocking", BlockingScheduler), ("background", BackgroundScheduler), ("asyncio", AsyncIOScheduler),
+])
+def test_create_scheduler_backends(backend, scheduler_class):
+    assert isinstance(create_scheduler(backend), scheduler_class)
+
+
+@pytest.mark.parametrize("executor, executor_class", [("thread", ThreadPoolExecutor), ("process", ProcessPoolExecutor)])
+def test_create_scheduler_executors(executor, executor_class):
+    scheduler = create_scheduler("background", executor, max_workers=3)
+    scheduler.start(paused=True)
+    try:
+        assert isinstance(scheduler._lookup_executor("default"), executor_class)
+    finally:
+        scheduler.shutdown(wait=False)
+
+
+PROCESS_EXTENSIONS = """
+import os
+from findrum.interfaces.scheduler import Scheduler
+
+
+class OnceScheduler(Scheduler):
+    def register(self, scheduler):
+        scheduler.add_job(self._run_pipeline)
+
+
+class Pid:
+    def __init__(self): pass
+    def fetch(self):
+        return os.getpid()
+
+
+class Write:
+    def __init__(self, path): self.path = path
+    def run(self, input_data):
+        with open(self.path, "w") as f:
+            f.write(str(input_data))
+        return input_data
+"""
+
+
+def test_process_executor_runs_pipelines(tmp_path, monkeypatch):
+    import os
+    import time
+
+    (tmp_path / "process_extensions.py").write_text(PROCESS_EXTENSIONS)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    config = tmp_path / "config.yaml"
+    config.write_text(yaml.dump({
+        "schedulers": ["process_extensions.OnceScheduler"],
+        "datasources": ["process_extensions.Pid"],
+        "operators": ["process_extensions.Write"],
+    }))
+    output = tmp_path / "pid.txt"
+    pipeline = tmp_path / "pipeline.yaml"
+    pipeline.write_text(yaml.dump({
+        "scheduler": {"type": "OnceScheduler"},
+        "pipeline": [
+            {"id": "pid", "datasource": "Pid"},
+            {"id": "write", "operator": "Write", "depends_on": "pid", "params": {"path": str(output)}},
+        ],
+    }))
+
+    platform = Platform(str(config), scheduling={"backend": "background", "executor": "process", "max_workers": 1})
+    platform.register_pipeline(str(pipeline))
+    platform.scheduler.start()
+    try:
+        deadline = time.monotonic() + 30
+        while not output.exists() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert output.exists()
+        assert int(output.read_text()) != os.getpid()
+    finally:
+        platform.shutdown()
+
+
+def test_create_scheduler_rejects_unknown_settings():
+    with pytest.raises(ValueError, match="Unknown scheduler backend 'gevent'"):
+        create_scheduler("gevent")
+    with pytest.raises(ValueError, match="Unknown scheduler executor 'fiber'"):
+        create_scheduler("background", "fiber")
+
+
+def test_split_job_options():
+    assert split_job_options({"minutes": 5, "max_instances": 2, "coalesce": True}) == (
+        {"minutes": 5}, {"max_instances": 2, "coalesce": True}
+    )
+
+
+def test_job_scheduler_applies_defaults():
+    scheduler = BackgroundScheduler()
+    view = JobScheduler(scheduler, {"max_instances": 3, "coalesce": True})
+
+    job = view.add_job(print, "interval", minutes=1)
+    override = view.add_job(print, "interval", minutes=1, max_instances=1)
+
+    assert (job.max_instances, job.coalesce) == (3, True)
+    assert override.max_instances == 1
+    assert view.get_jobs() == scheduler.get_jobs()
+
+
+def test_platform_applies_job_options(tmp_path, config):
+    platform = Platform(config)
+    path = scheduled_pipeline(tmp_path, minutes=5, max_instances=2, coalesce=True, misfire_grace_time=30)
+    platform.register_pipeline(path)
+
+    [job] = platform.scheduler.get_jobs()
+    assert (job.max_instances, job.coalesce, job.misfire_grace_time) == (2, True, 30)
+    assert IntervalScheduler.configs == [{"minutes": 5}]
+
+
+def test_background_backend_does_not_block_the_caller(tmp_path, config):
+    platform = Platform(config, scheduling={"backend": "background", "max_workers": 2})
+    platform.register_pipeline(scheduled_pipeline(tmp_path, minutes=5))
+    assert isinstance(platform.scheduler, BackgroundScheduler)
+
+    with patch("time.sleep", side_effect=KeyboardInterrupt):
+        platform.start()
+    assert not platform.scheduler.running
+
+
+def test_asyncio_backend_runs_jobs_on_its_loop(tmp_path, config):
+    platform = Platform(config, scheduling={"backend": "asyncio"})
+    ran = threading.Event()
+
+    def job():
+        ran.set()
+        platform._event_loop.call_soon_threadsafe(platform._event_loop.stop)
+
+    platform.scheduler.add_job(job)
+    platform.start()
+
+    assert ran.is_set()
+    assert not platform.scheduler.running
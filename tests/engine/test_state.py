@@ -0,0 +1,259 @@
+import pytest
+import yaml
+import pandas as pd
+
+from findrum.engine.pipeline_runner import PipelineRunner
+from findrum.engine.plan import PipelinePlan
+from findrum.engine.state import (
+    MemoryStateStore, SQLiteStateStore, StepState, create_state_store, filter_delta,
+)
+from findrum.registry.registry import DATASOURCE_REGISTRY, OPERATOR_REGISTRY
+
+HISTORY = [{"ts": ts, "price": ts * 10} for ts in range(1, 6)]
+
+
+class Prices:
+    available = 3
+    calls = []
+
+    def __init__(self): pass
+
+    def fetch(self, state):
+        Prices.calls.append(state.watermark)
+        rows = [row for row in HISTORY[:Prices.available] if state.watermark is None or row["ts"] > state.watermark]
+        if rows:
+            state.watermark = rows[-1]["ts"]
+        return rows
+
+
+class FullHistory:
+    def __init__(self): pass
+
+    def fetch(self):
+        return HISTORY[:Prices.available]
+
+
+class Collect:
+    seen = []
+
+    def __init__(self): pass
+
+    def run(self, input_data):
+        Collect.seen.append([row["ts"] for row in input_data])
+        return input_data
+
+
+class Fail:
+    enabled = False
+
+    def __init__(self): pass
+
+    def run(self, input_data):
+        if Fail.enabled:
+            raise RuntimeError("downstream failure")
+        return input_data
+
+
+@pytest.fixture(autouse=True)
+def steps(monkeypatch):
+    Prices.available = 3
+    Prices.calls.clear()
+    Collect.seen.clear()
+    Fail.enabled = False
+    monkeypatch.setitem(DATASOURCE_REGISTRY, "Prices", Prices)
+    monkeypatch.setitem(DATASOURCE_REGISTRY, "FullHistory", FullHistory)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Collect", Collect)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Fail", Fail)
+
+
+def incremental(**extra):
+    return {
+        "name": "prices",
+        "pipeline": [
+            {"id": "prices", "datasource": "Prices", "state": True},
+            {"id": "check", "operator": "Fail", "depends_on": "prices"},
+        ],
+        **extra,
+    }
+
+
+@pytest.mark.parametrize("store", [MemoryStateStore, lambda: SQLiteStateStore(":memory:")])
+def test_store_round_trip(store):
+    store = store()
+    assert store.load("a") == {}
+    store.save("a", {"watermark": pd.Timestamp("2024-01-01")})
+    assert store.load("a") == {"watermark": pd.Timestamp("2024-01-01")}
+    store.close()
+
+
+def test_sqlite_store_persists(tmp_path):
+    path = str(tmp_path / "state.db")
+    store = SQLiteStateStore(path)
+    store.save("a", {"watermark": 3})
+    store.close()
+
+    store = SQLiteStateStore(path)
+    assert store.load("a") == {"watermark": 3}
+    store.close()
+
+
+def test_create_state_store(tmp_path):
+    assert isinstance(create_state_store(None), MemoryStateStore)
+    store = create_state_store({"backend": "sqlite", "path": str(tmp_path / "s.db")})
+    assert isinstance(store, SQLiteStateStore)
+    store.close()
+    with pytest.raises(ValueError, match="Unknown state backend 'redis'"):
+        create_state_store({"backend": "redis"})
+
+
+def test_step_state_stages_changes_until_commit():
+    store = MemoryStateStore()
+    state = StepState(store, "a")
+    state.watermark = 5
+    assert state.watermark == 5
+    assert store.load("a") == {}
+
+    state.commit()
+    assert store.load("a") == {"watermark": 5}
+    assert StepState(store, "a").watermark == 5
+
+
+def test_filter_delta():
+    assert filter_delta(HISTORY, "ts", None) == (HISTORY, 5)
+    assert filter_delta(HISTORY, "ts", 3) == (HISTORY[3:], 5)
+    assert filter_delta(HISTORY, "ts", 5) == ([], 5)
+
+    frame = pd.DataFrame(HISTORY)
+    delta, watermark = filter_delta(frame, "ts", 2)
+    assert list(delta["ts"]) == [3, 4, 5]
+    assert watermark == 5
+
+    with pytest.raises(TypeError):
+        filter_delta(42, "ts", None)
+
+
+def test_datasource_fetches_from_watermark():
+    runner = PipelineRunner(incremental())
+
+    assert len(runner.run()["prices"]) == 3
+    Prices.available = 5
+    assert [row["ts"] for row in runner.run()["prices"]] == [4, 5]
+    assert runner.run()["prices"] == []
+    assert Prices.calls == [None, 3, 5]
+
+
+def test_watermark_is_kept_when_the_run_fails():
+    runner = PipelineRunner(incremental())
+    runner.run()
+    Prices.available = 5
+
+    Fail.enabled = True
+    with pytest.raises(RuntimeError):
+        runner.run()
+    Fail.enabled = False
+
+    assert [row["ts"] for row in runner.run()["prices"]] == [4, 5]
+
+
+def test_state_persists_across_plans(tmp_path):
+    definition = incremental(state={"backend": "sqlite", "path": str(tmp_path / "state.db")})
+    plan = PipelinePlan(definition)
+    PipelineRunner(plan).run()
+    plan.close()
+
+    Prices.available = 4
+    assert [row["ts"] for row in PipelineRunner(PipelinePlan(definition)).run()["prices"]] == [4]
+
+
+def test_pipelines_with_the_same_file_name_keep_separate_state(tmp_path):
+    state = {"backend": "sqlite", "path": str(tmp_path / "state.db")}
+    paths = []
+    for directory in ("equities", "fx"):
+        (tmp_path / directory).mkdir()
+        path = tmp_path / directory / "prices.yaml"
+        path.write_text(yaml.dump(incremental(state=state)))
+        paths.append(str(path))
+
+    runners = [PipelineRunner.from_yaml(path) for path in paths]
+    assert len(runners[0].run()["prices"]) == 3
+    assert len(runners[1].run()["prices"]) == 3
+    for runner in runners:
+        runner.close()
+
+
+def test_sqlite_state_of_unnamed_pipelines_needs_a_key(tmp_path):
+    definition = incremental(state={"backend": "sqlite", "path": str(tmp_path / "state.db")})
+    del definition["name"]
+    with pytest.raises(ValueError, match="Step 'prices' keeps state in a shared store and needs a state key"):
+        PipelineRunner(definition)
+
+    definition["pipeline"][0]["state"] = {"key": "prices"}
+    PipelineRunner(definition).close()
+
+
+def test_state_key_override_shares_state():
+    definition = incremental()
+    definition["pipeline"][0]["state"] = {"key": "shared"}
+    plan = PipelinePlan(definition)
+    PipelineRunner(plan).run()
+
+    assert plan.get_state_store().load("shared") == {"watermark": 3}
+
+
+def test_operator_receives_delta():
+    runner = PipelineRunner({
+        "pipeline": [
+            {"id": "history", "datasource": "FullHistory"},
+            {"id": "collect", "operator": "Collect", "depends_on": "history", "delta": "ts"},
+        ]
+    })
+
+    runner.run()
+    Prices.available = 5
+    runner.run()
+    runner.run()
+
+    assert Collect.seen == [[1, 2, 3], [4, 5], []]
+
+
+def test_async_run_commits_state():
+    import asyncio
+
+    runner = PipelineRunner(incremental())
+    asyncio.run(runner.arun())
+    Prices.available = 4
+    assert [row["ts"] for row in asyncio.run(runner.arun())["prices"]] == [4]
+
+
+def test_stateful_steps_cannot_run_in_processes():
+    definition = incremental()
+    definition["pipeline"][0]["executor"] = "process"
+    with pytest.raises(ValueError, match="keeps state"):
+        PipelineRunner(definition)
+
+
+def test_delta_requires_a_single_dependency():
+    with pytest.raises(ValueError, match="single step"):
+        PipelineRunner({"pipeline": [{"id": "collect", "operator": "Collect", "delta": "ts"}]})
+
+
+class StreamedPrices:
+    def __init__(self): pass
+
+    def fetch(self, state):
+        for row in HISTORY[:Prices.available]:
+            if state.watermark is None or row["ts"] > state.watermark:
+                state.watermark = row["ts"]
+                yield [row]
+
+
+def test_streaming_datasource_receives_state(monkeypatch):
+    monkeypatch.setitem(DATASOURCE_REGISTRY, "StreamedPrices", StreamedPrices)
+    runner = PipelineRunner({
+        "execution": {"streaming": True},
+        "pipeline": [{"id": "prices", "datasource": "StreamedPrices", "state": True}],
+    })
+
+    assert len(runner.run()["prices"]) == 3
+    Prices.available = 4
+    assert runner.run()["prices"] == [[HISTORY[3]]]
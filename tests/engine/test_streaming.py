@@ -0,0 +1,108 @@
+import pandas as pd
+import pytest
+from findrum.engine.streaming import combine_chunks, is_stream_source, run_stream, supports_chunks
+from findrum.engine.pipeline_runner import PipelineRunner
+from findrum.interfaces import DataSource, Operator
+from findrum.registry.registry import DATASOURCE_REGISTRY, OPERATOR_REGISTRY
+
+
+class ChunkedSource(DataSource):
+    def __init__(self, chunks=3, size=2):
+        self.chunks = chunks
+        self.size = size
+        self.finished = False
+
+    def fetch(self):
+        for i in range(self.chunks):
+            yield pd.DataFrame({"value": range(i * self.size, (i + 1) * self.size)})
+        self.finished = True
+
+
+class Double(Operator):
+    chunked = True
+
+    def run(self, input_data):
+        return input_data * 2
+
+
+class Total(Operator):
+    def run(self, input_data):
+        return int(input_data["value"].sum())
+
+
+@pytest.fixture
+def streaming_pipeline(monkeypatch):
+    monkeypatch.setitem(DATASOURCE_REGISTRY, "ChunkedSource", ChunkedSource)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Double", Double)
+    monkeypatch.setitem(OPERATOR_REGISTRY, "Total", Total)
+    return {
+        "execution": {"streaming": True, "queue_size": 1},
+        "pipeline": [
+            {"id": "load", "datasource": "ChunkedSource"},
+            {"id": "double", "operator": "Double", "depends_on": "load"},
+            {"id": "total", "operator": "Total", "depends_on": "double"},
+        ]
+    }
+
+
+def test_stream_detection():
+    assert is_stream_source(ChunkedSource)
+    assert supports_chunks(Double)
+    assert not supports_chunks(Total)
+
+
+def test_combine_chunks():
+    frames = [pd.DataFrame({"a": [1]}), pd.DataFrame({"a": [2]})]
+    assert combine_chunks(frames)["a"].tolist() == [1, 2]
+    assert combine_chunks([1, 2]) == [1, 2]
+
+
+def test_run_stream_applies_stages_and_drops_none():
+    result = run_stream(range(6), [lambda x: x * 10, lambda x: x if x % 20 == 0 else None], queue_size=1)
+    assert result == [0, 20, 40]
+
+
+def test_run_stream_applies_backpressure():
+    produced = []
+    seen_while_producing = []
+
+    def source():
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    def stage(chunk):
+        seen_while_producing.append(len(produced) - chunk)
+        return chunk
+
+    assert run_stream(source(), [stage], queue_size=1) == list(range(10))
+    assert max(seen_while_producing) <= 3
+
+
+def test_run_stream_propagates_errors():
+    def fail(chunk):
+        raise RuntimeError("bad chunk")
+
+    with pytest.raises(RuntimeError, match="bad chunk"):
+        run_stream(range(100), [fail], queue_size=1)
+
+
+def test_streaming_pipeline_materializes_only_segment_output(streaming_pipeline):
+    results = PipelineRunner(streaming_pipeline).run()
+
+    assert "load" not in results
+    assert results["double"]["value"].tolist() == [0, 2, 4, 6, 8, 10]
+    assert results["total"] == 30
+
+
+def test_streaming_pipeline_in_dag_mode(streaming_pipeline):
+    streaming_pipeline["execution"]["mode"] = "dag"
+    results = PipelineRunner(streaming_pipeline).run()
+    assert results["total"] == 30
+
+
+def test_streaming_disabled_passes_generator_through(streaming_pipeline):
+    streaming_pipeline["execution"]["streaming"] = False
+    streaming_pipeline["pipeline"] = streaming_pipeline["pipeline"][:1]
+    results = PipelineRunner(streaming_pipeline).run()
+    assert not isinstance(results["load"], pd.DataFrame)
@@ -23,7 +23,7 @@ class DummyTrigger(EventTrigger):
     def start(self):
         pass
 
-@patch("findrum.interfaces.event_trigger.PipelineRunner")
+@patch("findrum.engine.pipeline_runner.PipelineRunner")
 def test_event_trigger_run_pipeline(mock_runner_class, tmp_path):
     dummy_yaml = tmp_path / "dummy.yaml"
     dummy_yaml.write_text(yaml.dump({"pipeline": []}))
@@ -23,7 +23,7 @@ class DummyScheduler(Scheduler):
     def register(self, scheduler):
         pass
 
-@patch("findrum.interfaces.scheduler.PipelineRunner")
+@patch("findrum.engine.pipeline_runner.PipelineRunner")
 def test_scheduler_run_pipeline(mock_runner_class, tmp_path):
     dummy_yaml = tmp_path / "dummy.yaml"
     dummy_yaml.write_text(yaml.dump({"pipeline": []}))
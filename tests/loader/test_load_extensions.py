@@ -1,3 +1,4 @@
+import pytest
 import sys
 import types
 import tempfile
@@ -42,3 +43,54 @@ def test_load_extensions_success():
     assert registry.OPERATOR_REGISTRY["DummyOperator"] is DummyOperator
     assert registry.SCHEDULER_REGISTRY["DummyScheduler"] is DummyScheduler
     assert registry.EVENT_TRIGGER_REGISTRY["DummyTrigger"] is DummyTrigger
+
+@pytest.fixture
+def lazy_package(tmp_path, monkeypatch):
+    package = tmp_path / "lazy_ext"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "ops.py").write_text("class UsedOperator:\n    pass\n")
+    (package / "heavy.py").write_text("class UnusedOperator:\n    pass\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package
+    for name in ("lazy_ext", "lazy_ext.ops", "lazy_ext.heavy"):
+        sys.modules.pop(name, None)
+
+
+def write_config(tmp_path, config):
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.dump(config))
+    return str(path)
+
+
+def test_lazy_load_imports_on_first_lookup(tmp_path, lazy_package):
+    config = write_config(tmp_path, {"operators": ["lazy_ext.ops.UsedOperator", "lazy_ext.heavy.UnusedOperator"]})
+
+    load_extensions(config, lazy=True)
+
+    assert "lazy_ext.ops" not in sys.modules
+    assert isinstance(registry.OPERATOR_REGISTRY["UsedOperator"], registry.LazyExtension)
+
+    cls = registry.get_operator("UsedOperator")
+    assert cls.__module__ == "lazy_ext.ops"
+    assert registry.OPERATOR_REGISTRY["UsedOperator"] is cls
+    assert "lazy_ext.heavy" not in sys.modules
+
+
+def test_preload_imports_only_referenced_classes(tmp_path, lazy_package):
+    config = write_config(tmp_path, {"operators": ["lazy_ext.ops.UsedOperator", "lazy_ext.heavy.UnusedOperator"]})
+    pipeline = tmp_path / "pipeline.yaml"
+    pipeline.write_text(yaml.dump({"pipeline": [{"id": "a", "operator": "UsedOperator"}, {"id": "b", "operator": "Missing"}]}))
+
+    load_extensions(config, lazy=True, preload=[str(pipeline)])
+
+    assert "lazy_ext.ops" in sys.modules
+    assert "lazy_ext.heavy" not in sys.modules
+    assert not isinstance(registry.OPERATOR_REGISTRY["UsedOperator"], registry.LazyExtension)
+
+
+def test_lazy_import_errors_surface_on_lookup(tmp_path):
+    load_extensions(write_config(tmp_path, {"operators": ["no_such_module.Operator"]}), lazy=True)
+
+    with pytest.raises(ImportError):
+        registry.get_operator("Operator")
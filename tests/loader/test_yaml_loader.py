@@ -0,0 +1,95 @@
+import os
+import time
+import pytest
+import yaml
+from unittest.mock import patch
+
+from findrum.engine.plan import clear_plan_cache, get_plan
+from findrum.loader import yaml_loader
+from findrum.loader.yaml_loader import cache_dir, load_yaml, parse_yaml
+
+CONTENT = b"pipeline:\n  - id: step\n    operator: Const\n    params: {value: 2}\n"
+
+
+def test_parse_yaml_caches_parsed_configs(config_cache_dir):
+    assert parse_yaml(CONTENT) == yaml.safe_load(CONTENT)
+    assert len(os.listdir(config_cache_dir)) == 1
+
+    expected = yaml.safe_load(CONTENT)
+    with patch("yaml.load") as load:
+        assert parse_yaml(CONTENT) == expected
+    load.assert_not_called()
+
+
+def test_changed_content_is_parsed_again(config_cache_dir):
+    parse_yaml(CONTENT)
+    assert parse_yaml(CONTENT.replace(b"2", b"3"))["pipeline"][0]["params"] == {"value": 3}
+    assert len(os.listdir(config_cache_dir)) == 2
+
+
+def test_corrupt_entries_are_ignored(config_cache_dir):
+    parse_yaml(CONTENT)
+    [entry] = os.listdir(config_cache_dir)
+    (config_cache_dir / entry).write_bytes(b"not a pickle")
+
+    assert parse_yaml(CONTENT) == yaml.safe_load(CONTENT)
+
+
+@pytest.mark.parametrize("value", ["", "off"])
+def test_cache_can_be_disabled(monkeypatch, value):
+    monkeypatch.setenv("FINDRUM_CONFIG_CACHE", value)
+    assert cache_dir() is None
+    assert parse_yaml(CONTENT) == yaml.safe_load(CONTENT)
+
+
+def test_unwritable_cache_is_ignored(tmp_path, monkeypatch):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    monkeypatch.setenv("FINDRUM_CONFIG_CACHE", str(blocker / "cache"))
+    assert parse_yaml(CONTENT) == yaml.safe_load(CONTENT)
+
+
+def test_falls_back_to_the_python_loader(monkeypatch, config_cache_dir):
+    monkeypatch.setattr(yaml_loader, "SafeLoader", yaml.SafeLoader)
+    assert parse_yaml(CONTENT) == yaml.safe_load(CONTENT)
+
+
+def test_plans_and_files_use_the_cache(tmp_path, config_cache_dir):
+    path = tmp_path / "pipeline.yaml"
+    path.write_bytes(CONTENT)
+    assert load_yaml(str(path)) == yaml.safe_load(CONTENT)
+
+    with patch("yaml.load") as load:
+        assert get_plan(str(path)).steps[0]["id"] == "step"
+    load.assert_not_called()
+    clear_plan_cache()
+
+
+def test_cache_dir_is_private(config_cache_dir):
+    parse_yaml(CONTENT)
+    assert os.stat(config_cache_dir).st_mode & 0o777 == 0o700
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_shared_cache_dir_is_not_used(config_cache_dir, caplog):
+    config_cache_dir.mkdir()
+    os.chmod(config_cache_dir, 0o777)
+
+    assert parse_yaml(CONTENT) == yaml.safe_load(CONTENT)
+    assert os.listdir(config_cache_dir) == []
+    assert "writable by others" in caplog.text
+
+
+def test_stale_entries_are_pruned(config_cache_dir, monkeypatch):
+    monkeypatch.setattr(yaml_loader, "MAX_CACHE_ENTRIES", 2)
+    parse_yaml(CONTENT)
+    [stale] = os.listdir(config_cache_dir)
+    old = time.time() - yaml_loader.MAX_CACHE_AGE - 1
+    os.utime(config_cache_dir / stale, (old, old))
+
+    parse_yaml(CONTENT.replace(b"2", b"3"))
+    assert stale not in os.listdir(config_cache_dir)
+
+    for value in (b"4", b"5", b"6"):
+        parse_yaml(CONTENT.replace(b"2", value))
+    assert len(os.listdir(config_cache_dir)) == 2
@@ -0,0 +1,149 @@
+import sys
+import types
+import threading
+import pytest
+import yaml
+from findrum.engine.pipeline_runner import PipelineRunner
+from findrum.loader.load_extensions import load_extensions
+from findrum.registry import registry
+from findrum.registry.resources import ResourcePool
+
+
+class Connection:
+    opened = 0
+
+    def __init__(self, dsn="db"):
+        Connection.opened += 1
+        self.dsn = dsn
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+resource_module = types.ModuleType("resource_module")
+resource_module.Connection = Connection
+sys.modules["resource_module"] = resource_module
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    Connection.opened = 0
+    yield
+    registry.close_resources()
+
+
+def test_pool_reuses_idle_resources():
+    pool = ResourcePool("db", Connection, max_size=2)
+    with pool.acquire() as first:
+        pass
+    with pool.acquire() as second:
+        assert second is first
+        assert pool.in_use == 1
+    assert pool.size == 1 and pool.in_use == 0
+
+
+def test_pool_waits_for_a_free_resource():
+    pool = ResourcePool("db", Connection, max_size=1, timeout=0.05)
+    with pool.acquire():
+        with pytest.raises(TimeoutError, match="Timed out waiting for resource 'db'"):
+            with pool.acquire():
+                pass
+
+        release = threading.Event()
+
+        def borrow():
+            with pool.acquire(timeout=1):
+                release.set()
+
+        thread = threading.Thread(target=borrow)
+        thread.start()
+    thread.join()
+    assert release.is_set() and Connection.opened == 1
+
+
+def test_shared_resource_is_handed_to_everyone():
+    pool = ResourcePool("session", Connection, shared=True)
+    with pool.acquire() as a, pool.acquire() as b:
+        assert a is b
+    pool.close()
+    assert a.closed
+
+
+def test_close_closes_idle_and_released_resources():
+    pool = ResourcePool("db", Connection, max_size=2)
+    with pool.acquire() as busy:
+        with pool.acquire() as idle:
+            pass
+        pool.close()
+        assert idle.closed and not busy.closed
+    assert busy.closed
+
+    with pytest.raises(RuntimeError, match="closed"):
+        with pool.acquire():
+            pass
+
+
+def test_factory_errors_free_the_slot():
+    def broken():
+        raise ConnectionError("down")
+
+    pool = ResourcePool("db", broken, max_size=1)
+    with pytest.raises(ConnectionError):
+        with pool.acquire():
+            pass
+    assert pool.size == 0
+
+
+def test_load_extensions_registers_resources(tmp_path):
+    config = tmp_path / "config.yaml"
+    config.write_text(yaml.dump({
+        "resources": {"prices_db": {"class": "resource_module.Connection", "max_size": 3, "config": {"dsn": "prices"}}}
+    }))
+
+    load_extensions(str(config))
+    pool = registry.get_resource("prices_db")
+    assert pool.max_size == 3
+    with pool.acquire() as connection:
+        assert connection.dsn == "prices"
+
+    load_extensions(str(config))
+    assert registry.get_resource("prices_db") is not pool
+    assert connection.closed
+
+
+def test_get_resource_failure():
+    with pytest.raises(ValueError, match="Resource 'missing' not found in registry."):
+        registry.get_resource("missing")
+
+
+class PricesSource:
+    def __init__(self, db, table):
+        self.db = db
+        self.table = table
+
+    def fetch(self):
+        with self.db.acquire() as connection:
+            return f"{connection.dsn}.{self.table}"
+
+
+def test_resources_are_injected_into_steps(monkeypatch):
+    monkeypatch.setitem(registry.DATASOURCE_REGISTRY, "PricesSource", PricesSource)
+    registry.RESOURCE_REGISTRY["prices_db"] = ResourcePool("prices_db", Connection, config={"dsn": "prices"})
+
+    runner = PipelineRunner({
+        "pipeline": [
+            {"id": "a", "datasource": "PricesSource", "params": {"table": "eod"}, "resources": {"db": "prices_db"}},
+            {"id": "b", "datasource": "PricesSource", "params": {"table": "intraday"}, "resources": {"db": "prices_db"}},
+        ]
+    })
+
+    assert runner.run() == {"a": "prices.eod", "b": "prices.intraday"}
+    assert Connection.opened == 1
+
+
+def test_resources_cannot_be_sent_to_processes():
+    with pytest.raises(ValueError, match="uses shared resources"):
+        PipelineRunner({"pipeline": [
+            {"id": "a", "datasource": "PricesSource", "resources": {"db": "prices_db"}, "executor": "process"},
+        ]})
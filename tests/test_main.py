@@ -3,7 +3,7 @@ import sys
 from unittest.mock import patch, MagicMock
 import findrum.__main__ as main_module
 
-@patch("findrum.__main__.Platform")
+@patch("findrum.engine.platform.Platform")
 def test_main_execution(mock_platform_class):
     test_args = ["prog", "pipeline.yaml", "--config=config.yaml", "--verbose"]
 
@@ -15,4 +15,54 @@ def test_main_execution(mock_platform_class):
 
         mock_platform_class.assert_called_once_with("config.yaml")
         mock_platform.register_pipeline.assert_called_once_with("pipeline.yaml")
-        mock_platform.start.assert_called_once()
\ No newline at end of file
+        mock_platform.start.assert_called_once()
+
+@patch("findrum.engine.platform.Platform")
+def test_main_shuts_down_without_jobs(mock_platform_class):
+    mock_platform = mock_platform_class.return_value
+    mock_platform.has_jobs.return_value = False
+
+    with patch.object(sys, "argv", ["prog", "pipeline.yaml"]):
+        main_module.main()
+
+    mock_platform.start.assert_not_called()
+    mock_platform.shutdown.assert_called_once_with()
+
+def test_profile_startup(tmp_path, capsys):
+    pipeline = tmp_path / "pipeline.yaml"
+    pipeline.write_text("pipeline: []\n")
+    config = tmp_path / "config.yaml"
+    config.write_text("{}\n")
+
+    with patch.object(sys, "argv", ["prog", str(pipeline), f"--config={config}", "--profile-startup"]), \
+            patch("findrum.engine.platform.Platform") as mock_platform_class:
+        main_module.main()
+
+    output = capsys.readouterr().out
+    assert output.startswith("Startup imports:")
+    assert "findrum.engine.platform" in output
+    mock_platform_class.assert_not_called()
+
+
+def test_profile_startup_imports_the_scheduler_of_scheduled_pipelines(tmp_path):
+    from findrum.startup import profile_startup
+
+    config = tmp_path / "config.yaml"
+    config.write_text("{}\n")
+    unscheduled = tmp_path / "unscheduled.yaml"
+    unscheduled.write_text("pipeline: []\n")
+    scheduled = tmp_path / "scheduled.yaml"
+    scheduled.write_text("scheduler:\n  type: Interval\npipeline: []\n")
+
+    def imports_apscheduler(path):
+        return any(name.startswith("apscheduler") for name, _, _ in profile_startup(str(path), str(config)))
+
+    assert not imports_apscheduler(unscheduled)
+    assert imports_apscheduler(scheduled)
+
+
+def test_interfaces_do_not_import_the_engine():
+    import subprocess
+
+    code = "import sys, findrum.interfaces; print('findrum.engine.pipeline_runner' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], capture_output=True, text=True).stdout.strip() == "False"